@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The common utilities of the benchmarks."""
+
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import graviti
+from benchmarks.mock_server import ACCESS_KEY
+from graviti import Workspace
+from graviti.openapi import get_current_workspace
+from graviti.portex import STANDARD_URL
+
+_STANDARD_FILES = {
+    "ROOT.yaml": "---\nname: standard\n",
+    "file/File.yaml": """---
+type: template
+declaration:
+  type: record
+  fields:
+    - name: key
+      type: string
+    - name: extension
+      type: string
+    - name: size
+      type: int64
+""",
+    "file/Image.yaml": """---
+type: template
+declaration:
+  type: record
+  fields:
+    - name: key
+      type: string
+    - name: extension
+      type: string
+    - name: size
+      type: int64
+    - name: height
+      type: int32
+    - name: width
+      type: int32
+""",
+}
+
+
+def connect(url: str) -> Workspace:
+    """Connect to the mock server.
+
+    :class:`~graviti.manager.workspace.Workspace` only accepts "https://" urls, the mock server
+    serves plain http on localhost, so the instance is initialized here without the url check.
+
+    Arguments:
+        url: The base url of the mock server.
+
+    Returns:
+        The workspace of the mock server.
+
+    """
+    workspace: Workspace = object.__new__(Workspace)
+    workspace.access_key = ACCESS_KEY
+    workspace.url = url
+
+    response = get_current_workspace(ACCESS_KEY, url)
+    workspace._id = response["id"]  # pylint: disable=protected-access
+    workspace.type = response["type"]
+    workspace.name = response["name"]
+    workspace.alias = response["alias"]
+    workspace.description = response["description"]
+    workspace.email = response["email"]
+    return workspace
+
+
+def use_offline_standard_package(directory: Path) -> bool:
+    """Provide an offline stand-in of the portex standard package for the file types.
+
+    The file types are defined in the standard package which is cloned from GitHub. To keep the
+    benchmarks offline, the temp directory of this process is redirected to ``directory`` and a
+    minimal package with "file.File" and "file.Image" is committed at the cache path, so the
+    user's real package cache is never touched.
+
+    Arguments:
+        directory: The directory to hold the stand-in package.
+
+    Returns:
+        Whether the stand-in package is available.
+
+    """
+    tempfile.tempdir = str(directory)
+
+    md5_instance = md5()
+    md5_instance.update(STANDARD_URL.encode("utf-8"))
+    md5_instance.update(b"main")
+    path = directory / "portex" / md5_instance.hexdigest()
+    if path.exists():
+        return True
+
+    for name, content in _STANDARD_FILES.items():
+        file_path = path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding="utf-8")
+
+    git = ["git", "-c", "user.name=benchmark", "-c", "user.email=benchmark@localhost"]
+    try:
+        for args in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "standard"]):
+            subprocess.run([*git, *args], cwd=path, check=True, stdout=subprocess.PIPE)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+    return True
+
+
+def get_environment() -> Dict[str, Any]:
+    """Get the environment information attached to the benchmark results.
+
+    Returns:
+        The versions of the python, the SDK and the platform.
+
+    """
+    return {
+        "python": sys.version.split()[0],
+        "graviti": graviti.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+@contextmanager
+def measure(result: Dict[str, Any], trace_memory: bool = False) -> Iterator[None]:
+    """Measure the wall time, the CPU time and optionally the peak memory of the context.
+
+    Arguments:
+        result: The dict to put the measurement into.
+        trace_memory: Whether to trace the peak memory with :mod:`tracemalloc`.
+
+    Yields:
+        None.
+
+    """
+    if trace_memory:
+        tracemalloc.start()
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        result["wall"] = time.perf_counter() - wall
+        result["cpu"] = time.process_time() - cpu
+        if trace_memory:
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+
+def repeat(func: Callable[[], Dict[str, Any]], times: int) -> Dict[str, Any]:
+    """Run the benchmark case several times and keep the run with the median wall time.
+
+    Arguments:
+        func: The benchmark case which returns its measurement.
+        times: The repeat times.
+
+    Returns:
+        The measurement of the median run, with the wall times of all the runs.
+
+    """
+    runs: List[Dict[str, Any]] = sorted(
+        (func() for _ in range(times)), key=lambda x: float(x["wall"])
+    )
+    result = runs[len(runs) // 2]
+    result["runs"] = [run["wall"] for run in runs]
+    return result
+
+
+def dump_results(results: Dict[str, Any], output: Optional[str]) -> None:
+    """Dump the benchmark results as JSON.
+
+    Arguments:
+        results: The benchmark results.
+        output: The path of the output file, ``None`` means printing to stdout.
+
+    """
+    content = json.dumps(results, indent=2, default=str)
+    if output is None:
+        print(content)
+    else:
+        Path(output).write_text(content + "\n", encoding="utf-8")
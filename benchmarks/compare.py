@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""Compare two benchmark results.
+
+Usage::
+
+    python -m benchmarks.compare before.json after.json --threshold 0.1
+
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_METRICS = ("wall", "cpu", "peak_memory")
+
+
+def _load(path: str) -> Dict[str, Dict[str, Any]]:
+    cases: Dict[str, Dict[str, Any]] = json.loads(Path(path).read_text(encoding="utf-8"))["cases"]
+    return {name: case for name, case in cases.items() if "skipped" not in case}
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Print the ratio of each metric of the cases in both results.
+
+    Arguments:
+        args: The command line arguments.
+
+    Returns:
+        1 if any case is slower than the threshold, otherwise 0.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("before", help="the JSON result of the baseline")
+    parser.add_argument("after", help="the JSON result to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="the wall time ratio reported as regression"
+    )
+    options = parser.parse_args(args)
+
+    before, after = _load(options.before), _load(options.after)
+    regressed = False
+    print(f"{'case':<48}" + "".join(f"{metric:>14}" for metric in _METRICS))
+    for name in (name for name in before if name in after):
+        ratios = []
+        for metric in _METRICS:
+            old, new = before[name].get(metric), after[name].get(metric)
+            ratios.append(new / old if old and new is not None else None)
+
+        mark = ""
+        if ratios[0] is not None and ratios[0] > 1 + options.threshold:
+            regressed = True
+            mark = "  <- slower"
+        print(
+            f"{name:<48}"
+            + "".join(f"{ratio:>14.3f}" if ratio else f"{'-':>14}" for ratio in ratios)
+            + mark
+        )
+
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
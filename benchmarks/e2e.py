@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The end-to-end benchmarks of the SDK against the local mock server.
+
+Usage::
+
+    python -m benchmarks.e2e --rows 100000 --latency 0.02 --output result.json
+
+Every case runs the public SDK API against :class:`~benchmarks.mock_server.MockGravitiServer`
+and reports the wall time, the CPU time, the requests received by the server and the request
+metrics recorded by :data:`graviti.metrics`.
+
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional
+
+import graviti
+import graviti.portex as pt
+from benchmarks.common import (
+    connect,
+    dump_results,
+    get_environment,
+    measure,
+    repeat,
+    use_offline_standard_package,
+)
+from benchmarks.mock_server import MockGravitiServer
+from graviti import DataFrame
+from graviti.file import File
+from graviti.portex import STANDARD_URL
+
+_SCHEMA = pt.record(
+    {
+        "filename": pt.string(),
+        "x": pt.int32(),
+        "y": pt.float32(),
+        "box2d": pt.record(
+            {
+                "xmin": pt.float32(),
+                "ymin": pt.float32(),
+                "xmax": pt.float32(),
+                "ymax": pt.float32(),
+            }
+        ),
+        "tags": pt.array(pt.int32()),
+    }
+)
+
+
+def _generate_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "filename": f"{i:08d}.jpg",
+            "x": i,
+            "y": i / 2,
+            "box2d": {"xmin": 1.0, "ymin": 2.0, "xmax": 3.0, "ymax": 4.0},
+            "tags": [i % 3, i % 5],
+        }
+        for i in range(count)
+    ]
+
+
+class Suite:  # pylint: disable=too-many-instance-attributes
+    """The end-to-end benchmark suite.
+
+    Arguments:
+        server: The running mock server.
+        rows: The number of the records of the structured data cases.
+        files: The number of the files of the binary file cases.
+        file_size: The size of each file in bytes.
+        workdir: The directory for the local files.
+        with_files: Whether the file types are available.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        server: MockGravitiServer,
+        rows: int,
+        files: int,
+        file_size: int,
+        workdir: Path,
+        with_files: bool,
+    ) -> None:
+        self._server = server
+        self._rows = rows
+        self._files = files
+        self._file_size = file_size
+        self._workdir = workdir
+        self._with_files = with_files
+        self._workspace = connect(server.url)
+        self._count = 0
+
+        seeded = server.create_dataset("seeded")
+        server.commit(seeded, {"train": (_SCHEMA.to_yaml(), _generate_rows(rows))})
+
+        if with_files:
+            std = pt.build_package(STANDARD_URL, "main")
+            self._file_schema = pt.record({"filename": pt.string(), "file": std.file.File()})
+            file_records = []
+            for i in range(files):
+                key = f"objects/{i:08d}"
+                server.put_object(seeded, key, os.urandom(file_size))
+                file_records.append(
+                    {
+                        "filename": f"{i:08d}.bin",
+                        "file": {"key": key, "extension": ".bin", "size": file_size},
+                    }
+                )
+            server.commit(seeded, {"files": (self._file_schema.to_yaml(), file_records)})
+
+    def _run(self, func: Callable[[], Any]) -> Dict[str, Any]:
+        graviti.metrics.reset()
+        self._server.reset_request_counts()
+        result: Dict[str, Any] = {}
+        with measure(result):
+            func()
+
+        result["server_requests"] = self._server.get_request_counts()
+        result["metrics"] = {
+            endpoint: {name: metric["count"] for name, metric in names.items()}
+            for endpoint, names in graviti.metrics.snapshot().items()
+        }
+        return result
+
+    def _get_seeded(self, sheet: str) -> DataFrame:
+        return self._workspace.datasets.get("seeded")[sheet]
+
+    def scan(self) -> Dict[str, Any]:
+        """Scan all the records of a sheet page by page.
+
+        Returns:
+            The measurement of the case.
+
+        """
+        return self._run(lambda: self._get_seeded("train").to_pylist())
+
+    def scan_column(self) -> Dict[str, Any]:
+        """Scan one column of a sheet.
+
+        Returns:
+            The measurement of the case.
+
+        """
+        return self._run(
+            lambda: self._get_seeded("train")["x"].to_pylist()  # pylint: disable=unnecessary-lambda
+        )
+
+    def upload(self) -> Dict[str, Any]:
+        """Create a dataset and commit the records.
+
+        Returns:
+            The measurement of the case.
+
+        """
+        rows = _generate_rows(self._rows)
+
+        def _upload() -> None:
+            self._count += 1
+            dataset = self._workspace.datasets.create(f"upload-{self._count}")
+            dataset["train"] = DataFrame(rows, _SCHEMA)
+            dataset.commit("upload", quiet=True)
+
+        return self._run(_upload)
+
+    def search(self) -> Dict[str, Any]:
+        """Search the records of a sheet and get all the results.
+
+        Returns:
+            The measurement of the case.
+
+        """
+
+        def _search() -> None:
+            df = self._get_seeded("train")
+            with graviti.engine.online():
+                df.query(lambda x: x["x"] >= self._rows // 2).to_pylist()
+
+        return self._run(_search)
+
+    def upload_files(self) -> Dict[str, Any]:
+        """Create a dataset and commit the local files.
+
+        Returns:
+            The measurement of the case.
+
+        """
+        paths = []
+        for i in range(self._files):
+            path = self._workdir / f"{i:08d}.bin"
+            if not path.exists():
+                path.write_bytes(os.urandom(self._file_size))
+            paths.append(path)
+
+        def _upload() -> None:
+            self._count += 1
+            dataset = self._workspace.datasets.create(f"upload-files-{self._count}")
+            rows = [{"filename": path.name, "file": File(str(path))} for path in paths]
+            dataset["files"] = DataFrame(rows, self._file_schema)
+            dataset.commit("upload files", quiet=True)
+
+        return self._run(_upload)
+
+    def download_files(self) -> Dict[str, Any]:
+        """Read the content of all the remote files of a sheet.
+
+        Returns:
+            The measurement of the case.
+
+        """
+
+        def _download() -> None:
+            for remote_file in self._get_seeded("files")["file"].to_pylist():
+                with remote_file.open() as fp:
+                    fp.read()
+
+        return self._run(_download)
+
+    def run(self, cases: List[str], times: int) -> Dict[str, Any]:
+        """Run the given benchmark cases.
+
+        Arguments:
+            cases: The names of the cases.
+            times: The repeat times of each case.
+
+        Returns:
+            The measurements of the cases.
+
+        """
+        results: Dict[str, Any] = {}
+        for case in cases:
+            if case in _FILE_CASES and not self._with_files:
+                results[case] = {"skipped": "the portex standard package is not available"}
+                continue
+
+            results[case] = repeat(getattr(self, case), times)
+        return results
+
+
+_CASES = ("scan", "scan_column", "upload", "search", "upload_files", "download_files")
+_FILE_CASES = ("upload_files", "download_files")
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the end-to-end benchmarks.
+
+    Arguments:
+        args: The command line arguments.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--rows", type=int, default=10000, help="records of the data cases")
+    parser.add_argument("--files", type=int, default=100, help="files of the file cases")
+    parser.add_argument("--file-size", type=int, default=64 * 1024, help="bytes of each file")
+    parser.add_argument("--times", type=int, default=3, help="repeat times of each case")
+    parser.add_argument("--latency", type=float, default=0.0, help="OpenAPI latency in seconds")
+    parser.add_argument(
+        "--storage-latency", type=float, default=0.0, help="object storage latency in seconds"
+    )
+    parser.add_argument("--bandwidth", type=float, help="bytes per second of object transfer")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability of 503")
+    parser.add_argument("--retry-after", type=float, help="'Retry-After' seconds of the 503")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of failure injection")
+    parser.add_argument("--cases", nargs="+", choices=_CASES, default=list(_CASES))
+    parser.add_argument("--output", help="the JSON output file, default to stdout")
+    options = parser.parse_args(args)
+
+    logging.getLogger("graviti.manager.dataset").setLevel(logging.WARNING)
+    graviti.metrics.enable()
+
+    with TemporaryDirectory() as tempdir, MockGravitiServer(
+        seed=options.seed,
+        latency=options.latency,
+        storage_latency=options.storage_latency,
+        bandwidth=options.bandwidth,
+        failure_rate=options.failure_rate,
+        retry_after=options.retry_after,
+    ) as server:
+        workdir = Path(tempdir)
+        with_files = use_offline_standard_package(workdir)
+        suite = Suite(server, options.rows, options.files, options.file_size, workdir, with_files)
+        results = {
+            "environment": get_environment(),
+            "options": vars(options),
+            "cases": suite.run(options.cases, options.times),
+        }
+
+    dump_results(results, options.output)
+
+
+if __name__ == "__main__":
+    main()
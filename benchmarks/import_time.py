@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The import time benchmark of the SDK.
+
+Usage::
+
+    python -m benchmarks.import_time --times 10 --output import.json
+
+Every case runs in a fresh interpreter, the result reports the median wall time of ``--times``
+runs and the heavy modules loaded by the case. The exit code is 1 when any case exceeds its
+budget or loads a heavy module which it should not load.
+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.common import dump_results, get_environment
+
+_HEAVY_MODULES = ("pandas", "pyarrow", "requests", "tqdm", "urllib3", "yaml")
+
+# The statement, the budget in seconds and the heavy modules which must not be loaded.
+_CASES: Dict[str, Tuple[str, float, Tuple[str, ...]]] = {
+    "import": ("import graviti", 0.02, _HEAVY_MODULES),
+    "portex": ("import graviti.portex", 0.3, ("pandas", "requests", "tqdm", "urllib3")),
+    "dataframe": ("from graviti import DataFrame", 0.5, ("pandas", "tqdm")),
+    "workspace": ("from graviti import Workspace", 0.5, ("pandas", "tqdm")),
+}
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+wall = time.perf_counter() - start
+print(json.dumps({{"wall": wall, "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _run_once(statement: str) -> Dict[str, Any]:
+    script = _SCRIPT.format(statement=statement, heavy=_HEAVY_MODULES)
+    command = [sys.executable, "-c", script]
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)  # type: ignore[no-any-return]
+
+
+def _run_case(name: str, times: int, scale: float) -> Dict[str, Any]:
+    statement, budget, forbidden = _CASES[name]
+    runs = [_run_once(statement) for _ in range(times)]
+    walls = sorted(run["wall"] for run in runs)
+    modules = runs[0]["modules"]
+
+    budget *= scale
+    wall = median(walls)
+    violations = []
+    if wall > budget:
+        violations.append(f"median {wall:.3f}s exceeds the budget {budget:.3f}s")
+
+    loaded = sorted(set(modules) & set(forbidden))
+    if loaded:
+        violations.append(f"loads {', '.join(loaded)}")
+
+    return {
+        "statement": statement,
+        "wall": wall,
+        "runs": walls,
+        "budget": budget,
+        "modules": modules,
+        "violations": violations,
+    }
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Run the import time benchmark.
+
+    Arguments:
+        args: The command line arguments.
+
+    Returns:
+        1 if any case exceeds its budget or loads a forbidden heavy module, otherwise 0.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--cases", nargs="+", choices=_CASES, default=list(_CASES))
+    parser.add_argument("--times", type=int, default=5, help="repeat times of each case")
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="the multiplier of the time budgets"
+    )
+    parser.add_argument("--output", help="the JSON output file, default to stdout")
+    options = parser.parse_args(args)
+
+    cases = {name: _run_case(name, options.times, options.budget_scale) for name in options.cases}
+    dump_results(
+        {"environment": get_environment(), "options": vars(options), "cases": cases},
+        options.output,
+    )
+
+    failed = False
+    for name, case in cases.items():
+        for violation in case["violations"]:
+            failed = True
+            print(f"{name}: {violation}", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
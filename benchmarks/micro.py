@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The micro benchmarks of the paging lists and the DataFrame hot paths.
+
+Usage::
+
+    python -m benchmarks.micro --sizes 1k 100k 1m --fixtures flat nested --output micro.json
+
+Every case is measured on every fixture (the schema shape) and every size, the result reports the
+median wall time and CPU time of ``--times`` runs, and the peak memory of one extra run traced
+by :mod:`tracemalloc`.
+
+"""
+
+import argparse
+import random
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+
+import graviti.portex as pt
+from benchmarks.common import (
+    dump_results,
+    get_environment,
+    measure,
+    repeat,
+    use_offline_standard_package,
+)
+from graviti import DataFrame
+from graviti.manager import ObjectPermissionManager
+from graviti.manager.common import LIMIT
+from graviti.paging import LazyFactory, MappedPagingList, PyArrowPagingList
+from graviti.portex import STANDARD_URL
+
+_SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+# The number of the random accesses of the indexing cases.
+_ACCESSES = 1000
+# Slicing a DataFrame is much slower than the other accesses, fewer slices keep the runs short.
+_DATAFRAME_SLICES = 100
+
+# The files of the "file_heavy" fixture are never opened, so no real permission is needed.
+_PERMISSION = ObjectPermissionManager(None)  # type: ignore[arg-type]
+
+_Case = Callable[["Fixture"], Callable[[], Any]]
+
+
+def _strings(size: int, prefix: str) -> pa.Array:
+    return pa.array([f"{prefix}{i:08d}" for i in range(size)], pa.string())
+
+
+def _lists(size: int, length: int, values: pa.Array) -> pa.ListArray:
+    offsets = pa.array(range(0, size * length + 1, length), pa.int32())
+    return pa.ListArray.from_arrays(offsets, values)
+
+
+def _flat(size: int) -> Tuple[pt.record, pa.StructArray]:
+    schema = pt.record(
+        {
+            "filename": pt.string(),
+            "int32": pt.int32(),
+            "int64": pt.int64(),
+            "float32": pt.float32(),
+            "float64": pt.float64(),
+            "boolean": pt.boolean(),
+        }
+    )
+    numbers = range(size)
+    array = pa.StructArray.from_arrays(
+        [
+            _strings(size, "image-"),
+            pa.array(numbers, pa.int32()),
+            pa.array(numbers, pa.int64()),
+            pa.array(numbers, pa.float32()),
+            pa.array(numbers, pa.float64()),
+            pa.array((i % 2 == 0 for i in numbers), pa.bool_()),
+        ],
+        schema.keys(),
+    )
+    return schema, array
+
+
+def _wide(size: int) -> Tuple[pt.record, pa.StructArray]:
+    names = [f"column{i:03d}" for i in range(200)]
+    schema = pt.record({name: pt.float32() for name in names})
+    column = pa.array(range(size), pa.float32())
+    return schema, pa.StructArray.from_arrays([column] * len(names), names)
+
+
+def _nested(size: int) -> Tuple[pt.record, pa.StructArray]:
+    box2d = pt.record(
+        {
+            "xmin": pt.float32(),
+            "ymin": pt.float32(),
+            "xmax": pt.float32(),
+            "ymax": pt.float32(),
+            "attributes": pt.record(
+                {"occluded": pt.boolean(), "source": pt.record({"name": pt.string()})}
+            ),
+        }
+    )
+    schema = pt.record(
+        {
+            "filename": pt.string(),
+            "box2ds": pt.array(box2d),
+            "tags": pt.array(pt.int32()),
+        }
+    )
+
+    boxes = size * 2
+    coordinate = pa.array(range(boxes), pa.float32())
+    source = pa.StructArray.from_arrays([pa.array(["manual"] * boxes)], ["name"])
+    attributes = pa.StructArray.from_arrays(
+        [pa.array((i % 3 == 0 for i in range(boxes)), pa.bool_()), source], ["occluded", "source"]
+    )
+    box_array = pa.StructArray.from_arrays(
+        [coordinate, coordinate, coordinate, coordinate, attributes], box2d.keys()
+    )
+    array = pa.StructArray.from_arrays(
+        [
+            _strings(size, "image-"),
+            _lists(size, 2, box_array),
+            _lists(size, 3, pa.array((i % 7 for i in range(size * 3)), pa.int32())),
+        ],
+        schema.keys(),
+    )
+    return schema, array
+
+
+def _file_heavy(size: int) -> Tuple[pt.record, pa.StructArray]:
+    std = pt.build_package(STANDARD_URL, "main")
+    names = ["image", "depth", "mask", "thumbnail"]
+    schema = pt.record({"filename": pt.string(), **{name: std.file.File() for name in names}})
+
+    columns = [_strings(size, "image-")]
+    sizes = pa.array(range(size), pa.int64())
+    for name in names:
+        columns.append(
+            pa.StructArray.from_arrays(
+                [_strings(size, f"objects/{name}-"), pa.array([".bin"] * size), sizes],
+                ["key", "extension", "size"],
+            )
+        )
+    return schema, pa.StructArray.from_arrays(columns, schema.keys())
+
+
+_FIXTURES: Dict[str, Callable[[int], Tuple[pt.record, pa.StructArray]]] = {
+    "flat": _flat,
+    "wide": _wide,
+    "nested": _nested,
+    "file_heavy": _file_heavy,
+}
+
+
+class Fixture:  # pylint: disable=too-many-instance-attributes
+    """The data of one schema shape and one size.
+
+    Arguments:
+        name: The name of the schema shape.
+        size: The number of the records.
+
+    """
+
+    def __init__(self, name: str, size: int) -> None:
+        self.name = name
+        self.size = size
+        self.schema, self.array = _FIXTURES[name](size)
+        self.patype = self.schema.to_pyarrow(_to_backend=True)
+        self.df = DataFrame._from_pyarrow(  # pylint: disable=protected-access
+            self.array, self.schema, object_permission_manager=_PERMISSION
+        )
+        self.first_column = next(iter(self.schema.keys()))
+
+        rng = random.Random(0)
+        self.indexes = [rng.randrange(size) for _ in range(_ACCESSES)]
+        self.slices = [
+            slice(start, min(start + rng.randrange(1, 4 * LIMIT), size)) for start in self.indexes
+        ]
+
+    def create_factory(self) -> LazyFactory:
+        """Create the lazy factory which pages the fixture like the OpenAPI responses.
+
+        Returns:
+            The lazy factory.
+
+        """
+        array = self.array
+        return LazyFactory(
+            self.size,
+            LIMIT,
+            lambda offset, limit: array.slice(offset, limit).to_pylist(),
+            self.patype,
+        )
+
+    def create_paging_list(self) -> PyArrowPagingList[Any]:
+        """Create the fully loaded paging list of the first column with the default page size.
+
+        Returns:
+            The paging list.
+
+        """
+        column = self.array.field(0)
+        paging_list: PyArrowPagingList[Any] = PyArrowPagingList.from_pyarrow(column.slice(0, LIMIT))
+        for offset in range(LIMIT, self.size, LIMIT):
+            paging_list.extend(PyArrowPagingList.from_pyarrow(column.slice(offset, LIMIT)))
+        return paging_list
+
+
+def _to_python(scalar: pa.Scalar) -> Any:
+    return scalar.as_py()
+
+
+def _from_pyarrow(fixture: Fixture) -> Callable[[], Any]:
+    # pylint: disable=protected-access
+    return lambda: DataFrame._from_pyarrow(
+        fixture.array, fixture.schema, object_permission_manager=_PERMISSION
+    )
+
+
+def _lazy_scan(fixture: Fixture) -> Callable[[], Any]:
+    def _run() -> None:
+        df = DataFrame._from_factory(  # pylint: disable=protected-access
+            fixture.create_factory(), fixture.schema, object_permission_manager=_PERMISSION
+        )
+        df[fixture.first_column].to_pylist()
+
+    return _run
+
+
+def _getitem(fixture: Fixture) -> Callable[[], Any]:
+    df = fixture.df
+    names = list(fixture.schema.keys())
+    return lambda: [df[name] for name in names]
+
+
+def _iloc_item(fixture: Fixture) -> Callable[[], Any]:
+    df, column, indexes = fixture.df, fixture.first_column, fixture.indexes
+    return lambda: [df.iloc[index][column] for index in indexes]
+
+
+def _iloc_slice(fixture: Fixture) -> Callable[[], Any]:
+    df, slices = fixture.df, fixture.slices[:_DATAFRAME_SLICES]
+    return lambda: [df.iloc[index] for index in slices]
+
+
+def _loc_item(fixture: Fixture) -> Callable[[], Any]:
+    df, column, indexes = fixture.df, fixture.first_column, fixture.indexes
+    return lambda: [df.loc[index][column] for index in indexes]
+
+
+def _to_pylist(fixture: Fixture) -> Callable[[], Any]:
+    return fixture.df.to_pylist
+
+
+def _get_slice(fixture: Fixture) -> Callable[[], Any]:
+    paging_list, slices = fixture.create_paging_list(), fixture.slices
+    return lambda: [paging_list.get_slice(index) for index in slices]
+
+
+def _set_slice(fixture: Fixture) -> Callable[[], Any]:
+    source, slices = fixture.create_paging_list(), fixture.slices
+
+    def _run() -> None:
+        paging_list = source.copy()
+        for index in slices:
+            paging_list.set_slice(index, source.get_slice(index))
+
+    return _run
+
+
+def _extend(fixture: Fixture) -> Callable[[], Any]:
+    source, slices = fixture.create_paging_list(), fixture.slices
+    values = [source.get_slice(index) for index in slices]
+
+    def _run() -> None:
+        paging_list = source.copy()
+        for value in values:
+            paging_list.extend(value)
+
+    return _run
+
+
+def _get_coordinate(fixture: Fixture) -> Callable[[], Any]:
+    paging_list, indexes = fixture.create_paging_list(), fixture.indexes
+    # Extending materializes the offsets, which switches "get_coordinate" to the bisect path.
+    offsets = paging_list._offsets  # pylint: disable=protected-access
+    return lambda: [offsets.get_coordinate(index) for _ in range(100) for index in indexes]
+
+
+def _mapped_copy(fixture: Fixture) -> Callable[[], Any]:
+    factory = fixture.create_factory()[fixture.first_column]
+    source = factory.create_mapped_list(_to_python)
+    for index in fixture.indexes:
+        source[index]  # pylint: disable=pointless-statement
+
+    def _copy(value: Any) -> Any:
+        return value
+
+    return lambda: MappedPagingList.copy(source, _copy, _to_python)
+
+
+_CASES: Dict[str, _Case] = {
+    "from_pyarrow": _from_pyarrow,
+    "lazy_scan": _lazy_scan,
+    "getitem": _getitem,
+    "iloc_item": _iloc_item,
+    "iloc_slice": _iloc_slice,
+    "loc_item": _loc_item,
+    "to_pylist": _to_pylist,
+    "get_slice": _get_slice,
+    "set_slice": _set_slice,
+    "extend": _extend,
+    "get_coordinate": _get_coordinate,
+    "mapped_copy": _mapped_copy,
+}
+
+
+def _run_case(case: _Case, fixture: Fixture, times: int) -> Dict[str, Any]:
+    def _measure(trace_memory: bool = False) -> Dict[str, Any]:
+        func = case(fixture)
+        result: Dict[str, Any] = {}
+        with measure(result, trace_memory):
+            func()
+        return result
+
+    result = repeat(_measure, times)
+    result["peak_memory"] = _measure(True)["peak_memory"]
+    return result
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the micro benchmarks.
+
+    Arguments:
+        args: The command line arguments.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--sizes", nargs="+", choices=_SIZES, default=["1k", "10k", "100k"])
+    parser.add_argument("--fixtures", nargs="+", choices=_FIXTURES, default=list(_FIXTURES))
+    parser.add_argument("--cases", nargs="+", choices=_CASES, default=list(_CASES))
+    parser.add_argument("--times", type=int, default=5, help="repeat times of each case")
+    parser.add_argument("--output", help="the JSON output file, default to stdout")
+    options = parser.parse_args(args)
+
+    cases: Dict[str, Any] = {}
+    with TemporaryDirectory() as tempdir:
+        with_files = use_offline_standard_package(Path(tempdir))
+        for name in options.fixtures:
+            for size_name in options.sizes:
+                key = f"{name}/{size_name}"
+                if name == "file_heavy" and not with_files:
+                    cases[key] = {"skipped": "the portex standard package is not available"}
+                    continue
+
+                fixture = Fixture(name, _SIZES[size_name])
+                for case in options.cases:
+                    cases[f"{key}/{case}"] = _run_case(_CASES[case], fixture, options.times)
+
+    dump_results(
+        {"environment": get_environment(), "options": vars(options), "cases": cases},
+        options.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1191 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The local mock server of the Graviti OpenAPI and the object storage.
+
+The server keeps all the datasets, drafts, commits, sheets, searches and objects in memory, it
+implements the OpenAPI endpoints used by :mod:`graviti.openapi` for the data, sheets, searches
+and object permissions, and an AZURE-style object storage under ``/storage``.
+
+Latency, bandwidth and failures can be injected to simulate a remote backend.
+
+"""
+
+# pylint: disable=too-many-lines
+
+import json
+import random
+import re
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+RECORD_KEY = "__record_key"
+WORKSPACE = "mock-workspace"
+ACCESS_KEY = "ACCESSKEY-mock"
+
+_CHUNK_SIZE = 64 * 1024
+
+# The same methods the SDK retries on "503", so the injected failures exercise the retries instead
+# of aborting the workload.
+_FAILURE_METHODS = ("HEAD", "OPTIONS", "POST", "PUT")
+
+_Handler = Callable[..., Tuple[int, Any]]
+
+
+class MockError(Exception):
+    """The error which is responded to the client.
+
+    Arguments:
+        status: The status code of the response.
+        code: The error code of the response.
+        message: The error message of the response.
+
+    """
+
+    def __init__(self, status: int, code: str, message: str = "") -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def _lower_keys(value: Any) -> Any:
+    # The Graviti data platform is case insensitive and responds the field names in lower case.
+    if isinstance(value, dict):
+        return {key.lower(): _lower_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_lower_keys(item) for item in value]
+    return value
+
+
+def _get_path(value: Any, path: Iterable[str]) -> Any:
+    for name in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    return (value is None, value if value is not None else 0)
+
+
+class Sheet:
+    """The sheet of a draft or a commit.
+
+    Arguments:
+        schema: The portex schema of the sheet in yaml format.
+        records: The records of the sheet, the field names are in lower case.
+
+    """
+
+    def __init__(self, schema: str, records: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.schema = schema
+        self.records: List[Dict[str, Any]] = records if records is not None else []
+        self.index: Optional[Dict[str, int]] = None
+
+    def copy(self) -> "Sheet":
+        """Copy the sheet, the records are shared until modified.
+
+        Returns:
+            The copied sheet.
+
+        """
+        return Sheet(self.schema, list(self.records))
+
+    def get_index(self) -> Dict[str, int]:
+        """Get the mapping from the record key to the position of the record.
+
+        Returns:
+            The record key index.
+
+        """
+        if self.index is None:
+            self.index = {record[RECORD_KEY]: i for i, record in enumerate(self.records)}
+        return self.index
+
+
+class Dataset:  # pylint: disable=too-many-instance-attributes
+    """The in-memory dataset of the mock server.
+
+    Arguments:
+        name: The name of the dataset.
+        alias: The alias of the dataset.
+
+    """
+
+    def __init__(self, name: str, alias: str = "") -> None:
+        self.dataset_id = uuid4().hex
+        self.name = name
+        self.alias = alias
+        self.created_at = _now()
+        self.default_branch = "main"
+        self.branches: Dict[str, Optional[str]] = {"main": None}
+        self.commits: Dict[str, Dict[str, Any]] = {}
+        self.commit_sheets: Dict[str, Dict[str, Sheet]] = {}
+        self.drafts: Dict[int, Dict[str, Any]] = {}
+        self.draft_sheets: Dict[int, Dict[str, Sheet]] = {}
+        self.searches: Dict[str, Dict[str, Any]] = {}
+
+    def to_response(self) -> Dict[str, Any]:
+        """Dump the dataset into the OpenAPI response.
+
+        Returns:
+            The OpenAPI response of the dataset.
+
+        """
+        return {
+            "id": self.dataset_id,
+            "name": self.name,
+            "alias": self.alias,
+            "workspace": WORKSPACE,
+            "default_branch": self.default_branch,
+            "commit_id": self.branches[self.default_branch],
+            "cover_url": "",
+            "creator": WORKSPACE,
+            "created_at": self.created_at,
+            "updated_at": self.created_at,
+            "is_public": False,
+            "storage_config": "mock-storage",
+            "backend_type": "AZURE",
+        }
+
+    def get_commit_response(self, commit_id: Optional[str]) -> Dict[str, Any]:
+        """Get the OpenAPI response of the given commit.
+
+        Arguments:
+            commit_id: The commit id, ``None`` for the branch without commit history.
+
+        Returns:
+            The OpenAPI response of the commit.
+
+        """
+        if commit_id is None:
+            return {
+                "commit_id": None,
+                "parent_commit_id": None,
+                "title": "",
+                "description": "",
+                "committer": "",
+                "committed_at": "",
+            }
+        return dict(self.commits[commit_id])
+
+    def commit(
+        self,
+        sheets: Dict[str, Sheet],
+        title: str,
+        description: str = "",
+        branch: str = "main",
+    ) -> Dict[str, Any]:
+        """Create a commit on the given branch.
+
+        Arguments:
+            sheets: The sheets of the commit.
+            title: The commit title.
+            description: The commit description.
+            branch: The branch to commit to.
+
+        Returns:
+            The OpenAPI response of the commit.
+
+        """
+        commit_id = uuid4().hex
+        self.commits[commit_id] = {
+            "commit_id": commit_id,
+            "parent_commit_id": self.branches.get(branch),
+            "title": title,
+            "description": description,
+            "committer": WORKSPACE,
+            "committed_at": _now(),
+        }
+        self.commit_sheets[commit_id] = sheets
+        self.branches[branch] = commit_id
+        return dict(self.commits[commit_id])
+
+
+class CriteriaEvaluator:  # pylint: disable=too-few-public-methods
+    """The evaluator of the search criteria produced by :mod:`graviti.dataframe.sql`."""
+
+    _COMPARATORS: Dict[str, Callable[[Any, Any], Any]] = {
+        "$eq": lambda x, y: x == y,
+        "$ne": lambda x, y: x != y,
+        "$gt": lambda x, y: x is not None and y is not None and x > y,
+        "$gte": lambda x, y: x is not None and y is not None and x >= y,
+        "$lt": lambda x, y: x is not None and y is not None and x < y,
+        "$lte": lambda x, y: x is not None and y is not None and x <= y,
+    }
+
+    _ARITHMETICS: Dict[str, Callable[[Any, Any], Any]] = {
+        "$add": lambda x, y: x + y,
+        "$sub": lambda x, y: x - y,
+        "$mult": lambda x, y: x * y,
+        "$div": lambda x, y: x / y,
+        "$mod": lambda x, y: x % y,
+        "$pow": lambda x, y: x**y,
+    }
+
+    _AGGREGATIONS: Dict[str, Callable[[List[Any]], Any]] = {
+        "$size": len,
+        "$max": lambda values: max(values, default=None),
+        "$min": lambda values: min(values, default=None),
+        "$sum": sum,
+    }
+
+    def evaluate(  # pylint: disable=too-many-return-statements, too-many-branches
+        self, expr: Any, context: Any
+    ) -> Any:
+        """Evaluate the expression in the given context.
+
+        Arguments:
+            expr: The criteria expression.
+            context: The record or the array element referred by "$".
+
+        Returns:
+            The value of the expression.
+
+        Raises:
+            MockError: When the operator is not supported.
+
+        """
+        if isinstance(expr, str) and expr.startswith("$"):
+            if expr == "$":
+                return context
+            if expr.startswith("$."):
+                return _get_path(context, expr[2:].lower().split("."))
+            return expr
+
+        if not isinstance(expr, dict):
+            return expr
+
+        (operator, args), *_ = expr.items()
+        if operator == "$and":
+            return all(self.evaluate(arg, context) for arg in args)
+        if operator == "$or":
+            return any(self.evaluate(arg, context) for arg in args)
+        if operator in self._COMPARATORS:
+            left, right = (self.evaluate(arg, context) for arg in args)
+            return self._COMPARATORS[operator](left, right)
+        if operator in self._ARITHMETICS:
+            left, right = (self.evaluate(arg, context) for arg in args)
+            if left is None or right is None:
+                return None
+            return self._ARITHMETICS[operator](left, right)
+        if operator in self._AGGREGATIONS:
+            values = self.evaluate(args[0], context) or []
+            return self._AGGREGATIONS[operator]([value for value in values if value is not None])
+        if operator in ("$any_match", "$all_match", "$filter"):
+            items = self.evaluate(args[0], context) or []
+            matches = [bool(self.evaluate(args[1], item)) for item in items]
+            if operator == "$any_match":
+                return any(matches)
+            if operator == "$all_match":
+                return all(matches)
+            return [item for item, match in zip(items, matches) if match]
+
+        raise MockError(400, "InvalidParams", f"Unsupported operator '{operator}'")
+
+    def search(self, records: List[Dict[str, Any]], criteria: Dict[str, Any]) -> List[Any]:
+        """Search the records by the criteria.
+
+        Arguments:
+            records: The records to search.
+            criteria: The search criteria with the optional "where" and "select".
+
+        Returns:
+            The searched records.
+
+        """
+        where = criteria.get("where")
+        if where is not None:
+            records = [record for record in records if self.evaluate(where, record)]
+
+        select = criteria.get("select")
+        if not select:
+            return [
+                {key: value for key, value in record.items() if key != RECORD_KEY}
+                for record in records
+            ]
+
+        results = []
+        for record in records:
+            result: Dict[str, Any] = {}
+            for item in select:
+                if isinstance(item, str):
+                    column, value = item[2:], self.evaluate(item, record)
+                else:
+                    # The server wraps the computed value of every record in an array.
+                    column, expr = next(iter(item.items()))
+                    value = self.evaluate(expr, record)
+                    if not isinstance(value, list):
+                        value = [value]
+
+                names = column.lower().split(".")
+                target = result
+                for name in names[:-1]:
+                    target = target.setdefault(name, {})
+                target[names[-1]] = value
+            results.append(result)
+
+        return results
+
+
+class MockState:
+    """The in-memory state of the mock server."""
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.datasets: Dict[str, Dataset] = {}
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self.evaluator = CriteriaEvaluator()
+        self._record_keys = count()
+
+    def create_record_key(self) -> str:
+        """Create a new record key, the record keys are increasing in creation order.
+
+        Returns:
+            The record key.
+
+        """
+        return f"{next(self._record_keys):020d}"
+
+    def get_dataset(self, name: str) -> Dataset:
+        """Get the dataset with the given name.
+
+        Arguments:
+            name: The name of the dataset.
+
+        Returns:
+            The dataset.
+
+        Raises:
+            MockError: When the dataset does not exist.
+
+        """
+        try:
+            return self.datasets[name]
+        except KeyError:
+            raise MockError(404, "DatasetNotExist", f"Dataset '{name}' does not exist") from None
+
+    def get_dataset_by_id(self, dataset_id: str) -> Dataset:
+        """Get the dataset with the given id.
+
+        Arguments:
+            dataset_id: The id of the dataset.
+
+        Returns:
+            The dataset.
+
+        Raises:
+            MockError: When the dataset does not exist.
+
+        """
+        for dataset in self.datasets.values():
+            if dataset.dataset_id == dataset_id:
+                return dataset
+        raise MockError(404, "DatasetNotExist", f"Dataset '{dataset_id}' does not exist")
+
+
+class _Router:
+    def __init__(self) -> None:
+        self._routes: List[Tuple[str, str, Pattern[str], _Handler]] = []
+
+    def route(self, method: str, pattern: str) -> Callable[[_Handler], _Handler]:
+        """Get the decorator to register the handler of the route.
+
+        Arguments:
+            method: The HTTP method of the route.
+            pattern: The path pattern of the route, the path parameters are in "{}".
+
+        Returns:
+            The decorator which registers the handler and returns it unchanged.
+
+        """
+        regex = re.compile("^" + re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", pattern) + "$")
+
+        def decorator(handler: _Handler) -> _Handler:
+            self._routes.append((method, pattern, regex, handler))
+            return handler
+
+        return decorator
+
+    def match(self, method: str, path: str) -> Tuple[_Handler, Dict[str, str], str]:
+        """Match the request with the registered routes.
+
+        Arguments:
+            method: The HTTP method of the request.
+            path: The path of the request.
+
+        Returns:
+            The handler, the path parameters and the path pattern of the matched route.
+
+        Raises:
+            MockError: When no route matches the path or the method.
+
+        """
+        allowed = False
+        for route_method, pattern, regex, handler in self._routes:
+            matched = regex.match(path)
+            if matched is None:
+                continue
+            if route_method == method:
+                return handler, matched.groupdict(), pattern
+            allowed = True
+
+        if allowed:
+            raise MockError(405, "MethodNotAllowed", f"{method} {path}")
+        raise MockError(404, "ResourceNotExist", f"{method} {path}")
+
+
+_DATASET = "/v2/datasets/{workspace}/{dataset}"
+_DRAFT_SHEET = _DATASET + "/drafts/{draft_number}/sheets/{sheet}"
+_COMMIT_SHEET = _DATASET + "/commits/{commit_id}/sheets/{sheet}"
+
+ROUTER = _Router()
+
+
+# pylint: disable=unused-argument
+
+
+@ROUTER.route("GET", "/v2/current-workspace")
+def _get_current_workspace(state: MockState, request: "_Request") -> Tuple[int, Any]:
+    return 200, {
+        "id": "mock-workspace-id",
+        "type": "USER",
+        "name": WORKSPACE,
+        "alias": "",
+        "description": "The workspace of the mock server",
+        "email": "mock@graviti.com",
+    }
+
+
+@ROUTER.route("POST", "/v2/datasets")
+def _create_dataset(state: MockState, request: "_Request") -> Tuple[int, Any]:
+    name = request.body["name"]
+    if name in state.datasets:
+        raise MockError(400, "NameConflict", f"Dataset '{name}' already exists")
+    dataset = state.datasets[name] = Dataset(name, request.body.get("alias", ""))
+    return 200, dataset.to_response()
+
+
+@ROUTER.route("GET", "/v2/datasets")
+def _list_datasets(state: MockState, request: "_Request") -> Tuple[int, Any]:
+    offset, limit = request.get_int("offset", 0), request.get_int("limit", 128)
+    datasets = list(state.datasets.values())
+    return 200, {
+        "datasets": [dataset.to_response() for dataset in datasets[offset : offset + limit]],
+        "offset": offset,
+        "record_size": len(datasets[offset : offset + limit]),
+        "total_count": len(datasets),
+    }
+
+
+@ROUTER.route("GET", _DATASET)
+def _get_dataset(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    return 200, state.get_dataset(kwargs["dataset"]).to_response()
+
+
+@ROUTER.route("GET", _DATASET + "/revisions/{revision}")
+def _get_revision(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    revision = kwargs["revision"]
+    if revision in dataset.branches:
+        return 200, {"type": "BRANCH", **dataset.get_commit_response(dataset.branches[revision])}
+    if revision in dataset.commits:
+        return 200, {"type": "COMMIT", **dataset.get_commit_response(revision)}
+    raise MockError(404, "ResourceNotExist", f"Revision '{revision}' does not exist")
+
+
+@ROUTER.route("GET", _DATASET + "/branches/{branch}")
+def _get_branch(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    branch = kwargs["branch"]
+    if branch not in dataset.branches:
+        raise MockError(404, "BranchNotExist", f"Branch '{branch}' does not exist")
+    return 200, {"name": branch, **dataset.get_commit_response(dataset.branches[branch])}
+
+
+@ROUTER.route("GET", _DATASET + "/commits/{commit_id}")
+def _get_commit(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    if kwargs["commit_id"] not in dataset.commits:
+        raise MockError(404, "CommitNotExist", f"Commit '{kwargs['commit_id']}' does not exist")
+    return 200, dataset.get_commit_response(kwargs["commit_id"])
+
+
+@ROUTER.route("POST", _DATASET + "/commits")
+def _commit_draft(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    draft = _get_draft_info(dataset, request.body["draft_number"])
+    if draft["state"] != "OPEN":
+        raise MockError(400, "InvalidParams", "The draft is not open")
+
+    response = dataset.commit(
+        dataset.draft_sheets[draft["number"]],
+        request.body["title"],
+        request.body.get("description", ""),
+        draft["branch"],
+    )
+    draft["state"] = "COMMITTED"
+    draft["updated_at"] = _now()
+    return 200, response
+
+
+def _get_draft_info(dataset: Dataset, draft_number: Any) -> Dict[str, Any]:
+    try:
+        return dataset.drafts[int(draft_number)]
+    except KeyError:
+        raise MockError(404, "DraftNotExist", f"Draft '{draft_number}' does not exist") from None
+
+
+@ROUTER.route("POST", _DATASET + "/drafts")
+def _create_draft(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    branch = request.body.get("branch", dataset.default_branch)
+    parent_commit_id = dataset.branches[branch]
+    number = len(dataset.drafts) + 1
+    now = _now()
+    dataset.drafts[number] = {
+        "number": number,
+        "title": request.body["title"],
+        "description": request.body.get("description", ""),
+        "branch": branch,
+        "state": "OPEN",
+        "parent_commit_id": parent_commit_id,
+        "creator": WORKSPACE,
+        "created_at": now,
+        "updated_at": now,
+    }
+    parent_sheets = dataset.commit_sheets.get(parent_commit_id, {}) if parent_commit_id else {}
+    dataset.draft_sheets[number] = {name: sheet.copy() for name, sheet in parent_sheets.items()}
+    return 200, dict(dataset.drafts[number])
+
+
+@ROUTER.route("GET", _DATASET + "/drafts/{draft_number}")
+def _get_draft(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    return 200, dict(_get_draft_info(dataset, kwargs["draft_number"]))
+
+
+@ROUTER.route("PATCH", _DATASET + "/drafts/{draft_number}")
+def _update_draft(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    draft = _get_draft_info(dataset, kwargs["draft_number"])
+    for key in ("title", "description", "state"):
+        if key in request.body:
+            draft[key] = request.body[key]
+    draft["updated_at"] = _now()
+    return 200, dict(draft)
+
+
+def _get_sheets(state: MockState, kwargs: Dict[str, str]) -> Dict[str, Sheet]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    if "draft_number" in kwargs:
+        _get_draft_info(dataset, kwargs["draft_number"])
+        return dataset.draft_sheets[int(kwargs["draft_number"])]
+
+    try:
+        return dataset.commit_sheets[kwargs["commit_id"]]
+    except KeyError:
+        raise MockError(
+            404, "CommitNotExist", f"Commit '{kwargs['commit_id']}' does not exist"
+        ) from None
+
+
+def _get_sheet(state: MockState, kwargs: Dict[str, str]) -> Sheet:
+    try:
+        return _get_sheets(state, kwargs)[kwargs["sheet"]]
+    except KeyError:
+        raise MockError(404, "SheetNotExist", f"Sheet '{kwargs['sheet']}' does not exist") from None
+
+
+@ROUTER.route("GET", _DATASET + "/drafts/{draft_number}/sheets")
+@ROUTER.route("GET", _DATASET + "/commits/{commit_id}/sheets")
+def _list_sheets(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheets = _get_sheets(state, kwargs)
+    return 200, {
+        "sheets": [{"name": name, "created_at": _now(), "updated_at": _now()} for name in sheets],
+        "offset": 0,
+        "record_size": len(sheets),
+        "total_count": len(sheets),
+    }
+
+
+@ROUTER.route("POST", _DATASET + "/drafts/{draft_number}/sheets")
+def _create_sheet(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheets = _get_sheets(state, kwargs)
+    name = request.body["name"]
+    if name in sheets:
+        raise MockError(400, "NameConflict", f"Sheet '{name}' already exists")
+    sheets[name] = Sheet(request.body["schema"])
+    return 200, None
+
+
+@ROUTER.route("GET", _DRAFT_SHEET)
+@ROUTER.route("GET", _COMMIT_SHEET)
+def _get_sheet_info(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheet = _get_sheet(state, kwargs)
+    response: Dict[str, Any] = {"name": kwargs["sheet"], "schema": sheet.schema}
+    if request.get("with_record_count") in ("true", "True"):
+        response["record_count"] = len(sheet.records)
+    return 200, response
+
+
+@ROUTER.route("DELETE", _DRAFT_SHEET)
+def _delete_sheet(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    _get_sheet(state, kwargs)
+    del _get_sheets(state, kwargs)[kwargs["sheet"]]
+    return 200, None
+
+
+@ROUTER.route("PATCH", _DRAFT_SHEET + "/schema")
+def _update_schema(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    _get_sheet(state, kwargs).schema = request.body["schema"]
+    return 200, None
+
+
+@ROUTER.route("GET", _DRAFT_SHEET + "/data")
+@ROUTER.route("GET", _COMMIT_SHEET + "/data")
+def _list_data(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    records = _get_sheet(state, kwargs).records
+    order_by = request.get("order_by")
+    if order_by:
+        paths = [column.lower().split(".") for column in order_by.split("|")] + [[RECORD_KEY]]
+        records = sorted(
+            records, key=lambda record: [_sort_key(_get_path(record, path)) for path in paths]
+        )
+
+    offset, limit = request.get_int("offset", 0), request.get_int("limit", 128)
+    data = records[offset : offset + limit]
+
+    columns = request.get("columns")
+    if columns:
+        names = {RECORD_KEY, *(column.split(".", 1)[0].lower() for column in columns.split("|"))}
+        data = [{key: value for key, value in item.items() if key in names} for item in data]
+
+    return 200, {
+        "data": data,
+        "offset": offset,
+        "record_size": len(data),
+        "total_count": len(records),
+    }
+
+
+@ROUTER.route("POST", _DRAFT_SHEET + "/data")
+def _add_data(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheet = _get_sheet(state, kwargs)
+    for item in request.body["data"]:
+        record = _lower_keys(item)
+        record[RECORD_KEY] = state.create_record_key()
+        sheet.records.append(record)
+    sheet.index = None
+    return 200, None
+
+
+@ROUTER.route("PATCH", _DRAFT_SHEET + "/data")
+def _update_data(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheet = _get_sheet(state, kwargs)
+    index = sheet.get_index()
+    for item in request.body["data"]:
+        record = _lower_keys(item)
+        try:
+            position = index[record[RECORD_KEY]]
+        except KeyError as error:
+            raise MockError(
+                404, "RecordNotExist", f"Record '{item[RECORD_KEY]}' does not exist"
+            ) from error
+        sheet.records[position] = {**sheet.records[position], **record}
+    return 200, None
+
+
+@ROUTER.route("DELETE", _DRAFT_SHEET + "/data")
+def _delete_data(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    sheet = _get_sheet(state, kwargs)
+    record_keys = set(request.body["record_keys"])
+    sheet.records = [record for record in sheet.records if record[RECORD_KEY] not in record_keys]
+    sheet.index = None
+    return 200, None
+
+
+@ROUTER.route("GET", _DATASET + "/objects/permissions")
+def _get_object_permission(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    expired = request.get_int("expired", 60)
+    return 200, {
+        "backend_type": "AZURE",
+        "expire_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + expired)),
+        "permission": {
+            "endpoint_prefix": f"{request.server_url}/storage/{dataset.dataset_id}",
+            "sas_param": "sig=mock",
+            "prefix": "objects/",
+        },
+    }
+
+
+@ROUTER.route("POST", _DATASET + "/objects/copy")
+def _copy_objects(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    target = state.get_dataset(kwargs["dataset"])
+    source = state.get_dataset(request.body["source_dataset"])
+    keys = []
+    for key in request.body["keys"]:
+        try:
+            data = state.objects[source.dataset_id, key]
+        except KeyError:
+            raise MockError(404, "ObjectNotExist", f"Object '{key}' does not exist") from None
+        new_key = f"objects/{key.rsplit('/', 1)[-1]}"
+        state.objects[target.dataset_id, new_key] = data
+        keys.append(new_key)
+    return 200, {"keys": keys}
+
+
+def _get_search(state: MockState, kwargs: Dict[str, str]) -> Dict[str, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    try:
+        return dataset.searches[kwargs["search_id"]]
+    except KeyError:
+        raise MockError(
+            404, "SearchNotExist", f"Search '{kwargs['search_id']}' does not exist"
+        ) from None
+
+
+def _get_search_results(state: MockState, search: Dict[str, Any]) -> List[Any]:
+    results: Optional[List[Any]] = search.get("_results")
+    if results is None:
+        results = state.evaluator.search(search["_sheet"].records, search["criteria"])
+        search["_results"] = results
+    return results
+
+
+def _to_search_response(search: Dict[str, Any]) -> Dict[str, Any]:
+    response = {key: value for key, value in search.items() if not key.startswith("_")}
+    response["record_count"] = len(search["_results"]) if "_results" in search else None
+    return response
+
+
+@ROUTER.route("POST", _DATASET + "/searches")
+def _create_search(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    dataset = state.get_dataset(kwargs["dataset"])
+    body = request.body
+    sheet_kwargs = {"dataset": kwargs["dataset"], "sheet": body["sheet"]}
+    search = {
+        "id": uuid4().hex,
+        "sheet": body["sheet"],
+        "criteria": body["criteria"],
+        "creator": WORKSPACE,
+        "created_at": _now(),
+    }
+    if "commit_id" in body:
+        search["commit_id"] = sheet_kwargs["commit_id"] = body["commit_id"]
+    else:
+        search["draft_number"] = body["draft_number"]
+        sheet_kwargs["draft_number"] = str(body["draft_number"])
+
+    search["_sheet"] = _get_sheet(state, sheet_kwargs)
+    dataset.searches[search["id"]] = search
+    return 200, _to_search_response(search)
+
+
+@ROUTER.route("GET", _DATASET + "/searches/{search_id}")
+def _get_search_history(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    return 200, _to_search_response(_get_search(state, kwargs))
+
+
+@ROUTER.route("GET", _DATASET + "/searches/{search_id}/record-count")
+def _get_search_record_count(
+    state: MockState, request: "_Request", **kwargs: str
+) -> Tuple[int, Any]:
+    return 200, len(_get_search_results(state, _get_search(state, kwargs)))
+
+
+@ROUTER.route("GET", _DATASET + "/searches/{search_id}/records")
+def _list_search_records(state: MockState, request: "_Request", **kwargs: str) -> Tuple[int, Any]:
+    results = _get_search_results(state, _get_search(state, kwargs))
+    offset, limit = request.get_int("offset", 0), request.get_int("limit", 128)
+    return 200, {"records": results[offset : offset + limit]}
+
+
+# pylint: enable=unused-argument
+
+
+class _Request:
+    def __init__(self, handler: "_MockRequestHandler", query: str, body: bytes) -> None:
+        self.params = {key: values[0] for key, values in parse_qs(query).items()}
+        self.body: Dict[str, Any] = json.loads(body) if body else {}
+        self.server_url: str = handler.server.url
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the query parameter of the request.
+
+        Arguments:
+            key: The name of the query parameter.
+
+        Returns:
+            The value of the query parameter, None when it is not given.
+
+        """
+        return self.params.get(key)
+
+    def get_int(self, key: str, default: int) -> int:
+        """Get the integer query parameter of the request.
+
+        Arguments:
+            key: The name of the query parameter.
+            default: The value returned when the query parameter is not given.
+
+        Returns:
+            The integer value of the query parameter.
+
+        """
+        value = self.params.get(key)
+        return default if value is None else int(value)
+
+
+class _MockRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_MockHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        if not length:
+            return b""
+
+        bandwidth = self.server.options.bandwidth
+        if not bandwidth:
+            return self.rfile.read(length)
+
+        chunks = []
+        while length > 0:
+            chunk = self.rfile.read(min(length, _CHUNK_SIZE))
+            chunks.append(chunk)
+            length -= len(chunk)
+            time.sleep(len(chunk) / bandwidth)
+        return b"".join(chunks)
+
+    def _send(  # pylint: disable=too-many-arguments
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        headers: Optional[Dict[str, str]] = None,
+        throttle: bool = False,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+        if self.command == "HEAD":
+            return
+
+        bandwidth = self.server.options.bandwidth
+        if not throttle or not bandwidth:
+            self.wfile.write(body)
+            return
+
+        for start in range(0, len(body), _CHUNK_SIZE):
+            chunk = body[start : start + _CHUNK_SIZE]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / bandwidth)
+
+    def _send_json(self, status: int, content: Any) -> None:
+        self._send(status, b"" if content is None else json.dumps(content).encode("utf-8"))
+
+    def _inject(self, is_storage: bool) -> bool:
+        options = self.server.options
+        latency = options.storage_latency if is_storage else options.latency
+        if latency:
+            time.sleep(latency)
+
+        if options.failure_rate and self.command in options.failure_methods:
+            if self.server.random() < options.failure_rate:
+                headers = {}
+                if options.retry_after is not None:
+                    headers["Retry-After"] = str(options.retry_after)
+                if is_storage:
+                    body = b"<Error><Code>ServerBusy</Code></Error>"
+                    self._send(503, body, "application/xml", headers)
+                else:
+                    body = json.dumps({"code": "ServiceUnavailable"}).encode("utf-8")
+                    self._send(503, body, headers=headers)
+                return True
+
+        return False
+
+    def _handle(self) -> None:
+        split = urlsplit(self.path)
+        is_storage = split.path.startswith("/storage/")
+        body = self._read_body()
+
+        self.server.count(self.command, "storage" if is_storage else split.path)
+        if self._inject(is_storage):
+            return
+
+        if is_storage:
+            self._handle_storage(split.path, body)
+            return
+
+        try:
+            handler, kwargs, pattern = ROUTER.match(self.command, split.path)
+            self.server.count(self.command, pattern, route=True)
+            request = _Request(self, split.query, body)
+            with self.server.state.lock:
+                status, content = handler(self.server.state, request, **kwargs)
+        except MockError as error:
+            status, content = error.status, {"code": error.code, "message": error.message}
+
+        self._send_json(status, content)
+
+    def _handle_storage(self, path: str, body: bytes) -> None:
+        _, _, dataset_id, key = path.split("/", 3)
+        state = self.server.state
+        if self.command == "PUT":
+            with state.lock:
+                state.objects[dataset_id, key] = body
+            self._send(201, content_type="application/xml")
+            return
+
+        data = state.objects.get((dataset_id, key))
+        if data is None:
+            self._send(404, b"<Error><Code>BlobNotFound</Code></Error>", "application/xml")
+            return
+
+        status, headers = 200, {"Accept-Ranges": "bytes"}
+        matched = re.match(r"bytes=(\d*)-(\d*)$", self.headers.get("Range", ""))
+        if matched:
+            start, end = matched.groups()
+            if not start:
+                start, end = str(max(len(data) - int(end), 0)), ""
+            stop = min(int(end) + 1, len(data)) if end else len(data)
+            headers["Content-Range"] = f"bytes {start}-{stop - 1}/{len(data)}"
+            data = data[int(start) : stop]
+            status = 206
+
+        self._send(status, data, "application/octet-stream", headers, throttle=True)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+
+class MockOptions:  # pylint: disable=too-few-public-methods
+    """The injection options of the mock server.
+
+    Arguments:
+        latency: The latency in seconds added to every OpenAPI request.
+        storage_latency: The latency in seconds added to every object storage request.
+        bandwidth: The max bytes per second of every object transfer, ``None`` means no limit.
+        failure_rate: The probability of responding "503 Service Unavailable".
+        retry_after: The "Retry-After" seconds of the failure responses.
+        failure_methods: The HTTP methods whose requests can fail.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        latency: float = 0.0,
+        storage_latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        failure_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        failure_methods: Iterable[str] = _FAILURE_METHODS,
+    ) -> None:
+        self.latency = latency
+        self.storage_latency = storage_latency
+        self.bandwidth = bandwidth
+        self.failure_rate = failure_rate
+        self.retry_after = retry_after
+        self.failure_methods = frozenset(failure_methods)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], options: MockOptions, seed: Optional[int]) -> None:
+        super().__init__(address, _MockRequestHandler)
+        self.options = options
+        self.state = MockState()
+        self.url = f"http://{address[0]}:{self.server_address[1]}"
+        self.requests: Counter = Counter()  # type: ignore[type-arg]
+        self.routes: Counter = Counter()  # type: ignore[type-arg]
+        self._random = random.Random(seed)
+        self._lock = Lock()
+
+    def random(self) -> float:
+        """Get the next random number of the server, which is reproducible by the seed.
+
+        Returns:
+            The random number in range [0, 1).
+
+        """
+        with self._lock:
+            return self._random.random()
+
+    def count(self, method: str, path: str, route: bool = False) -> None:
+        """Count the request by its method, or by its route when "route" is True.
+
+        Arguments:
+            method: The HTTP method of the request.
+            path: The path of the request, only the path pattern of the route is counted.
+            route: Whether to count the request by the route instead of the method.
+
+        """
+        with self._lock:
+            if route:
+                self.routes[f"{method} {path}"] += 1
+            else:
+                self.requests[method] += 1
+
+
+class MockGravitiServer:
+    """The local mock server of the Graviti OpenAPI and the object storage.
+
+    Arguments:
+        host: The host to bind.
+        port: The port to bind, 0 means choosing a free port.
+        seed: The random seed of the failure injection.
+        **kwargs: The injection options, see :class:`MockOptions`.
+
+    Examples:
+        >>> with MockGravitiServer(latency=0.02) as server:
+        ...     dataset = server.create_dataset("example")
+        ...     server.commit(dataset, {"train": (schema_yaml, records)})
+        ...     ws = connect(server.url)
+
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0, seed: Optional[int] = None, **kwargs: Any
+    ) -> None:
+        self.options = MockOptions(**kwargs)
+        self._server = _MockHTTPServer((host, port), self.options, seed)
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "MockGravitiServer":
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Return the base url of the server.
+
+        Returns:
+            The base url of the server.
+
+        """
+        return self._server.url
+
+    @property
+    def state(self) -> MockState:
+        """Return the in-memory state of the server.
+
+        Returns:
+            The in-memory state of the server.
+
+        """
+        return self._server.state
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def get_request_counts(self) -> Dict[str, Any]:
+        """Get the counts of the received requests.
+
+        Returns:
+            The request counts by the HTTP method and by the OpenAPI route.
+
+        """
+        return {"methods": dict(self._server.requests), "routes": dict(self._server.routes)}
+
+    def reset_request_counts(self) -> None:
+        """Clear the counts of the received requests."""
+        self._server.requests.clear()
+        self._server.routes.clear()
+
+    def create_dataset(self, name: str, alias: str = "") -> Dataset:
+        """Create a dataset directly in the server state.
+
+        Arguments:
+            name: The name of the dataset.
+            alias: The alias of the dataset.
+
+        Returns:
+            The created dataset.
+
+        """
+        with self.state.lock:
+            dataset = self.state.datasets[name] = Dataset(name, alias)
+        return dataset
+
+    def commit(
+        self,
+        dataset: Dataset,
+        sheets: Dict[str, Tuple[str, Iterable[Dict[str, Any]]]],
+        title: str = "seed",
+    ) -> str:
+        """Commit the sheets directly into the server state, bypassing the OpenAPI.
+
+        The sheets of the parent commit are kept unless they are replaced by the given ones.
+
+        Arguments:
+            dataset: The dataset to commit to.
+            sheets: The sheets to commit, mapping from the sheet name to the yaml schema and the
+                records in the backend format.
+            title: The commit title.
+
+        Returns:
+            The commit id.
+
+        """
+        state = self.state
+        with state.lock:
+            parent_commit_id = dataset.branches[dataset.default_branch]
+            committed = dict(dataset.commit_sheets[parent_commit_id]) if parent_commit_id else {}
+            for name, (schema, records) in sheets.items():
+                rows = []
+                for item in records:
+                    record = _lower_keys(item)
+                    record[RECORD_KEY] = state.create_record_key()
+                    rows.append(record)
+                committed[name] = Sheet(schema, rows)
+
+            return dataset.commit(committed, title)["commit_id"]  # type: ignore[no-any-return]
+
+    def put_object(self, dataset: Dataset, key: str, data: bytes) -> None:
+        """Put an object directly into the object storage.
+
+        Arguments:
+            dataset: The dataset which owns the object.
+            key: The key of the object.
+            data: The content of the object.
+
+        """
+        with self.state.lock:
+            self.state.objects[dataset.dataset_id, key] = data
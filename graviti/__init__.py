@@ -5,12 +5,32 @@
 
 """Graviti Python SDK."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 from graviti.__version__ import __version__
-from graviti.dataframe import ColumnSeries as Series
-from graviti.dataframe import DataFrame
-from graviti.file import Audio, File, Image, PointCloud
-from graviti.manager import Workspace
-from graviti.utility import engine
+
+if TYPE_CHECKING:
+    from graviti.dataframe import ColumnSeries as Series
+    from graviti.dataframe import DataFrame
+    from graviti.file import Audio, File, Image, PointCloud
+    from graviti.manager import Workspace
+    from graviti.utility import engine, metrics, profile
+
+# The public attributes are imported on the first access (PEP 562), so importing the SDK does not
+# pay for pyarrow, yaml and requests until they are really needed.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "Audio": ("graviti.file", "Audio"),
+    "DataFrame": ("graviti.dataframe", "DataFrame"),
+    "File": ("graviti.file", "File"),
+    "Image": ("graviti.file", "Image"),
+    "PointCloud": ("graviti.file", "PointCloud"),
+    "Series": ("graviti.dataframe", "ColumnSeries"),
+    "Workspace": ("graviti.manager", "Workspace"),
+    "engine": ("graviti.utility.engine", "engine"),
+    "metrics": ("graviti.utility.metrics", "metrics"),
+    "profile": ("graviti.utility.profile", "profile"),
+}
 
 __all__ = [
     "Audio",
@@ -22,4 +42,21 @@ __all__ = [
     "Workspace",
     "__version__",
     "engine",
+    "metrics",
+    "profile",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
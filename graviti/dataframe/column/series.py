@@ -5,12 +5,14 @@
 
 """The implementation of the Graviti Series."""
 
+# pylint: disable=too-many-lines
 
 from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Iterable,
     Iterator,
@@ -24,6 +26,7 @@ from typing import (
 )
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 import graviti.portex as pt
 from graviti.dataframe.column.indexing import ColumnSeriesILocIndexer, ColumnSeriesLocIndexer
@@ -39,12 +42,11 @@ from graviti.paging import (
     PyArrowPagingList,
 )
 from graviti.portex.enum import EnumValueType
-from graviti.utility import MAX_REPR_ROWS, ModuleMocker
+from graviti.utility import MAX_REPR_ROWS, LazyModule
+from graviti.utility.profile import profile_phase
 
-try:
-    import pandas as pd
-except ModuleNotFoundError:
-    pd = ModuleMocker("No module named 'pandas'")
+# pandas is imported on the first use, since importing it costs much more than the SDK itself.
+pd = LazyModule("pandas")
 
 if TYPE_CHECKING:
     import pandas
@@ -309,12 +311,27 @@ class Series(Container):
 
         return obj
 
+    def _get_items_by_location(
+        self: _S,
+        indices: pa.Array,
+        schema: pt.PortexType,
+        root: Optional["DataFrame"] = None,
+        name: Tuple[str, ...] = (),
+    ) -> _S:
+        obj = self._create(schema, root, name)
+        obj._data = self._data.take(indices)  # pylint: disable=protected-access
+
+        return obj
+
     def _set_slice(self: _S, key: slice, value: _S) -> None:
         self._data.set_slice(key, value._data)  # pylint: disable=protected-access
 
     def _del_item_by_location(self, key: Union[int, slice]) -> None:
         del self._data[key]
 
+    def _is_loaded(self) -> bool:
+        return self._data.is_loaded()
+
     def _refresh_data_from_factory(self, factory: LazyFactoryBase, _: _OPM) -> None:
         self._data = factory.create_pyarrow_list()
 
@@ -520,20 +537,189 @@ class PyarrowSeries(Series):
         """
         return self._data.to_pyarrow().to_pandas()
 
+    def _get_aggregate_array(self, operation: str) -> pa.Array:
+        # The root DataFrame only requests this column online when the column is not loaded,
+        # the name of the column is stored from the innermost key.
+        if self._root is None or not self._name:
+            return self._data.to_pyarrow()
+
+        return self._root._get_column_arrays(  # pylint: disable=protected-access
+            [self._name[::-1]], operation
+        )[0]
+
+    def count(self) -> int:
+        """Return the number of the non-null values in the Series.
+
+        The aggregation of a lazy loaded column of a sheet in a Commit only requests this column
+        by one search, use ``engine.local()`` with block to load the whole sheet instead.
+
+        Returns:
+            The number of the non-null values.
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": None}, {"score": 3}])
+            >>> df["score"].count()
+            2
+
+        """
+        array = self._get_aggregate_array("count")
+        return len(array) - array.null_count  # type: ignore[no-any-return]
+
+
+def _get_pyarrow_operand(series: PyarrowSeries, other: Any) -> Any:
+    if not isinstance(other, PyarrowSeries):
+        return other
+
+    if len(other) != len(series):
+        raise ValueError("Can only operate the Series with the same length")
+
+    return other._data.to_pyarrow()  # pylint: disable=protected-access
+
+
+class ComparisonOperatorsMixin(PyarrowSeries):
+    """A mixin for dynamically implementing comparison operators."""
+
+    _COMPARISON_OPERATORS: ClassVar[Dict[str, Callable[[Any, Any], Any]]] = {
+        "__eq__": pc.equal,
+        "__ne__": pc.not_equal,
+        "__gt__": pc.greater,
+        "__ge__": pc.greater_equal,
+        "__lt__": pc.less,
+        "__le__": pc.less_equal,
+    }
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        for meth, function in cls._COMPARISON_OPERATORS.items():
+            setattr(cls, meth, cls._get_comparison_operator(function))
+
+    @classmethod
+    def _get_comparison_operator(
+        cls, function: Callable[[Any, Any], Any]
+    ) -> Callable[[PyarrowSeries, Any], "BooleanSeries"]:
+        def func(self: PyarrowSeries, other: Any) -> "BooleanSeries":
+            # pylint: disable=protected-access
+            array = function(self._data.to_pyarrow(), _get_pyarrow_operand(self, other))
+            return BooleanSeries._from_pyarrow(array.combine_chunks(), pt.boolean())
+
+        return func
+
+
+class LogicalOperatorsMixin(PyarrowSeries):
+    """A mixin for dynamically implementing logical operators."""
+
+    _LOGICAL_OPERATORS: ClassVar[Dict[str, Callable[[Any, Any], Any]]] = {
+        "__and__": pc.and_kleene,
+        "__or__": pc.or_kleene,
+        "__xor__": pc.xor,
+    }
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        for meth, function in cls._LOGICAL_OPERATORS.items():
+            setattr(cls, meth, cls._get_logical_operator(function))
+
+    @classmethod
+    def _get_logical_operator(
+        cls, function: Callable[[Any, Any], Any]
+    ) -> Callable[[PyarrowSeries, Any], "BooleanSeries"]:
+        def func(self: PyarrowSeries, other: Any) -> "BooleanSeries":
+            # pylint: disable=protected-access
+            array = function(self._data.to_pyarrow(), _get_pyarrow_operand(self, other))
+            return BooleanSeries._from_pyarrow(array.combine_chunks(), pt.boolean())
+
+        return func
+
 
 @pt.ContainerRegister(
-    pt.boolean,
     pt.float32,
     pt.float64,
     pt.int32,
     pt.int64,
 )
-class NumberSeries(PyarrowSeries):
+class NumberSeries(ComparisonOperatorsMixin):
     """One-dimensional array for portex builtin number type."""
 
+    def max(self) -> Any:
+        """Return the maximum of the non-null values in the Series.
+
+        Returns:
+            The maximum value, None when all the values are null.
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": None}, {"score": 3}])
+            >>> df["score"].max()
+            3
+
+        """
+        return pc.max(self._get_aggregate_array("max")).as_py()
+
+    def min(self) -> Any:
+        """Return the minimum of the non-null values in the Series.
+
+        Returns:
+            The minimum value, None when all the values are null.
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": None}, {"score": 3}])
+            >>> df["score"].min()
+            1
+
+        """
+        return pc.min(self._get_aggregate_array("min")).as_py()
+
+    def sum(self) -> Any:
+        """Return the sum of the non-null values in the Series.
+
+        Returns:
+            The sum of the values, 0 when all the values are null.
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": None}, {"score": 3}])
+            >>> df["score"].sum()
+            4
+
+        """
+        return pc.sum(self._get_aggregate_array("sum"), min_count=0).as_py()
+
+    def mean(self) -> Optional[float]:
+        """Return the mean of the non-null values in the Series.
+
+        Returns:
+            The mean of the values, None when all the values are null.
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": None}, {"score": 3}])
+            >>> df["score"].mean()
+            2.0
+
+        """
+        return pc.mean(self._get_aggregate_array("mean")).as_py()  # type: ignore[no-any-return]
+
+
+@pt.ContainerRegister(pt.boolean)
+class BooleanSeries(NumberSeries, LogicalOperatorsMixin):
+    """One-dimensional array for portex builtin boolean type.
+
+    The BooleanSeries returned by the comparisons can be used as the mask to filter the rows of a
+    DataFrame.
+
+    Examples:
+        >>> df = DataFrame([{"filename": "a.jpg", "x": 1}, {"filename": "b.jpg", "x": 2}])
+        >>> df[(df["x"] > 1) | (df["filename"] == "a.jpg")]
+           filename  x
+        0  a.jpg     1
+        1  b.jpg     2
+
+    """
+
+    def __invert__(self) -> "BooleanSeries":
+        array = pc.invert(self._data.to_pyarrow())
+        return BooleanSeries._from_pyarrow(array.combine_chunks(), pt.boolean())
+
 
 @pt.ContainerRegister(pt.string)
-class StringSeries(PyarrowSeries):
+class StringSeries(ComparisonOperatorsMixin):
     """One-dimensional array for portex builtin string type."""
 
 
@@ -607,6 +793,18 @@ class ArraySeries(Series):
         obj._object_permission_manager = self._object_permission_manager
         return obj._copy(schema, root, name)
 
+    def _get_items_by_location(
+        self: _A,
+        indices: pa.Array,
+        schema: pt.PortexType,
+        root: Optional["DataFrame"] = None,
+        name: Tuple[str, ...] = (),
+    ) -> _A:
+        obj = super()._get_items_by_location(indices, schema, root, name)
+        # pylint: disable=protected-access
+        obj._object_permission_manager = self._object_permission_manager
+        return obj._copy(schema, root, name)
+
     def _refresh_data_from_factory(
         self, factory: LazyFactoryBase, object_permission_manager: _OPM
     ) -> None:
@@ -731,10 +929,11 @@ class FileSeries(Series):
 
         obj = cls._create(schema, root, name)
         file_type: FileBase = schema.element  # type: ignore[assignment]
-        # pylint: disable=protected-access
-        obj._data = PagingList(
-            file_type._from_pyarrow(item, object_permission_manager) for item in array
-        )
+        with profile_phase("mapper"):
+            # pylint: disable=protected-access
+            obj._data = PagingList(
+                file_type._from_pyarrow(item, object_permission_manager) for item in array
+            )
 
         return obj
 
@@ -792,6 +991,19 @@ class EnumSeries(PyarrowSeries):
 
         return obj
 
+    def _get_items_by_location(
+        self: _E,
+        indices: pa.Array,
+        schema: pt.PortexType,
+        root: Optional["DataFrame"] = None,
+        name: Tuple[str, ...] = (),
+    ) -> _E:
+        obj = super()._get_items_by_location(indices, schema, root, name)
+        enum_values = self.schema.to_builtin().values  # type: ignore[attr-defined]
+        obj._index_to_value = enum_values.index_to_value  # pylint: disable=protected-access
+
+        return obj
+
     def _copy(
         self,
         schema: pt.PortexType,
@@ -858,6 +1070,32 @@ class EnumSeries(PyarrowSeries):
         dictionary_array = pa.DictionaryArray.from_arrays(array, dictionary)
         return dictionary_array.to_pandas()
 
+    def value_counts(self) -> Dict[EnumValueType, int]:
+        """Return the counts of the enum values in the Series.
+
+        The null values are not counted.
+
+        Returns:
+            The dict whose keys are the enum values and whose values are their counts,
+            sorted by the counts in descending order.
+
+        Examples:
+            >>> df = DataFrame(
+            ...     [{"weather": "sunny"}, {"weather": "rainy"}, {"weather": "sunny"}],
+            ...     pt.record({"weather": pt.enum(["sunny", "rainy"])}),
+            ... )
+            >>> df["weather"].value_counts()
+            {'sunny': 2, 'rainy': 1}
+
+        """
+        counts = pc.value_counts(self._get_aggregate_array("value_counts")).to_pylist()
+        _index_to_value = self._index_to_value
+        return {
+            _index_to_value[item["values"]]: item["counts"]
+            for item in sorted(counts, key=lambda item: int(item["counts"]), reverse=True)
+            if item["values"] is not None
+        }
+
 
 @pt.ContainerRegister(pt.date, pt.time, pt.timestamp, pt.timedelta)
 class TimeSeries(PyarrowSeries):
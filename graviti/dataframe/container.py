@@ -100,9 +100,21 @@ class Container:
     ) -> _T:
         raise NotImplementedError
 
+    def _get_items_by_location(
+        self: _T,
+        indices: pa.Array,
+        schema: PortexType,
+        root: Optional["DataFrame"] = None,
+        name: Tuple[str, ...] = (),
+    ) -> _T:
+        raise NotImplementedError
+
     def _del_item_by_location(self, key: Union[int, slice]) -> None:
         raise NotImplementedError
 
+    def _is_loaded(self) -> bool:
+        raise NotImplementedError
+
     def _refresh_data_from_factory(
         self,
         factory: LazyFactoryBase,
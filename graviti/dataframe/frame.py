@@ -7,6 +7,7 @@
 
 # pylint: disable=too-many-lines
 
+import re
 from itertools import chain, islice, zip_longest
 from typing import (
     TYPE_CHECKING,
@@ -17,34 +18,43 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
+    overload,
 )
 
 import pyarrow as pa
+import pyarrow.compute as pc
 
 import graviti.portex as pt
-from graviti.dataframe.column.series import ArraySeries, EnumSeries, FileSeries, NumberSeries
+from graviti.dataframe.column.series import (
+    ArraySeries,
+    BooleanSeries,
+    EnumSeries,
+    FileSeries,
+    NumberSeries,
+)
 from graviti.dataframe.column.series import Series as ColumnSeries
 from graviti.dataframe.container import Container
 from graviti.dataframe.indexing import DataFrameILocIndexer, DataFrameLocIndexer
 from graviti.dataframe.row.series import Series as RowSeries
 from graviti.dataframe.sql import RowSeries as SqlRowSeries
+from graviti.dataframe.sql.compute import broadcast, evaluate, get_container_getter
 from graviti.file import FileBase
 from graviti.openapi import RECORD_KEY
 from graviti.operation import AddData, DataFrameOperation, DeleteData, UpdateData, UpdateSchema
 from graviti.paging import LazyFactoryBase
-from graviti.utility import MAX_REPR_ROWS, Mode, ModuleMocker, engine
+from graviti.utility import MAX_REPR_ROWS, LazyModule, Mode, engine
 
-try:
-    import pandas as pd
-except ModuleNotFoundError:
-    pd = ModuleMocker("No module named 'pandas'")
+# pandas is imported on the first use, since importing it costs much more than the SDK itself.
+pd = LazyModule("pandas")
 
 
 if TYPE_CHECKING:
+    import numpy
     import pandas
 
     from graviti.manager import ObjectPermissionManager, SearchHistory
@@ -54,9 +64,12 @@ _T = TypeVar("_T", bound="DataFrame")
 _C = TypeVar("_C", bound="Container")
 
 _OPM = Optional["ObjectPermissionManager"]
+_Mask = Union[BooleanSeries, pa.Array, pa.ChunkedArray, Sequence[bool], "numpy.ndarray"]
 
 APPLY_KEY = "apply_result"
 
+_STATISTICS = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
 
 def _to_simple_pyarrow(schema: pt.PortexType) -> pa.DataType:
     if not isinstance(schema, pt.PortexRecordBase):
@@ -118,6 +131,7 @@ class DataFrame(Container):
     schema: pt.PortexRecordBase
     operations: Optional[List[DataFrameOperation]] = None
     search_creator: Optional[Callable[[Dict[str, Any]], "SearchHistory"]] = None
+    sort_creator: Optional[Callable[[str], "DataFrame"]] = None
     search_history: Optional["SearchHistory"] = None
 
     def __new__(
@@ -174,23 +188,37 @@ class DataFrame(Container):
     def __len__(self) -> int:
         return next(self._columns.values().__iter__()).__len__()
 
-    # @overload
-    # def __getitem__(self, key: str) -> Union[ColumnSeriesBase, "DataFrame"]:  # type: ignore[misc]
-    #     # https://github.com/python/mypy/issues/5090
-    #     ...
+    @overload
+    def __getitem__(self, key: str) -> Container:  # type: ignore[misc]
+        # https://github.com/python/mypy/issues/5090
+        ...
 
-    # @overload
-    # def __getitem__(self, key: Iterable[str]) -> "DataFrame":
-    #     ...
+    @overload
+    def __getitem__(self, key: Union[Iterable[str], _Mask]) -> "DataFrame":
+        ...
 
-    def __getitem__(self, key: str) -> Container:
+    def __getitem__(self, key: Union[str, Iterable[str], _Mask]) -> Container:
         if isinstance(key, str):
             return self._columns[key]
 
-        # if isinstance(key, Iterable):
-        #     new_columns = {name: self._columns[name] for name in key}
-        #     schema = pt.record({name: column.schema for name, column in new_columns.items()})
-        #     return self._construct(new_columns, schema, self._record_key)
+        if isinstance(key, BooleanSeries):
+            array = key._data.to_pyarrow()  # pylint: disable=protected-access
+        elif isinstance(key, (pa.Array, pa.ChunkedArray)):
+            array = key
+        elif isinstance(key, Sequence) or key.__class__.__name__ == "ndarray":
+            # The list and the numpy array of the column names or the booleans.
+            try:
+                array = pa.array(key)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                raise KeyError(key) from None
+        else:
+            raise KeyError(key)
+
+        if pa.types.is_boolean(array.type):
+            return self._get_items_by_mask(array)
+
+        if pa.types.is_string(array.type) or array.type == pa.null():
+            return self._get_columns(array.to_pylist())
 
         raise KeyError(key)
 
@@ -498,6 +526,45 @@ class DataFrame(Container):
 
         return obj
 
+    def _get_items_by_location(  # type: ignore[override]
+        self: _T,
+        indices: pa.Array,
+        schema: pt.PortexRecordBase,
+        root: Optional["DataFrame"] = None,
+        name: Tuple[str, ...] = (),
+    ) -> _T:
+        obj = self._create(schema, root, name)
+
+        _root = obj if root is None else root
+        _columns = self._columns
+
+        # pylint: disable=protected-access
+        obj._columns = {
+            column_name: _columns[column_name]._get_items_by_location(
+                indices,
+                value,
+                _root,  # type: ignore[arg-type]
+                (column_name,) + name,
+            )
+            for column_name, value in schema.items()
+        }
+
+        return obj
+
+    def _get_items_by_mask(self: _T, mask: Union[pa.Array, pa.ChunkedArray]) -> _T:
+        if len(mask) != len(self):
+            raise IndexError(
+                f"The length of the boolean mask {len(mask)} does not match "
+                f"the length of the DataFrame {len(self)}"
+            )
+
+        indices = pc.indices_nonzero(mask.fill_null(False))
+        return self._get_items_by_location(indices, self.schema.copy())
+
+    def _get_columns(self: _T, keys: Iterable[str]) -> _T:
+        schema = pt.record({key: self.schema[key].copy() for key in keys})
+        return self._copy(schema)
+
     def _set_slice_by_location(self, key: slice, value: "DataFrame") -> None:
         for name, column in self._columns.items():
             column.loc[key] = value[name]
@@ -513,6 +580,12 @@ class DataFrame(Container):
                 record_keys = list(record_key[key])
             self.operations.append(DeleteData(record_keys))
 
+    def _is_loaded(self) -> bool:
+        return all(
+            column._is_loaded()  # pylint: disable=protected-access
+            for column in self._columns.values()
+        )
+
     def _setitem(self, key: str, value: Union[Iterable[Any], _C]) -> None:
         root = self if self._root is None else self._root
         if isinstance(value, Container):
@@ -757,6 +830,52 @@ class DataFrame(Container):
         for key in self.schema:
             yield key, self._columns[key]
 
+    def filter(
+        self: _T,
+        items: Optional[Iterable[str]] = None,
+        like: Optional[str] = None,
+        regex: Optional[str] = None,
+    ) -> _T:
+        """Select the columns of the DataFrame according to the column names.
+
+        Only one of the arguments can be given.
+
+        Arguments:
+            items: The names of the columns to keep, in the given order.
+            like: Keep the columns whose names contain this string.
+            regex: Keep the columns whose names match this regular expression by ``re.search``.
+
+        Returns:
+            The DataFrame with the selected columns.
+
+        Raises:
+            TypeError: When not exactly one of the arguments is given.
+
+        Examples:
+            >>> df = DataFrame([{"filename": "a.jpg", "x": 1, "y": 2}])
+            >>> df.filter(items=["y", "x"])
+               y  x
+            0  2  1
+            >>> df.filter(regex="^[xy]$")
+               x  y
+            0  1  2
+
+        """
+        if sum(argument is not None for argument in (items, like, regex)) != 1:
+            raise TypeError("Keyword arguments 'items', 'like', or 'regex' are mutually exclusive")
+
+        if items is not None:
+            keys: Iterable[str] = [key for key in items if key in self.schema]
+        elif like is not None:
+            keys = [key for key in self.schema if like in key]
+        elif regex is not None:
+            pattern = re.compile(regex)
+            keys = [key for key in self.schema if pattern.search(key)]
+        else:
+            raise TypeError("Keyword arguments 'items', 'like', or 'regex' are mutually exclusive")
+
+        return self._get_columns(keys)
+
     def head(self: _T, n: int = 5) -> _T:
         """Return the first `n` rows.
 
@@ -976,18 +1095,55 @@ class DataFrame(Container):
 
         return df
 
+    def _get_execution_mode(
+        self, operation: str, is_online_available: bool, is_loaded: Optional[bool] = None
+    ) -> Mode:
+        if is_loaded is None:
+            is_loaded = self._is_loaded()
+
+        mode = engine.get_execution_mode(is_loaded, is_online_available)
+        if mode == Mode.ONLINE and not is_online_available:
+            raise TypeError(f"Online '{operation}' is not supported for this DataFrame")
+
+        return mode
+
+    def _get_column_arrays(self, keys: Sequence[Tuple[str, ...]], operation: str) -> List[pa.Array]:
+        columns: List[Any] = []
+        for key in keys:
+            column: Any = self
+            for name in key:
+                column = column[name]
+            columns.append(column)
+
+        # Only the given columns are requested by one search, the search is reused by its criteria.
+        search_creator = self.search_creator
+        is_online_available = search_creator is not None and not self.operations
+        # pylint: disable=protected-access
+        is_loaded = all(column._is_loaded() for column in columns)
+        if self._get_execution_mode(operation, is_online_available, is_loaded) == Mode.LOCAL:
+            getter = get_container_getter(self)
+        else:
+            assert search_creator is not None
+            exprs = [f"$.{'.'.join(key)}" for key in keys]
+            search_history = search_creator({"select": exprs})  # pylint: disable=not-callable
+            schema = _get_projected_schema(keys, [column.schema.copy() for column in columns])
+            getter = get_container_getter(search_history.run(schema))
+
+        return [getter(f"$.{'.'.join(key)}") for key in keys]
+
     def query(self, func: Callable[[Any], Any]) -> "DataFrame":
         """Query the columns of a DataFrame with a lambda function.
 
+        The query is executed locally by the pyarrow compute kernels when the DataFrame is loaded,
+        modified locally or not in a Commit, otherwise it is executed online. Use
+        ``engine.local()`` or ``engine.online()`` with block to force the execution mode.
+
         Arguments:
             func: The query function.
 
         Returns:
             The query result DataFrame.
 
-        Raises:
-            TypeError: When the DataFrame is not in a Commit.
-
         Examples:
             >>> df = DataFrame([
             ...     {"filename": "a.jpg", "box2ds": {"x": 1, "y": 1}},
@@ -999,15 +1155,13 @@ class DataFrame(Container):
             0   a.jpg    1      1
 
         """
-        if engine.mode != Mode.ONLINE:
-            raise TypeError(
-                "Only online mode is supported now, "
-                "Please use 'engine.online' with block to enable the online mode."
-            )
-        if self.search_creator is None:
-            raise TypeError("'query' is not supported for the DataFrame not in a Commit")
-
         result = func(SqlRowSeries(self.schema))
+        search_creator = self.search_creator
+        is_online_available = search_creator is not None and not self.operations
+        if self._get_execution_mode("query", is_online_available) == Mode.LOCAL:
+            mask = broadcast(evaluate(result.expr, get_container_getter(self)), len(self))
+            return self._get_items_by_mask(mask)
+
         if self.search_history is None:
             criteria = {"where": result.expr}
         else:
@@ -1020,25 +1174,23 @@ class DataFrame(Container):
                 }
             }
 
-        search_history = self.search_creator(criteria)  # pylint: disable=not-callable
-        search_history.schema = self.schema.copy()  # type: ignore[assignment]
-
-        df = search_history.run()
+        assert search_creator is not None
+        search_history = search_creator(criteria)  # pylint: disable=not-callable
+        df = search_history.run(self.schema.copy())
         df.search_history = search_history
         return df
 
     def apply(self, func: Callable[[Any], Any]) -> Container:
         """Apply a function to the DataFrame row by row.
 
+        The function is executed in the same mode as :meth:`DataFrame.query`.
+
         Arguments:
             func: Function to apply to each row.
 
         Returns:
             The apply result DataFrame or Series.
 
-        Raises:
-            TypeError: When the DataFrame is not in a Commit.
-
         Examples:
             >>> df = DataFrame([
             ...     {"filename": "a.jpg", "box2ds": {"x": 1, "y": 1}},
@@ -1051,26 +1203,170 @@ class DataFrame(Container):
             1   b.jpg    3      2
 
         """
-        if engine.mode != Mode.ONLINE:
-            raise TypeError(
-                "Only online mode is supported now, "
-                "Please use 'engine.online' with block to enable the online mode."
-            )
-        if self.search_creator is None:
-            raise TypeError("'apply' is not supported for the DataFrame not in a Commit")
-
         result = func(SqlRowSeries(self.schema))
+        schema: Any = pt.record({APPLY_KEY: pt.array(result.schema)})
+        search_creator = self.search_creator
+        is_online_available = search_creator is not None and not self.operations
+        if self._get_execution_mode("apply", is_online_available) == Mode.LOCAL:
+            values = broadcast(evaluate(result.expr, get_container_getter(self)), len(self))
+            if not pa.types.is_list(values.type):
+                # The online result wraps the value of every row in an array, so does the local one.
+                offsets = pa.array(range(len(values) + 1), pa.int32())
+                values = pa.ListArray.from_arrays(offsets, values)
+
+            patype = schema[APPLY_KEY].to_pyarrow(_to_backend=True)
+            if values.type != patype:
+                values = values.cast(patype)
+
+            array = pa.StructArray.from_arrays([values], [APPLY_KEY])
+            return DataFrame._from_pyarrow(array, schema)[APPLY_KEY]
+
         search_history = self.search_history
         criteria = {} if search_history is None else search_history.criteria.copy()
         criteria["select"] = [{APPLY_KEY: result.expr}]
 
-        search_history = self.search_creator(criteria)  # pylint: disable=not-callable
-        schema: Any = pt.record({APPLY_KEY: pt.array(result.schema)})
-        search_history.schema = schema
-
-        df = search_history.run()
+        assert search_creator is not None
+        search_history = search_creator(criteria)  # pylint: disable=not-callable
+        df = search_history.run(schema)
         return df[APPLY_KEY]
 
+    # The argument name "by" is kept the same as "pandas.DataFrame.sort_values".
+    def sort_values(  # pylint: disable=invalid-name
+        self, by: Union[str, Iterable[str]], ascending: bool = True
+    ) -> "DataFrame":
+        """Sort the DataFrame by the values of the given columns.
+
+        The sort of a lazy loaded sheet without local modifications is executed by the server,
+        the result is a new lazy loaded DataFrame, so only the accessed pages of the sorted
+        sheet are requested. Otherwise the DataFrame is sorted locally by the pyarrow compute
+        kernels. Use ``engine.local()`` or ``engine.online()`` with block to force the
+        execution mode, the server only supports the ascending sort.
+
+        Arguments:
+            by: The column name or the list of column names to sort by, the nested columns are
+                expressed using ``.``, e.g. ``"attribute.weather"``.
+            ascending: Whether to sort ascending or descending.
+
+        Returns:
+            The sorted DataFrame.
+
+        Raises:
+            KeyError: When the column does not exist in the DataFrame.
+
+        Examples:
+            >>> df = DataFrame([
+            ...     {"filename": "b.jpg", "score": 2},
+            ...     {"filename": "a.jpg", "score": 3},
+            ...     {"filename": "c.jpg", "score": 1},
+            ... ])
+            >>> df.sort_values("score")
+                filename  score
+            0   c.jpg     1
+            1   b.jpg     2
+            2   a.jpg     3
+
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        for key in keys:
+            schema: Any = self.schema
+            for name in key.split("."):
+                if not isinstance(schema, pt.PortexRecordBase) or name not in schema:
+                    raise KeyError(key)
+                schema = schema[name].to_builtin()
+
+        sort_creator = self.sort_creator
+        is_online_available = sort_creator is not None and ascending and not self.operations
+        if self._get_execution_mode("sort_values", is_online_available) == Mode.ONLINE:
+            assert sort_creator is not None
+            return sort_creator("|".join(keys))  # pylint: disable=not-callable
+
+        getter = get_container_getter(self)
+        order = "ascending" if ascending else "descending"
+        table = pa.table([getter(f"$.{key}") for key in keys], names=keys)
+        indices = pc.sort_indices(table, sort_keys=[(key, order) for key in keys])
+        return self._get_items_by_location(indices, self.schema.copy())
+
+    def describe(self) -> "DataFrame":
+        """Generate the descriptive statistics of the number columns.
+
+        The statistics are the count of the non-null values, the mean, the standard deviation,
+        the minimum, the 25%, 50%, 75% percentiles and the maximum. The number columns of a lazy
+        loaded sheet in a Commit are requested by one search without the other columns, and the
+        statistics are calculated by the pyarrow compute kernels.
+
+        Returns:
+            The DataFrame whose "statistic" column is the name of the statistics and whose other
+            columns are the statistics of the number columns.
+
+        Raises:
+            ValueError: When a number column is named "statistic".
+
+        Examples:
+            >>> df = DataFrame([{"score": 1}, {"score": 2}, {"score": 3}])
+            >>> df.describe()
+               statistic  score
+            0  count      3.0
+            1  mean       2.0
+            2  std        1.0
+            3  min        1.0
+            4  25%        1.5
+            5  50%        2.0
+            6  75%        2.5
+            7  max        3.0
+
+        """
+        header, data = self._flatten()
+        keys = [
+            key
+            for key, column in zip(header, data)
+            if isinstance(column, NumberSeries) and not isinstance(column, BooleanSeries)
+        ]
+        if any(key[0] == "statistic" for key in keys):
+            raise ValueError("The column 'statistic' conflicts with the names of the statistics")
+
+        arrays = self._get_column_arrays(keys, "describe") if keys else []
+        columns = [_get_statistics(array) for array in arrays]
+
+        rows = []
+        for index, name in enumerate(_STATISTICS):
+            row: Dict[str, Any] = {"statistic": name}
+            for key, statistics in zip(keys, columns):
+                target = row
+                for column_name in key[:-1]:
+                    target = target.setdefault(column_name, {})
+                target[key[-1]] = statistics[index]
+            rows.append(row)
+
+        schema = pt.record({"statistic": pt.string()})
+        schema.update(_get_projected_schema(keys, (pt.float64() for _ in keys)))
+        return DataFrame(rows, schema)
+
+
+def _get_statistics(array: pa.Array) -> List[Optional[float]]:
+    array = array.cast(pa.float64())
+    min_max = pc.min_max(array)
+    return [
+        float(len(array) - array.null_count),
+        pc.mean(array).as_py(),
+        pc.stddev(array, ddof=1).as_py(),
+        min_max["min"].as_py(),
+        *pc.quantile(array, q=[0.25, 0.5, 0.75]).to_pylist(),
+        min_max["max"].as_py(),
+    ]
+
+
+def _get_projected_schema(
+    keys: Sequence[Tuple[str, ...]], schemas: Iterable[pt.PortexType]
+) -> pt.record:
+    projected = pt.record([])
+    for key, schema in zip(keys, schemas):
+        target: Any = projected
+        for name in key[:-1]:
+            target = target.setdefault(name, pt.record([]))
+        target[key[-1]] = schema
+
+    return projected
+
 
 def _generate_file_extractor(
     schema: pt.PortexRecordBase, base_extrator: Callable[[DataFrame], Any] = lambda df: df
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The local execution of the search expressions with the pyarrow compute kernels."""
+
+from functools import partial
+from itertools import accumulate, chain
+from typing import Any, Callable, Dict
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import graviti.portex as pt
+from graviti.dataframe.column.series import PyarrowSeries
+from graviti.dataframe.container import Container
+from graviti.dataframe.sql.operator import _Args, _Expr
+from graviti.exception import CriteriaError
+
+_Getter = Callable[[str], pa.Array]
+_Kernel = Callable[[_Getter, _Args], Any]
+
+KERNELS: Dict[str, _Kernel] = {}
+
+
+class KernelRegister:
+    """The class decorator to connect operator name and the local kernel function.
+
+    Arguments:
+        names: The names of the operator.
+
+    """
+
+    def __init__(self, *names: str) -> None:
+        self._names = names
+
+    def __call__(self, kernel: _Kernel) -> _Kernel:
+        """Connect the local kernel function with the operator names.
+
+        Arguments:
+            kernel: The kernel function needs to be registered.
+
+        Returns:
+            The input kernel function unchanged.
+
+        """
+        for name in self._names:
+            KERNELS[name] = kernel
+
+        return kernel
+
+
+def evaluate(expr: _Expr, getter: _Getter) -> Any:
+    """Evaluate the Graviti criteria expr with the pyarrow compute kernels.
+
+    Arguments:
+        expr: The Graviti criteria expr.
+        getter: The function to get the pyarrow array by the column expression like "$.a.b".
+
+    Returns:
+        The result pyarrow array, or the scalar when the expr does not refer to any column.
+
+    Raises:
+        CriteriaError: When the operator is not supported by the local engine.
+
+    """
+    if isinstance(expr, str) and expr.startswith("$."):
+        return getter(expr)
+
+    if isinstance(expr, dict):
+        name, args = expr.copy().popitem()
+        try:
+            kernel = KERNELS[name]
+        except KeyError as error:
+            raise CriteriaError(
+                f"Operator '{name}' is not supported by the local engine"
+            ) from error
+
+        return kernel(getter, args)
+
+    return expr
+
+
+def broadcast(value: Any, length: int) -> pa.Array:
+    """Broadcast the evaluated value to a pyarrow array with the given length.
+
+    Arguments:
+        value: The value returned by :func:`evaluate`.
+        length: The length of the result array.
+
+    Returns:
+        The input value itself when it is an array, otherwise the array repeating it.
+
+    """
+    if isinstance(value, pa.Array):
+        return value
+
+    if isinstance(value, pa.Scalar):
+        return pa.array([value.as_py()] * length, value.type)
+
+    return pa.array([value] * length)
+
+
+def get_container_getter(container: Container) -> _Getter:
+    """Get the function to get the pyarrow arrays of the columns in the container.
+
+    Every column is converted once, the pyarrow columns are gathered without copying and the
+    others are converted from their backend python values.
+
+    Arguments:
+        container: The DataFrame which the column expressions refer to.
+
+    Returns:
+        The function to get the pyarrow array by the column expression like "$.a.b".
+
+    """
+    arrays: Dict[str, pa.Array] = {}
+
+    def getter(expr: str) -> pa.Array:
+        array = arrays.get(expr)
+        if array is not None:
+            return array
+
+        column: Any = container
+        for name in expr[2:].split("."):
+            if not isinstance(column.schema, pt.PortexRecordBase) or name not in column.schema:
+                raise CriteriaError(f"Failed to get the column from expression '{expr}'")
+            column = column[name]
+
+        if isinstance(column, PyarrowSeries):
+            # pylint: disable=protected-access
+            array = column._data.to_pyarrow().combine_chunks()
+        else:
+            array = pa.array(
+                column.to_pylist(_to_backend=True), column.schema.to_pyarrow(_to_backend=True)
+            )
+
+        arrays[expr] = array
+        return array
+
+    return getter
+
+
+def _get_array_getter(array: pa.Array) -> _Getter:
+    # The expressions inside the array operators refer to the items with "$." prefix.
+    def getter(expr: str) -> pa.Array:
+        if expr == "$.":
+            return array
+
+        result = array
+        for name in expr[2:].split("."):
+            index = result.type.get_field_index(name) if pa.types.is_struct(result.type) else -1
+            if index == -1:
+                raise CriteriaError(f"Failed to get the array items from expression '{expr}'")
+            result = result.flatten()[index]
+
+        return result
+
+    return getter
+
+
+def _to_comparable(value: Any) -> Any:
+    # The temporal literals are converted to integers when building the search expressions.
+    if isinstance(value, pa.Array) and pa.types.is_temporal(value.type):
+        return value.cast(pa.int32() if value.type.bit_width == 32 else pa.int64())
+
+    return value
+
+
+def _to_float(value: Any) -> Any:
+    return value.cast(pa.float64()) if isinstance(value, pa.Array) else float(value)
+
+
+def _binary(function: Callable[[Any, Any], Any], getter: _Getter, args: _Args) -> Any:
+    left, right = (_to_comparable(evaluate(arg, getter)) for arg in args)
+    return function(left, right)
+
+
+def _scatter(positions: pa.Array, values: pa.Array, length: int) -> pa.Array:
+    # Put the values of the given row positions into an array, the other rows are null.
+    indices = pc.index_in(pa.array(range(length), pa.int64()), value_set=positions.cast(pa.int64()))
+    return values.take(indices)
+
+
+@KernelRegister("$div")
+def _div(getter: _Getter, args: _Args) -> Any:
+    left, right = (_to_float(evaluate(arg, getter)) for arg in args)
+    return pc.divide(left, right)
+
+
+@KernelRegister("$mod")
+def _mod(getter: _Getter, args: _Args) -> Any:
+    # pyarrow has no modulo kernel, the result follows the sign of the divisor like python.
+    left, right = (evaluate(arg, getter) for arg in args)
+    quotient = pc.floor(pc.divide(_to_float(left), _to_float(right)))
+    return pc.subtract(left, pc.multiply(right, quotient))
+
+
+@KernelRegister("$size")
+def _size(getter: _Getter, args: _Args) -> pa.Array:
+    return pc.list_value_length(evaluate(args[0], getter))
+
+
+def _aggregate(function: str, getter: _Getter, args: _Args) -> pa.Array:
+    lists = evaluate(args[0], getter)
+    table = pa.table({"parent": pc.list_parent_indices(lists), "value": pc.list_flatten(lists)})
+    groups = table.group_by("parent").aggregate([("value", function)])
+    # The grouped columns have no chunk when no list has items.
+    parents = groups["parent"].combine_chunks()
+    return _scatter(parents, groups[f"value_{function}"].combine_chunks(), len(lists))
+
+
+def _match(is_any: bool, getter: _Getter, args: _Args) -> pa.Array:
+    lists = evaluate(args[0], getter)
+    items = pc.list_flatten(lists)
+    matched = broadcast(evaluate(args[1], _get_array_getter(items)), len(items)).fill_null(False)
+
+    # "any" is true for the rows with a matched item, "all" is false for the rows with a missed one.
+    parents = pc.list_parent_indices(lists).filter(matched if is_any else pc.invert(matched))
+    result = pc.is_in(pa.array(range(len(lists)), pa.int64()), value_set=parents.cast(pa.int64()))
+    return result if is_any else pc.invert(result)
+
+
+@KernelRegister("$filter")
+def _filter(getter: _Getter, args: _Args) -> pa.ListArray:
+    lists = evaluate(args[0], getter)
+    items = pc.list_flatten(lists)
+    kept = broadcast(evaluate(args[1], _get_array_getter(items)), len(items)).fill_null(False)
+
+    counts = pc.value_counts(pc.list_parent_indices(lists).filter(kept))
+    lengths = _scatter(counts.field("values"), counts.field("counts"), len(lists)).fill_null(0)
+    offsets = pa.array(accumulate(chain((0,), lengths.to_pylist())), pa.int32())
+    return pa.ListArray.from_arrays(offsets, items.filter(kept))
+
+
+_BINARY_FUNCTIONS: Dict[str, Callable[[Any, Any], Any]] = {
+    "$and": pc.and_kleene,
+    "$or": pc.or_kleene,
+    "$eq": pc.equal,
+    "$ne": pc.not_equal,
+    "$gt": pc.greater,
+    "$gte": pc.greater_equal,
+    "$lt": pc.less,
+    "$lte": pc.less_equal,
+    "$add": pc.add,
+    "$sub": pc.subtract,
+    "$mult": pc.multiply,
+    "$pow": pc.power,
+}
+
+for _name, _function in _BINARY_FUNCTIONS.items():
+    KERNELS[_name] = partial(_binary, _function)
+
+for _name in ("max", "min", "sum"):
+    KERNELS[f"${_name}"] = partial(_aggregate, _name)
+
+KERNELS["$any_match"] = partial(_match, True)
+KERNELS["$all_match"] = partial(_match, False)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+import pytest
+
+import graviti.portex as pt
+from graviti import DataFrame, engine
+
+_SCHEMA = pt.record(
+    {
+        "a": pt.int32(),
+        "b": pt.int32(),
+        "arr": pt.array(pt.int32()),
+        "objs": pt.array(pt.record({"v": pt.int32()})),
+    }
+)
+
+_DATA = [
+    {"a": 7, "b": 3, "arr": [1, 5, None], "objs": [{"v": 1}, {"v": 4}]},
+    {"a": -7, "b": 3, "arr": [], "objs": []},
+    {"a": 7, "b": -3, "arr": [None], "objs": [{"v": None}]},
+    {"a": None, "b": 2, "arr": [2], "objs": [{"v": 5}, {"v": 6}]},
+]
+
+
+def _apply(df, func):
+    with engine.local():
+        return [value[0] for value in df.apply(func).to_pylist()]
+
+
+class TestCompute:
+    def test_mod(self):
+        df = DataFrame(_DATA, _SCHEMA)
+        assert _apply(df, lambda x: x["a"] % x["b"]) == [1, 2, -2, None]
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("max", [5, None, None, 2]),
+            ("min", [1, None, None, 2]),
+            ("sum", [6, None, None, 2]),
+            ("size", [3, 0, 1, 1]),
+        ],
+    )
+    def test_aggregate(self, name, expected):
+        df = DataFrame(_DATA, _SCHEMA)
+        assert _apply(df, lambda x: getattr(x["arr"], name)()) == expected
+
+    def test_aggregate_without_items(self):
+        df = DataFrame([_DATA[1], _DATA[1]], _SCHEMA)
+        assert _apply(df, lambda x: x["arr"].max()) == [None, None]
+        with engine.local():
+            assert len(df.query(lambda x: x["arr"].max() > 1)) == 0
+
+        df = DataFrame([], _SCHEMA)
+        assert _apply(df, lambda x: x["arr"].max()) == []
+        with engine.local():
+            assert len(df.query(lambda x: x["arr"].max() > 1)) == 0
+
+    def test_filter(self):
+        df = DataFrame(_DATA, _SCHEMA)
+        with engine.local():
+            result = df.apply(lambda x: x["objs"].query(lambda item: item["v"] > 3))
+
+        assert result.to_pylist() == [[{"v": 4}], [], [], [{"v": 5}, {"v": 6}]]
+
+    def test_any(self):
+        df = DataFrame(_DATA, _SCHEMA)
+        assert _apply(df, lambda x: (x["objs"]["v"] > 3).any()) == [True, False, False, True]
+
+    def test_all(self):
+        df = DataFrame(_DATA, _SCHEMA)
+        assert _apply(df, lambda x: (x["objs"]["v"] > 3).all()) == [False, True, False, True]
+
+    def test_query(self):
+        df = DataFrame(_DATA, _SCHEMA)
+        with engine.local():
+            result = df.query(lambda x: x["arr"].max() > 1)
+
+        assert result["a"].to_pylist() == [7, None]
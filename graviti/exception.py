@@ -6,9 +6,10 @@
 """Basic concepts of Graviti custom exceptions."""
 
 from subprocess import CalledProcessError
-from typing import Dict, Optional, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type, TypeVar
 
-from requests.models import Response
+if TYPE_CHECKING:
+    from requests.models import Response
 
 
 class GravitiException(Exception):
@@ -35,6 +36,14 @@ class ImageDecodeError(UtilityError):
     """This class defines the exception for the image decode errors."""
 
 
+class AudioDecodeError(UtilityError):
+    """This class defines the exception for the audio decode errors."""
+
+
+class PointCloudDecodeError(UtilityError):
+    """This class defines the exception for the point cloud decode errors."""
+
+
 class PortexError(GravitiException):
     """This is the base class for custom exceptions in Graviti portex module."""
 
@@ -138,7 +147,7 @@ class ResponseError(ManagerError):
     ERROR_CODE: Optional[str]
 
     def __init__(
-        self, message: Optional[str] = None, *, response: Optional[Response] = None
+        self, message: Optional[str] = None, *, response: Optional["Response"] = None
     ) -> None:
         super().__init__(message)
         if response is not None:
@@ -5,8 +5,8 @@
 """File module."""
 
 from graviti.file.audio import Audio, RemoteAudio
-from graviti.file.base import File, FileBase, RemoteFile
-from graviti.file.image import Image, RemoteImage
+from graviti.file.base import File, FileBase, RemoteFile, load_metadata
+from graviti.file.image import Image, RemoteImage, probe_image_sizes
 from graviti.file.point_cloud import PointCloud, RemotePointCloud
 
 __all__ = [
@@ -19,4 +19,6 @@ __all__ = [
     "RemoteFile",
     "RemoteImage",
     "RemotePointCloud",
+    "load_metadata",
+    "probe_image_sizes",
 ]
@@ -5,18 +5,82 @@
 
 """Graviti audio file class."""
 
+from graviti.file.audio_info import get_audio_info, read_audio_info
 from graviti.file.base import File, RemoteFile
 from graviti.portex import STANDARD_URL, ExternalElementResgister
 
 
-class Audio(File):
+class _AudioMixin:
+    """The lazily read audio information shared by the local and remote audio files."""
+
+    _duration: float
+    _sample_rate: int
+    _channels: int
+
+    def _load_metadata(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def duration(self) -> float:
+        """Get the duration of the audio in seconds.
+
+        Returns:
+            The duration of the audio in seconds.
+
+        """
+        self._load_metadata()
+        return self._duration
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the sample rate of the audio.
+
+        Returns:
+            The sample rate of the audio.
+
+        """
+        self._load_metadata()
+        return self._sample_rate
+
+    @property
+    def channels(self) -> int:
+        """Get the channel count of the audio.
+
+        Returns:
+            The channel count of the audio.
+
+        """
+        self._load_metadata()
+        return self._channels
+
+
+class Audio(_AudioMixin, File):
     """This class represents local audio files."""
 
-    __slots__ = ()
+    __slots__ = ("_duration", "_sample_rate", "_channels")
+
+    def _load_metadata(self) -> None:
+        if not hasattr(self, "_duration"):
+            self._duration, self._sample_rate, self._channels = get_audio_info(
+                self._path, self.size
+            )
+
+    def _load_post_metadata(self) -> None:
+        # The audio information is not a part of the post data, only the file size is needed.
+        File._load_metadata(self)
 
 
 @ExternalElementResgister(STANDARD_URL, "main", "file.Audio")
-class RemoteAudio(RemoteFile):
-    """This class represents remote audio files."""
+class RemoteAudio(_AudioMixin, RemoteFile):
+    """This class represents remote audio files.
+
+    The audio information is read from the header of the remote audio by range requests.
+
+    """
+
+    __slots__ = ("_duration", "_sample_rate", "_channels")
 
-    __slots__ = ()
+    def _load_metadata(self) -> None:
+        if not hasattr(self, "_duration"):
+            with self._open_range_reader() as fp:
+                self._duration, self._sample_rate, self._channels = read_audio_info(fp, self.size)
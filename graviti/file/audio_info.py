@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""Functions to get audio information from the headers."""
+
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type
+
+from _io import BufferedReader
+
+from graviti.exception import AudioDecodeError
+
+# The duration in seconds, the sample rate and the channel count.
+AudioInfo = Tuple[float, int, int]
+
+_HEADER_SIZE = 64
+
+
+def get_audio_info(path: Path, size: Optional[int] = None) -> AudioInfo:
+    """Get the duration, sample rate and channel count of the input audio file.
+
+    Arguments:
+        path: The path of the audio.
+        size: The size of the audio file, None means getting it from the file system.
+
+    Returns:
+        The duration in seconds, the sample rate and the channel count of the input audio.
+
+    """
+    if size is None:
+        size = path.stat().st_size
+
+    with path.open("rb") as fp:
+        return read_audio_info(fp, size)
+
+
+def read_audio_info(fp: BufferedReader, size: int) -> AudioInfo:
+    """Get the duration, sample rate and channel count of the audio from the binary file pointer.
+
+    Only the headers of the audio are read, the frames are never decoded.
+
+    Arguments:
+        fp: The binary file pointer of the audio.
+        size: The size of the audio file.
+
+    Returns:
+        The duration in seconds, the sample rate and the channel count of the input audio.
+
+    Raises:
+        AudioDecodeError: When the audio format is not supported.
+
+    """
+    header = fp.read(_HEADER_SIZE)
+    fp.seek(0)
+    for audio_format in _get_candidates(header):
+        if audio_format.check(header, size):
+            return audio_format.get_audio_info(header, fp, size)
+
+    raise AudioDecodeError("Only support getting the information of WAV, FLAC, MP3, OGG formats")
+
+
+class AudioFormatBase:
+    """The base class for different audio formats."""
+
+    @classmethod
+    def check(cls, header: bytes, size: int) -> bool:
+        """Check if the input header fits the current audio format.
+
+        Arguments:
+            header: The header of the audio.
+            size: The size of the audio.
+
+        Returns:
+            Whether if the input header fits the current audio format.
+
+        """
+        return cls._check(header, size)
+
+    @classmethod
+    def get_audio_info(cls, header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        """Get the duration, sample rate and channel count through the input data.
+
+        Arguments:
+            header: The header of the audio.
+            fp: The audio file pointer.
+            size: The size of the audio.
+
+        Returns:
+            The duration in seconds, the sample rate and the channel count of the audio.
+
+        Raises:
+            AudioDecodeError: When the input audio file is invalid.
+
+        """
+        try:
+            return cls._get_audio_info(header, fp, size)
+        except (struct.error, IndexError, ValueError, TypeError, ZeroDivisionError):
+            raise AudioDecodeError(f"Invalid {cls.__name__} file") from None
+
+    @staticmethod
+    def _get_audio_info(header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        raise NotImplementedError
+
+    @staticmethod
+    def _check(header: bytes, size: int) -> bool:
+        raise NotImplementedError
+
+
+class WAV(AudioFormatBase):
+    """The class for WAV audio format."""
+
+    @staticmethod
+    def _check(header: bytes, size: int) -> bool:
+        return size >= 12 and header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+
+    @staticmethod
+    def _get_audio_info(header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        # Walk the chunks after "RIFF....WAVE" until both "fmt " and "data" are found.
+        offset = 12
+        fmt: Optional[Tuple[int, int, int]] = None
+        data_size = -1
+        while offset + 8 <= size and (fmt is None or data_size < 0):
+            fp.seek(offset)
+            chunk_id, chunk_size = struct.unpack("<4sI", fp.read(8))
+            if chunk_id == b"fmt ":
+                channels, sample_rate, byte_rate = struct.unpack("<2xHII", fp.read(12))
+                fmt = channels, sample_rate, byte_rate
+            elif chunk_id == b"data":
+                data_size = min(chunk_size, size - offset - 8)
+            offset += 8 + chunk_size + (chunk_size & 1)
+
+        if fmt is None or data_size < 0:
+            raise AudioDecodeError("Invalid WAV file: 'fmt ' or 'data' chunk is missing.")
+
+        channels, sample_rate, byte_rate = fmt
+        return data_size / byte_rate, sample_rate, channels
+
+
+class FLAC(AudioFormatBase):
+    """The class for FLAC audio format."""
+
+    @staticmethod
+    def _check(header: bytes, size: int) -> bool:
+        # "fLaC" and the header of the STREAMINFO metadata block, which is always the first one.
+        return size >= 42 and header[:4] == b"fLaC" and header[4] & 0x7F == 0
+
+    @staticmethod
+    def _get_audio_info(header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        # STREAMINFO: 20 bits sample rate, 3 bits (channels - 1), 5 bits (bits per sample - 1)
+        # and 36 bits total samples, starting after the 10 bytes of the block sizes.
+        value = int.from_bytes(header[18:26], "big")
+        sample_rate = value >> 44
+        channels = ((value >> 41) & 0b111) + 1
+        total_samples = value & 0xFFFFFFFFF
+        return total_samples / sample_rate, sample_rate, channels
+
+
+class MP3(AudioFormatBase):
+    """The class for MP3 audio format."""
+
+    # The bitrates in kbps, indexed by (version is MPEG-1, layer) and the bitrate index.
+    _BITRATES = {
+        (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+        (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    }
+    # The sample rates indexed by the version bits and the sample rate index.
+    _SAMPLE_RATES = {
+        3: (44100, 48000, 32000),  # MPEG-1
+        2: (22050, 24000, 16000),  # MPEG-2
+        0: (11025, 12000, 8000),  # MPEG-2.5
+    }
+    _SEARCH_SIZE = 4096
+
+    @staticmethod
+    def _check(header: bytes, size: int) -> bool:
+        return size >= 4 and (
+            header[:3] == b"ID3" or (header[0] == 0xFF and header[1] & 0xE0 == 0xE0)
+        )
+
+    @staticmethod
+    def _get_audio_info(header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        start = MP3._get_tag_size(header)
+        fp.seek(start)
+        data = fp.read(MP3._SEARCH_SIZE)
+        for index in range(len(data) - 3):
+            if data[index] != 0xFF or data[index + 1] & 0xE0 != 0xE0:
+                continue
+
+            frame = MP3._parse_frame_header(data[index : index + 4])
+            if frame is not None:
+                break
+        else:
+            raise AudioDecodeError("Invalid MP3 file: no frame header found.")
+
+        is_mpeg1, layer, bitrate, sample_rate, channels = frame
+        samples = 384 if layer == 1 else 1152 if layer == 2 or is_mpeg1 else 576
+
+        frame_count = MP3._get_vbr_frame_count(data[index:], is_mpeg1, channels)
+        if frame_count is not None:
+            return frame_count * samples / sample_rate, sample_rate, channels
+
+        # Constant bitrate, the duration comes from the size of the audio frames.
+        return (size - start - index) * 8 / (bitrate * 1000), sample_rate, channels
+
+    @staticmethod
+    def _get_tag_size(header: bytes) -> int:
+        if header[:3] != b"ID3":
+            return 0
+
+        # The tag size is a 28 bits "syncsafe" integer, the footer flag adds 10 bytes.
+        tag_size = 0
+        for byte in header[6:10]:
+            tag_size = (tag_size << 7) | (byte & 0x7F)
+        return 10 + tag_size + (10 if header[5] & 0x10 else 0)
+
+    @staticmethod
+    def _parse_frame_header(frame: bytes) -> Optional[Tuple[bool, int, int, int, int]]:
+        version = (frame[1] >> 3) & 0b11
+        layer = 4 - ((frame[1] >> 1) & 0b11)
+        bitrate_index = frame[2] >> 4
+        sample_rate_index = (frame[2] >> 2) & 0b11
+        if version == 1 or layer == 4 or bitrate_index in {0, 15} or sample_rate_index == 3:
+            return None
+
+        is_mpeg1 = version == 3
+        bitrate = MP3._BITRATES[is_mpeg1, layer][bitrate_index]
+        sample_rate = MP3._SAMPLE_RATES[version][sample_rate_index]
+        channels = 1 if frame[3] >> 6 == 0b11 else 2
+        return is_mpeg1, layer, bitrate, sample_rate, channels
+
+    @staticmethod
+    def _get_vbr_frame_count(frame: bytes, is_mpeg1: bool, channels: int) -> Optional[int]:
+        # The "Xing"/"Info" header follows the side information of the first frame.
+        offset = 4 + (32 if channels == 2 else 17) if is_mpeg1 else 4 + (17 if channels == 2 else 9)
+        if frame[offset : offset + 4] in {b"Xing", b"Info"}:
+            flags, frame_count = struct.unpack(">II", frame[offset + 4 : offset + 12])
+            return frame_count if flags & 1 else None
+
+        # The "VBRI" header of the Fraunhofer encoder is always 32 bytes after the frame header.
+        if frame[36:40] == b"VBRI":
+            return struct.unpack(">I", frame[50:54])[0]  # type: ignore[no-any-return]
+
+        return None
+
+
+class OGG(AudioFormatBase):
+    """The class for OGG audio format with Vorbis or Opus codec."""
+
+    # The tail sizes to search the last page, a page is less than 65307 bytes.
+    _TAIL_SIZES = (4096, 65536)
+
+    @staticmethod
+    def _check(header: bytes, size: int) -> bool:
+        return size >= 27 and header[:4] == b"OggS"
+
+    @staticmethod
+    def _get_audio_info(header: bytes, fp: BufferedReader, size: int) -> AudioInfo:
+        # The first page holds only the identification header of the codec.
+        segments = header[26]
+        fp.seek(27 + segments)
+        packet = fp.read(19)
+        if packet.startswith(b"\x01vorbis"):
+            channels, sample_rate = struct.unpack("<BI", packet[11:16])
+            pre_skip, granule_rate = 0, sample_rate
+        elif packet.startswith(b"OpusHead"):
+            channels, pre_skip, sample_rate = struct.unpack("<BHI", packet[9:16])
+            # The granule position of Opus is always counted in 48kHz.
+            granule_rate = 48000
+        else:
+            raise AudioDecodeError("Invalid OGG file: only Vorbis and Opus codecs are supported.")
+
+        granule = OGG._get_last_granule(fp, size)
+        return max(granule - pre_skip, 0) / granule_rate, sample_rate, channels
+
+    @staticmethod
+    def _get_last_granule(fp: BufferedReader, size: int) -> int:
+        for tail_size in OGG._TAIL_SIZES:
+            start = max(size - tail_size, 0)
+            fp.seek(start)
+            tail = fp.read(size - start)
+            index = tail.rfind(b"OggS")
+            if index >= 0 and len(tail) >= index + 14:
+                granule: int = struct.unpack("<q", tail[index + 6 : index + 14])[0]
+                return granule
+            if start == 0:
+                break
+
+        raise AudioDecodeError("Invalid OGG file: the last page is missing.")
+
+
+_MAGIC_BYTES: Dict[bytes, Tuple[Type[AudioFormatBase], ...]] = {
+    b"RIFF": (WAV,),
+    b"fLaC": (FLAC,),
+    b"OggS": (OGG,),
+}
+
+
+def _get_candidates(header: bytes) -> Tuple[Type[AudioFormatBase], ...]:
+    # MP3 has no fixed magic bytes, it starts with an ID3 tag or a frame sync.
+    return _MAGIC_BYTES.get(header[:4], (MP3,))
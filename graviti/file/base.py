@@ -7,14 +7,16 @@
 
 import mimetypes
 from hashlib import sha1
+from io import SEEK_CUR, SEEK_END, SEEK_SET, RawIOBase
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, Type, TypeVar, Union
 
 import pyarrow as pa
 from _io import BufferedReader
 
 from graviti.portex import STANDARD_URL, ExternalElementResgister
-from graviti.utility import PathLike, ReprMixin, UserResponse, shorten
+from graviti.utility import PathLike, ReprMixin, UserResponse, shorten, submit_multithread_tasks
+from graviti.utility.profile import profile_phase
 
 if TYPE_CHECKING:
     from graviti.manager import ObjectPermissionManager
@@ -25,6 +27,104 @@ _RF = TypeVar("_RF", bound="RemoteFile")
 
 _ENCODINGS = mimetypes.encodings_map
 
+# The bytes fetched by every range request when reading the header of a remote file.
+_RANGE_BUFFER_SIZE = 4096
+
+
+class RangeReader(RawIOBase):
+    """The seekable raw binary stream which reads the bytes by range requests.
+
+    Wrap it by :class:`io.BufferedReader` to fetch the bytes block by block.
+
+    Arguments:
+        read_range: The function to read the bytes between the start and the stop offsets.
+        size: The total size of the stream.
+
+    """
+
+    def __init__(self, read_range: Callable[[int, int], bytes], size: int) -> None:
+        super().__init__()
+        self._read_range = read_range
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Return whether the stream is readable.
+
+        Returns:
+            True.
+
+        """
+        return True
+
+    def seekable(self) -> bool:
+        """Return whether the stream is seekable.
+
+        Returns:
+            True.
+
+        """
+        return True
+
+    def tell(self) -> int:
+        """Return the current stream position.
+
+        Returns:
+            The current stream position.
+
+        """
+        return self._position
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Change the stream position.
+
+        Arguments:
+            offset: The offset relative to the position indicated by whence.
+            whence: The reference position, "SEEK_SET", "SEEK_CUR" or "SEEK_END".
+
+        Returns:
+            The new stream position.
+
+        Raises:
+            ValueError: When the whence is invalid or the new position is negative.
+
+        """
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into the buffer by one range request.
+
+        Arguments:
+            buffer: The writable buffer.
+
+        Returns:
+            The number of the bytes read, 0 means the end of the stream.
+
+        """
+        start = self._position
+        stop = min(start + len(buffer), self._size)
+        if start >= stop:
+            return 0
+
+        data = self._read_range(start, stop)
+        length = len(data)
+        buffer[:length] = data
+        self._position += length
+        return length
+
 
 class FileBase(ReprMixin):
     """This class represents the file in a DataFrame."""
@@ -39,6 +139,9 @@ class FileBase(ReprMixin):
     def _to_post_data(self) -> Dict[str, Union[int, str]]:
         return {"key": self._post_key, "extension": self.extension, "size": self.size}
 
+    def _load_metadata(self) -> None:
+        """Read the metadata of the file and cache it."""
+
     @classmethod
     def _from_pyarrow(
         cls: Type[_FB],
@@ -179,6 +282,13 @@ class File(FileBase):
             self._size = self._path.stat().st_size
         return self._size
 
+    def _load_metadata(self) -> None:
+        self.size  # pylint: disable=pointless-statement
+
+    def _load_post_metadata(self) -> None:
+        """Read the metadata needed by the post data in advance."""
+        self._load_metadata()
+
     def get_checksum(self) -> str:
         """Get the sha1 checksum of the local file.
 
@@ -187,13 +297,16 @@ class File(FileBase):
 
         """
         if not hasattr(self, "_checksum"):
-            sha1_object = sha1()
-            with self._path.open("rb") as fp:
-                while True:
-                    data = fp.read(self._BUFFER_SIZE)
-                    if not data:
-                        break
-                    sha1_object.update(data)
+            with profile_phase("checksum") as record:
+                sha1_object = sha1()
+                with self._path.open("rb") as fp:
+                    while True:
+                        data = fp.read(self._BUFFER_SIZE)
+                        if not data:
+                            break
+                        sha1_object.update(data)
+                        if record is not None:
+                            record.nbytes += len(data)
 
             self._checksum = sha1_object.hexdigest()
 
@@ -256,6 +369,17 @@ class RemoteFile(FileBase):
 
         return obj
 
+    def _read_range(self, start: int, stop: int) -> bytes:
+        with self._object_permission.get_object(self._key, (start, stop)) as fp:
+            data = fp.read()
+            # The storage ignoring the "Range" header responds the whole object with status 200.
+            if fp.response.status_code != 206:
+                data = data[start:stop]
+        return data
+
+    def _open_range_reader(self) -> BufferedReader:
+        return BufferedReader(RangeReader(self._read_range, self.size), _RANGE_BUFFER_SIZE)
+
     def open(self) -> UserResponse:
         """Return the binary file pointer of this file.
 
@@ -264,3 +388,25 @@ class RemoteFile(FileBase):
 
         """
         return self._object_permission.get_object(self._key)
+
+
+def load_metadata(files: Iterable[FileBase], jobs: int = 8) -> None:
+    """Read the metadata of the files concurrently and cache it in the files.
+
+    The metadata, like the height and width of the images, the duration of the audios and the
+    point count of the point clouds, is read from the headers of the files. The remote files
+    fetch the headers by range requests, and the height and width of the remote images given by
+    the server are refreshed by the probed ones.
+
+    Examples:
+        >>> load_metadata(df["audio"])
+        >>> df["audio"][0].duration
+
+    Arguments:
+        files: The files, like a :class:`~graviti.dataframe.column.series.FileSeries`.
+        jobs: The number of the max workers in multi-thread operation.
+
+    """
+    submit_multithread_tasks(
+        lambda file: file._load_metadata(), files, jobs=jobs  # pylint: disable=protected-access
+    )
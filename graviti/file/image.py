@@ -6,12 +6,12 @@
 """Graviti image file class."""
 
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Type, TypeVar, Union
 
 import pyarrow as pa
 
-from graviti.file.base import File, RemoteFile
-from graviti.file.image_size import get_image_size
+from graviti.file.base import File, RemoteFile, load_metadata
+from graviti.file.image_size import get_image_size, read_image_size
 from graviti.portex import STANDARD_URL, ExternalElementResgister
 
 if TYPE_CHECKING:
@@ -59,6 +59,10 @@ class Image(File):
         post_data["width"] = self.width
         return post_data
 
+    def _load_metadata(self) -> None:
+        if not hasattr(self, "_height"):
+            self._height, self._width = get_image_size(self._path, self.size)
+
     @property
     def height(self) -> int:
         """Get the height of the image.
@@ -67,8 +71,7 @@ class Image(File):
             The height of the image.
 
         """
-        if not hasattr(self, "_height"):
-            self._height, self._width = get_image_size(self.path)
+        self._load_metadata()
         return self._height
 
     @property
@@ -79,8 +82,7 @@ class Image(File):
             The width of the image.
 
         """
-        if not hasattr(self, "_width"):
-            self._height, self._width = get_image_size(self.path)
+        self._load_metadata()
         return self._width
 
 
@@ -159,3 +161,38 @@ class RemoteImage(RemoteFile):
 
         """
         return self._width
+
+    def _load_metadata(self) -> None:
+        self.probe_size()
+
+    def probe_size(self) -> Tuple[int, int]:
+        """Read the height and width from the header of the remote image.
+
+        Only the first few KB of the image are fetched by range requests, the formats whose size
+        lies further in, like JPEG, fetch the following blocks as needed. The height and width of
+        this image are refreshed by the probed ones.
+
+        Returns:
+            The height and width of the remote image.
+
+        """
+        with self._open_range_reader() as fp:
+            self._height, self._width = read_image_size(fp, self.size)
+
+        return self._height, self._width
+
+
+def probe_image_sizes(images: Iterable[RemoteImage], jobs: int = 8) -> None:
+    """Probe the height and width of the remote images concurrently.
+
+    It is the same as :func:`~graviti.file.base.load_metadata` on the remote images.
+
+    Examples:
+        >>> probe_image_sizes(df["image"])
+
+    Arguments:
+        images: The remote images, like a :class:`~graviti.dataframe.column.series.FileSeries`.
+        jobs: The number of the max workers in multi-thread operation.
+
+    """
+    load_metadata(images, jobs)
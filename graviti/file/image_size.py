@@ -7,7 +7,7 @@
 
 import struct
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Optional, Tuple, Type
 
 from _io import BufferedReader
 
@@ -24,24 +24,45 @@ except ModuleNotFoundError:
     )
 
 
-def get_image_size(path: Path) -> Tuple[int, int]:
+def get_image_size(path: Path, size: Optional[int] = None) -> Tuple[int, int]:
     """Get the height and width of the input image file.
 
     Arguments:
         path: The path of the image.
+        size: The size of the image file, None means getting it from the file system.
 
     Returns:
         The height and width of the input image.
 
     """
+    if size is None:
+        size = path.stat().st_size
+
     with path.open("rb") as fp:
-        header = fp.read(26)
-        fp.seek(0)
-        for image_format in ImageFormatBase.__subclasses__():
-            if image_format.check(header, path.stat().st_size):
-                return image_format.get_image_size(header, fp)
+        return read_image_size(fp, size)
+
+
+def read_image_size(fp: BufferedReader, size: int) -> Tuple[int, int]:
+    """Get the height and width of the image from the binary file pointer.
+
+    The parsers only read the header of the image, so the file pointer which reads the remote
+    image by range requests only fetches the first few KB.
+
+    Arguments:
+        fp: The binary file pointer of the image.
+        size: The size of the image file.
+
+    Returns:
+        The height and width of the input image.
+
+    """
+    header = fp.read(26)
+    fp.seek(0)
+    for image_format in _get_candidates(header):
+        if image_format.check(header, size):
+            return image_format.get_image_size(header, fp)
 
-    return Image.open(path).size  # type: ignore[no-any-return]
+    return Image.open(fp).size  # type: ignore[no-any-return]
 
 
 class ImageFormatBase:
@@ -330,3 +351,25 @@ class FLIF(ImageFormatBase):
             result |= value << (i * 7)
 
         return result, len(values)
+
+
+# The PNG formats are matched by the 2nd to 4th bytes, the others are matched by the first 2 bytes.
+# No first 2 bytes of the others has "P" as the 2nd byte, so the two kinds never conflict.
+_PNG_FORMATS: Tuple[Type[ImageFormatBase], ...] = (PNG, OldPNG)
+_MAGIC_BYTES: Dict[bytes, Tuple[Type[ImageFormatBase], ...]] = {
+    b"\377\330": (JPEG,),
+    b"GI": (GIF,),
+    b"\x00\x00": (JPEG2000, ICO),
+    b"BM": (BMP,),
+    b"II": (TIFF,),
+    b"MM": (TIFF,),
+    b"RI": (WebP,),
+    b"FL": (FLIF,),
+}
+
+
+def _get_candidates(header: bytes) -> Tuple[Type[ImageFormatBase], ...]:
+    if header[1:4] == b"PNG":
+        return _PNG_FORMATS
+
+    return _MAGIC_BYTES.get(header[:2], ())
@@ -5,14 +5,85 @@
 
 """Graviti point cloud file class."""
 
+from typing import TYPE_CHECKING, Tuple, Union
+
+import pyarrow as pa
+
+from graviti.exception import PointCloudDecodeError
 from graviti.file.base import File, RemoteFile
+from graviti.file.point_cloud_info import get_point_cloud_info, read_point_cloud_info
+from graviti.file.point_cloud_loader import decode_point_cloud, load_point_cloud, to_pyarrow
 from graviti.portex import STANDARD_URL, ExternalElementResgister
 
+if TYPE_CHECKING:
+    import numpy
+
+
+class _PointCloudMixin:
+    """The lazily read point cloud information shared by the local and remote point clouds."""
+
+    _point_count: int
+    _fields: Tuple[str, ...]
+
+    def _load_metadata(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def point_count(self) -> int:
+        """Get the point count of the point cloud.
+
+        Returns:
+            The point count of the point cloud.
 
-class PointCloud(File):
+        """
+        self._load_metadata()
+        return self._point_count
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Get the field names of the points, like ("x", "y", "z", "intensity").
+
+        Returns:
+            The field names of the points.
+
+        """
+        self._load_metadata()
+        return self._fields
+
+
+class PointCloud(_PointCloudMixin, File):
     """This class represents local point cloud files."""
 
-    __slots__ = ()
+    __slots__ = ("_point_count", "_fields")
+
+    def _load_metadata(self) -> None:
+        if not hasattr(self, "_point_count"):
+            self._point_count, self._fields = get_point_cloud_info(self._path, self.size)
+
+    def _load_post_metadata(self) -> None:
+        # The point cloud information is not a part of the post data, only the file size is needed.
+        File._load_metadata(self)
+
+    def load(self, to_pyarrow_table: bool = False) -> Union["numpy.ndarray", pa.Table]:
+        """Load the points of the local point cloud.
+
+        The binary PCD and the KITTI style ".bin" files are memory-mapped, only the header is
+        parsed and the points are not copied until they are accessed. Numpy is needed.
+
+        Examples:
+            >>> points = PointCloud("000000.bin").load()
+            >>> points["x"]
+
+        Arguments:
+            to_pyarrow_table: Whether to return a pyarrow table instead of a numpy array.
+
+        Returns:
+            The structured numpy array or the pyarrow table whose fields are the fields of
+            the points.
+
+        """
+        points = load_point_cloud(self._path, self.extension)
+        return to_pyarrow(points) if to_pyarrow_table else points
 
 
 @ExternalElementResgister(
@@ -21,7 +92,55 @@ class PointCloud(File):
     "file.PointCloud",
     "file.PointCloudBin",
 )
-class RemotePointCloud(RemoteFile):
-    """This class represents remote point cloud files."""
+class RemotePointCloud(_PointCloudMixin, RemoteFile):
+    """This class represents remote point cloud files.
+
+    The point cloud information is read from the header of the remote point cloud by range
+    requests.
+
+    """
+
+    __slots__ = ("_point_count", "_fields")
+
+    def _load_metadata(self) -> None:
+        if not hasattr(self, "_point_count"):
+            with self._open_range_reader() as fp:
+                self._point_count, self._fields = read_point_cloud_info(
+                    fp, self.size, self.extension
+                )
+
+    def load(self, to_pyarrow_table: bool = False) -> Union["numpy.ndarray", pa.Table]:
+        """Load the points of the remote point cloud.
+
+        The object is downloaded into one preallocated buffer which the returned numpy array
+        views in place, no intermediate bytes objects are created. Numpy is needed.
+
+        Arguments:
+            to_pyarrow_table: Whether to return a pyarrow table instead of a numpy array.
+
+        Returns:
+            The structured numpy array or the pyarrow table whose fields are the fields of
+            the points.
+
+        Raises:
+            PointCloudDecodeError: When the downloaded object is shorter than its size.
+
+        """
+        size = self.size
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        position = 0
+        with self.open() as fp:
+            while position < size:
+                length = fp.readinto(view[position:])
+                if not length:
+                    break
+                position += length
+
+        if position != size:
+            raise PointCloudDecodeError(
+                f"Incomplete point cloud object: {position} of {size} bytes downloaded."
+            )
 
-    __slots__ = ()
+        points = decode_point_cloud(buffer, self.extension)
+        return to_pyarrow(points) if to_pyarrow_table else points
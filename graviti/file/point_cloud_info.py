@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""Functions to get point cloud information from the headers."""
+
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from _io import BufferedReader
+
+from graviti.exception import PointCloudDecodeError
+
+# The point count and the field names.
+PointCloudInfo = Tuple[int, Tuple[str, ...]]
+
+# The KITTI velodyne ".bin" files hold the points as 4 little-endian float32.
+KITTI_FIELDS = ("x", "y", "z", "intensity")
+_KITTI_POINT_SIZE = 16
+
+_PCD_KEYWORDS = (b"#", b"VERSION", b"FIELDS")
+_PCD_MAX_HEADER_LINES = 64
+
+
+def get_point_cloud_info(path: Path, size: Optional[int] = None) -> PointCloudInfo:
+    """Get the point count and field names of the input point cloud file.
+
+    Arguments:
+        path: The path of the point cloud.
+        size: The size of the point cloud file, None means getting it from the file system.
+
+    Returns:
+        The point count and the field names of the input point cloud.
+
+    """
+    if size is None:
+        size = path.stat().st_size
+
+    if path.suffix == ".bin":
+        return _get_kitti_info(size)
+
+    with path.open("rb") as fp:
+        return read_point_cloud_info(fp, size, path.suffix)
+
+
+def read_point_cloud_info(fp: BufferedReader, size: int, extension: str) -> PointCloudInfo:
+    """Get the point count and field names of the point cloud from the binary file pointer.
+
+    The KITTI style ".bin" files have no header, the point count is computed from the file size
+    without reading the file. The PCD files are identified by the header and only the header is
+    read.
+
+    Arguments:
+        fp: The binary file pointer of the point cloud.
+        size: The size of the point cloud file.
+        extension: The extension of the point cloud file.
+
+    Returns:
+        The point count and the field names of the input point cloud.
+
+    Raises:
+        PointCloudDecodeError: When the point cloud format is not supported.
+
+    """
+    if extension == ".bin":
+        return _get_kitti_info(size)
+
+    if fp.peek(8).startswith(_PCD_KEYWORDS):
+        return _read_pcd_info(fp)
+
+    raise PointCloudDecodeError("Only support getting the information of PCD and KITTI bin formats")
+
+
+def _get_kitti_info(size: int) -> PointCloudInfo:
+    if size % _KITTI_POINT_SIZE:
+        raise PointCloudDecodeError(
+            f"Invalid KITTI bin file: the size {size} is not a multiple of {_KITTI_POINT_SIZE}."
+        )
+
+    return size // _KITTI_POINT_SIZE, KITTI_FIELDS
+
+
+def read_pcd_header(fp: BinaryIO) -> Dict[bytes, List[bytes]]:
+    """Read the header of the PCD file.
+
+    The file pointer is left at the start of the point data.
+
+    Arguments:
+        fp: The binary file pointer of the PCD file.
+
+    Returns:
+        A dict whose keys are the upper case keywords of the header lines and whose values are
+        the words after the keywords.
+
+    Raises:
+        PointCloudDecodeError: When the "FIELDS" or the "DATA" line is missing.
+
+    """
+    header: Dict[bytes, List[bytes]] = {}
+    for _ in range(_PCD_MAX_HEADER_LINES):
+        line = fp.readline()
+        if not line:
+            break
+
+        fields = line.split()
+        if not fields or fields[0].startswith(b"#"):
+            continue
+
+        keyword = fields[0].upper()
+        header[keyword] = fields[1:]
+        if keyword == b"DATA":
+            break
+
+    if b"DATA" not in header or b"FIELDS" not in header:
+        raise PointCloudDecodeError("Invalid PCD file: 'FIELDS' or 'DATA' line is missing.")
+
+    return header
+
+
+def get_pcd_point_count(header: Dict[bytes, List[bytes]]) -> int:
+    """Get the point count from the header of the PCD file.
+
+    Arguments:
+        header: The header of the PCD file.
+
+    Returns:
+        The point count.
+
+    Raises:
+        PointCloudDecodeError: When the point count is missing.
+
+    """
+    try:
+        if b"POINTS" in header:
+            return int(header[b"POINTS"][0])
+        return int(header[b"WIDTH"][0]) * int(header[b"HEIGHT"][0])
+    except (KeyError, IndexError, ValueError):
+        raise PointCloudDecodeError("Invalid PCD file: the point count is missing.") from None
+
+
+def _read_pcd_info(fp: BufferedReader) -> PointCloudInfo:
+    header = read_pcd_header(fp)
+    fields = tuple(field.decode("ascii", "replace") for field in header[b"FIELDS"])
+    return get_pcd_point_count(header), fields
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""Functions to load the points of the point cloud files."""
+
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Tuple, Union, cast
+
+import pyarrow as pa
+
+from graviti.exception import PointCloudDecodeError
+from graviti.file.point_cloud_info import KITTI_FIELDS, get_pcd_point_count, read_pcd_header
+from graviti.utility import LazyModule
+
+if TYPE_CHECKING:
+    import numpy
+
+np = LazyModule("numpy")
+
+# The PCD header is always much smaller than this, it is only used to find the data offset of the
+# downloaded buffer without copying the whole buffer.
+_MAX_HEADER_SIZE = 65536
+_PCD_TYPES = {b"F": "f", b"I": "i", b"U": "u"}
+
+
+def load_point_cloud(path: Path, extension: str) -> "numpy.ndarray":
+    """Load the points of the local point cloud file into a structured numpy array.
+
+    The binary PCD and the KITTI style ".bin" files are memory-mapped, only the header is parsed
+    and the points are never copied.
+
+    Arguments:
+        path: The path of the point cloud.
+        extension: The extension of the point cloud file.
+
+    Returns:
+        The structured numpy array whose fields are the fields of the points.
+
+    """
+    if extension == ".bin":
+        return cast("numpy.ndarray", np.memmap(path, dtype=_get_kitti_dtype(), mode="r"))
+
+    with path.open("rb") as fp:
+        header = read_pcd_header(fp)
+        dtype = _get_pcd_dtype(header)
+        count = get_pcd_point_count(header)
+        data_type = _get_data_type(header)
+        if data_type == b"ascii":
+            return _load_ascii(fp, dtype, count)
+
+        offset = fp.tell()
+
+    points = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    return cast("numpy.ndarray", points)
+
+
+def decode_point_cloud(
+    buffer: Union[bytes, bytearray, memoryview], extension: str
+) -> "numpy.ndarray":
+    """Decode the points of the point cloud from the buffer into a structured numpy array.
+
+    The binary points are viewed in place, the returned array shares the memory of the buffer.
+
+    Arguments:
+        buffer: The content of the point cloud file.
+        extension: The extension of the point cloud file.
+
+    Returns:
+        The structured numpy array whose fields are the fields of the points.
+
+    """
+    if extension == ".bin":
+        return cast("numpy.ndarray", np.frombuffer(buffer, dtype=_get_kitti_dtype()))
+
+    # Only the head of the buffer is copied to parse the header.
+    head = BytesIO(memoryview(buffer)[:_MAX_HEADER_SIZE].tobytes())
+    header = read_pcd_header(head)
+    dtype = _get_pcd_dtype(header)
+    count = get_pcd_point_count(header)
+    offset = head.tell()
+    if _get_data_type(header) == b"ascii":
+        return _load_ascii(BytesIO(memoryview(buffer)[offset:].tobytes()), dtype, count)
+
+    points = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return cast("numpy.ndarray", points)
+
+
+def to_pyarrow(points: "numpy.ndarray") -> pa.Table:
+    """Convert the structured numpy array of the points to a pyarrow table.
+
+    The fields with more than one element become the fixed size list columns.
+
+    Arguments:
+        points: The structured numpy array of the points.
+
+    Returns:
+        The pyarrow table whose columns are the fields of the points.
+
+    """
+    columns = {}
+    for name in _get_field_names(points.dtype):
+        column = np.ascontiguousarray(points[name])
+        if column.ndim == 1:
+            columns[name] = pa.array(column)
+        else:
+            columns[name] = pa.FixedSizeListArray.from_arrays(
+                pa.array(column.reshape(-1)), column.shape[1]
+            )
+
+    return pa.table(columns)
+
+
+def _get_field_names(dtype: "numpy.dtype") -> Tuple[str, ...]:
+    # The names of the dtype are None when it is not structured.
+    return dtype.names or ()
+
+
+def _get_kitti_dtype() -> "numpy.dtype":
+    return cast("numpy.dtype", np.dtype([(name, "<f4") for name in KITTI_FIELDS]))
+
+
+def _get_data_type(header: Dict[bytes, List[bytes]]) -> bytes:
+    data_type = header[b"DATA"][0].lower() if header[b"DATA"] else b""
+    if data_type not in {b"ascii", b"binary"}:
+        raise PointCloudDecodeError(f"Not supported PCD data type {data_type!r}")
+
+    return data_type
+
+
+def _get_pcd_dtype(header: Dict[bytes, List[bytes]]) -> "numpy.dtype":
+    fields = header[b"FIELDS"]
+    sizes = header.get(b"SIZE", [])
+    types = header.get(b"TYPE", [])
+    counts = header.get(b"COUNT", [b"1"] * len(fields))
+    if not len(fields) == len(sizes) == len(types) == len(counts):
+        raise PointCloudDecodeError("Invalid PCD file: 'FIELDS', 'SIZE', 'TYPE', 'COUNT' differ.")
+
+    descriptions: List[Tuple[Any, ...]] = []
+    names = set()
+    for index, (field, size, type_, count) in enumerate(zip(fields, sizes, types, counts)):
+        # The padding fields of PCD are all named "_", which must be unique in numpy dtype.
+        name = field.decode("ascii", "replace")
+        if name in names:
+            name = f"{name}{index}"
+        names.add(name)
+
+        try:
+            base = f"<{_PCD_TYPES[type_.upper()]}{int(size)}"
+        except (KeyError, ValueError):
+            raise PointCloudDecodeError(f"Invalid PCD field type {type_!r}{size!r}") from None
+
+        number = int(count)
+        descriptions.append((name, base) if number == 1 else (name, base, (number,)))
+
+    return cast("numpy.dtype", np.dtype(descriptions))
+
+
+def _load_ascii(fp: BinaryIO, dtype: "numpy.dtype", count: int) -> "numpy.ndarray":
+    values = np.loadtxt(fp, dtype="<f8", ndmin=2, max_rows=count)
+    points = np.empty(len(values), dtype=dtype)
+    column = 0
+    for name in _get_field_names(dtype):
+        field = points[name]
+        width = 1 if field.ndim == 1 else field.shape[1]
+        field[...] = values[:, column] if width == 1 else values[:, column : column + width]
+        column += width
+
+    return cast("numpy.ndarray", points)
@@ -15,7 +15,7 @@ from graviti.manager.permission import (
     OSSObjectPermissionManager,
     S3ObjectPermissionManager,
 )
-from graviti.manager.search import SearchHistory, SearchManager
+from graviti.manager.search import SearchHistory, SearchManager, clear_search_cache
 from graviti.manager.storage_config import StorageConfigManager
 from graviti.manager.tag import TagManager
 from graviti.manager.workspace import Workspace
@@ -39,4 +39,5 @@ __all__ = [
     "StorageConfigManager",
     "TagManager",
     "Workspace",
+    "clear_search_cache",
 ]
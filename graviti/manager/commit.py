@@ -92,7 +92,9 @@ class Commit(Sheets):  # pylint: disable=too-many-instance-attributes
     def _repr_head(self) -> str:
         return f'{self.__class__.__name__}("{self.commit_id}")'
 
-    def _list_data(self, offset: int, limit: int, sheet_name: str) -> Dict[str, Any]:
+    def _list_data(
+        self, offset: int, limit: int, sheet_name: str, order_by: Optional[str] = None
+    ) -> Dict[str, Any]:
         _workspace = self._dataset.workspace
         return list_commit_data(  # type: ignore[no-any-return]
             _workspace.access_key,
@@ -101,6 +103,7 @@ class Commit(Sheets):  # pylint: disable=too-many-instance-attributes
             self._dataset.name,
             commit_id=self.commit_id,  # type: ignore[arg-type]
             sheet=sheet_name,
+            order_by=order_by,
             offset=offset,
             limit=limit,
         )["data"]
@@ -95,7 +95,9 @@ class Draft(Sheets):  # pylint: disable=too-many-instance-attributes
     def _repr_head(self) -> str:
         return f'{self.__class__.__name__}("#{self.number}: {self.title}")'
 
-    def _list_data(self, offset: int, limit: int, sheet_name: str) -> Dict[str, Any]:
+    def _list_data(
+        self, offset: int, limit: int, sheet_name: str, order_by: Optional[str] = None
+    ) -> Dict[str, Any]:
         _workspace = self._dataset.workspace
         return list_draft_data(  # type: ignore[no-any-return]
             _workspace.access_key,
@@ -104,6 +106,7 @@ class Draft(Sheets):  # pylint: disable=too-many-instance-attributes
             self._dataset.name,
             draft_number=self.number,
             sheet=sheet_name,
+            order_by=order_by,
             offset=offset,
             limit=limit,
         )["data"]
@@ -7,65 +7,280 @@
 
 import base64
 import hmac
+import logging
 import mimetypes
+import os
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from hashlib import sha1, sha256
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from threading import Lock, Thread
+from time import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 from xml.etree import ElementTree
 
+from requests.models import Response
+
 from graviti.exception import ResponseError
 from graviti.openapi import do, get_object_permission
-from graviti.utility import UserResponse, config, convert_datetime_to_gmt
+from graviti.utility import UserResponse, config, convert_datetime_to_gmt, convert_iso_to_datetime
+from graviti.utility.audit import trace_fetch
+from graviti.utility.profile import profile_phase
 
 if TYPE_CHECKING:
     from graviti.manager import Dataset
 
+logger = logging.getLogger(__name__)
+
 _EXPIRED_IN_SECOND = 600
+# The permission is refreshed in the background when it expires within this time.
+_REFRESH_AHEAD_IN_SECOND = 60
+_S3_SIGNED_HEADERS = "host;x-amz-content-sha256;x-amz-date;x-amz-security-token"
+
+
+def _get_object(
+    key: str,
+    verb: str,
+    url: str,
+    byte_range: Optional[Tuple[int, int]],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    if byte_range is not None:
+        start, stop = byte_range
+        headers = {**headers} if headers else {}
+        headers["Range"] = f"bytes={start}-{stop - 1}"
+
+    with trace_fetch("object", key) as record:
+        response = do(verb, url, timeout=config.timeout, stream=True, headers=headers)
+        if record is not None:
+            record.nbytes = int(response.headers.get("Content-Length", 0))
+
+    return response
+
+
+def _request_permission(  # pylint: disable=too-many-arguments
+    access_key: str,
+    url: str,
+    workspace: str,
+    dataset: str,
+    actions: str,
+    preparer: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> Tuple[Dict[str, Any], float]:
+    requested_at = time()
+    response = get_object_permission(
+        access_key,
+        url,
+        workspace,
+        dataset,
+        actions=actions,
+        is_internal=config.is_internal,
+        expired=_EXPIRED_IN_SECOND,
+    )
+
+    # Never trust the expiry time beyond the requested one, in case the local clock is skewed.
+    expire_at = requested_at + _EXPIRED_IN_SECOND
+    if "expire_at" in response:
+        expire_at = min(expire_at, convert_iso_to_datetime(response["expire_at"]).timestamp())
+
+    return preparer(response["permission"]), expire_at
+
+
+class PermissionCache:
+    """The cache of one object permission with its expiry time.
+
+    The permission is requested again in a background thread when it is about to expire, and the
+    concurrent callers which find the permission expired or invalidated share one request.
+
+    Arguments:
+        requester: A callable object to request the permission and its expiry timestamp.
+
+    """
+
+    def __init__(self, requester: Callable[[], Tuple[Dict[str, Any], float]]) -> None:
+        self._requester = requester
+        self._lock = Lock()
+        self._permission: Optional[Dict[str, Any]] = None
+        self._expire_at = 0.0
+        self._refreshing = False
+
+    def _refresh(self, stale: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            permission = self._permission
+            # Another caller has refreshed the permission while this one was waiting.
+            if permission is not None and permission is not stale and self._expire_at > time():
+                return permission
+
+            permission, self._expire_at = self._requester()
+            self._permission = permission
+            return permission
+
+    def _refresh_in_background(self, stale: Dict[str, Any]) -> None:
+        try:
+            self._refresh(stale)
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Failed to refresh the object permission in background", exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def get(self) -> Dict[str, Any]:
+        """Get the valid permission, request it when it is absent or expired.
+
+        Returns:
+            The permission.
+
+        """
+        permission = self._permission
+        if permission is None:
+            return self._refresh(None)
+
+        remaining = self._expire_at - time()
+        if remaining <= 0:
+            return self._refresh(permission)
+
+        if remaining >= _REFRESH_AHEAD_IN_SECOND:
+            return permission
+
+        # The lock is held by a request of the permission, which makes the refresh needless.
+        if not self._lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return permission
+
+        try:
+            refreshing, self._refreshing = self._refreshing, True
+        finally:
+            self._lock.release()
+
+        if not refreshing:
+            Thread(target=self._refresh_in_background, args=(permission,), daemon=True).start()
+
+        return permission
+
+    def invalidate(self, permission: Dict[str, Any]) -> None:
+        """Invalidate the permission which is rejected by the object storage.
+
+        The permission is kept when it has been refreshed already, so the concurrent callers
+        rejected by the same permission only cause one request.
+
+        Arguments:
+            permission: The rejected permission.
+
+        """
+        with self._lock:
+            if self._permission is permission:
+                self._permission = None
+
+
+@lru_cache(maxsize=64)
+def _get_signing_key(secret: str, date: str, region: str) -> bytes:
+    """Derive the AWS signature version 4 signing key, which only changes once a day.
+
+    Arguments:
+        secret: The secret access key.
+        date: The date in "YYYYMMDD" format.
+        region: The region of the bucket.
+
+    Returns:
+        The signing key.
+
+    """
+    date_key = hmac.new(f"AWS4{secret}".encode(), date.encode(), sha256).digest()
+    date_region_key = hmac.new(date_key, region.encode(), sha256).digest()
+    date_region_service_key = hmac.new(date_region_key, b"s3", sha256).digest()
+    return hmac.new(date_region_service_key, b"aws4_request", sha256).digest()
+
+
+_PERMISSION_CACHES: Dict[Tuple[Any, ...], PermissionCache] = {}
+_PERMISSION_CACHES_LOCK = Lock()
 
 
 class ObjectPermissionManager:
     """The basic structure of the object permission of the dataset.
 
+    The permissions are cached with their expiry time, and shared by all the managers of the same
+    dataset in the process.
+
     Arguments:
         dataset: Class :class:`~graviti.dataset.dataset.Dataset` instance.
 
     """
 
-    _get_permission: Optional[Dict[str, Any]] = None
-    _put_permission: Optional[Dict[str, Any]] = None
-
     def __init__(self, dataset: "Dataset") -> None:
         self._dataset = dataset
+        self._caches: Dict[str, PermissionCache] = {}
+
+    @staticmethod
+    def _prepare_permission(permission: Dict[str, Any]) -> Dict[str, Any]:
+        return permission
+
+    def _get_cache(self, actions: str) -> PermissionCache:
+        cache = self._caches.get(actions)
+        if cache is not None:
+            return cache
 
-    def _request_permission(self, actions: str) -> Dict[str, str]:
         _workspace = self._dataset.workspace
-        return get_object_permission(  # type: ignore[no-any-return]
-            _workspace.access_key,
+        key = (
+            os.getpid(),
             _workspace.url,
+            _workspace.access_key,
             _workspace.name,
             self._dataset.name,
-            actions=actions,
-            is_internal=config.is_internal,
-            expired=_EXPIRED_IN_SECOND,
-        )["permission"]
+            actions,
+            config.is_internal,
+        )
+        with _PERMISSION_CACHES_LOCK:
+            cache = _PERMISSION_CACHES.get(key)
+            if cache is None:
+                cache = PermissionCache(
+                    partial(
+                        _request_permission,
+                        _workspace.access_key,
+                        _workspace.url,
+                        _workspace.name,
+                        self._dataset.name,
+                        actions,
+                        self._prepare_permission,
+                    )
+                )
+                _PERMISSION_CACHES[key] = cache
+
+        self._caches[actions] = cache
+        return cache
+
+    def _clear_get_permission(self, permission: Dict[str, Any]) -> None:
+        """Clear the get permission.
+
+        Arguments:
+            permission: The get permission rejected by the object storage.
+
+        """
+        self._get_cache("GET").invalidate(permission)
 
-    def _clear_get_permission(self) -> None:
-        """Clear the get permission."""
-        delattr(self, "_get_permission")
+    def _clear_put_permission(self, permission: Dict[str, Any]) -> None:
+        """Clear the put permission.
 
-    def _clear_put_permission(self) -> None:
-        """Clear the put permission."""
-        delattr(self, "_put_permission")
+        Arguments:
+            permission: The put permission rejected by the object storage.
+
+        """
+        self._get_cache("PUT").invalidate(permission)
+
+    def _init_get_permission(self) -> Dict[str, Any]:
+        """Initialize and return the get permission.
+
+        Returns:
+            The get permission.
+
+        """
+        return self._get_cache("GET").get()
 
     def _init_put_permission(self) -> Dict[str, Any]:
         """Initialize and return the put permission.
 
-        Raises:
-            NotImplementedError: The method of the base class should not be called.
+        Returns:
+            The put permission.
 
         """
-        raise NotImplementedError
+        return self._get_cache("PUT").get()
 
     @property
     def prefix(self) -> str:
@@ -77,11 +292,15 @@ class ObjectPermissionManager:
         """
         return self._init_put_permission()["prefix"]  # type: ignore[no-any-return]
 
-    def get_object(self, key: str, _allow_retry: bool = True) -> UserResponse:
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None, _allow_retry: bool = True
+    ) -> UserResponse:
         """Get the object from graviti.
 
         Arguments:
             key: The key of the file.
+            byte_range: The start and the stop (exclusive) offsets of the bytes to get,
+                None means getting the whole object.
             _allow_retry: Whether requesting the get permission again is allowed.
 
         Raises:
@@ -110,37 +329,19 @@ class OSSObjectPermissionManager(ObjectPermissionManager):
 
     _RETRY_CODE = {"InvalidAccessKeyId", "AccessDenied"}
 
-    def _init_get_permission(self) -> Dict[str, Any]:
-        """Initialize and return the get permission.
-
-        Returns:
-            The get permission.
-
-        """
-        if self._get_permission is None:
-            get_permission: Dict[str, Any] = self._request_permission("GET")
-            get_permission["hmac"] = hmac.new(
-                get_permission["AccessKeySecret"].encode("utf-8"),
-                digestmod=sha1,
-            )
-            self._get_permission = get_permission
-        return self._get_permission
-
-    def _init_put_permission(self) -> Dict[str, Any]:
-        """Initialize and return the put permission.
-
-        Returns:
-            The put permission.
-
-        """
-        if self._put_permission is None:
-            put_permission: Dict[str, Any] = self._request_permission("PUT")
-            put_permission["hmac"] = hmac.new(
-                put_permission["AccessKeySecret"].encode("utf-8"),
-                digestmod=sha1,
-            )
-            self._put_permission = put_permission
-        return self._put_permission
+    @staticmethod
+    def _prepare_permission(permission: Dict[str, Any]) -> Dict[str, Any]:
+        permission["hmac"] = hmac.new(
+            permission["AccessKeySecret"].encode("utf-8"),
+            digestmod=sha1,
+        )
+        # The parts of the string to sign, the authorization and the url which never change.
+        permission[
+            "resource_prefix"
+        ] = f"x-oss-security-token:{permission['SecurityToken']}\n/{permission['bucket']}/"
+        permission["authorization_prefix"] = f"OSS {permission['AccessKeyId']}:"
+        permission["url_prefix"] = f"https://{permission['bucket']}.{permission['endpoint']}/"
+        return permission
 
     @staticmethod
     def _get_headers(
@@ -152,14 +353,11 @@ class OSSObjectPermissionManager(ObjectPermissionManager):
         date = convert_datetime_to_gmt(datetime.now(timezone.utc))
         content_type = "" if mime_type is None else mime_type
 
-        signature = (
-            f"{verb}\n\n{content_type}\n{date}\n"
-            f"x-oss-security-token:{permission['SecurityToken']}\n/{permission['bucket']}/{key}"
-        )
+        signature = f"{verb}\n\n{content_type}\n{date}\n{permission['resource_prefix']}{key}"
         _hmac = permission["hmac"].copy()
         _hmac.update(signature.encode("utf-8"))
         signature = base64.b64encode(_hmac.digest()).decode("utf-8")
-        authorization = f"OSS {permission['AccessKeyId']}:{signature}"
+        authorization = f"{permission['authorization_prefix']}{signature}"
 
         headers = {
             "Authorization": authorization,
@@ -170,11 +368,15 @@ class OSSObjectPermissionManager(ObjectPermissionManager):
             headers["Content-Type"] = mime_type
         return headers
 
-    def get_object(self, key: str, _allow_retry: bool = True) -> UserResponse:
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None, _allow_retry: bool = True
+    ) -> UserResponse:
         """Get the object from OSS.
 
         Arguments:
             key: The key of the file.
+            byte_range: The start and the stop (exclusive) offsets of the bytes to get,
+                None means getting the whole object.
             _allow_retry: Whether requesting the get permission again is allowed.
 
         Raises:
@@ -188,16 +390,16 @@ class OSSObjectPermissionManager(ObjectPermissionManager):
         verb = "GET"
 
         headers = self._get_headers(permission, verb, key)
-        url = f"https://{permission['bucket']}.{permission['endpoint']}/{key}"
+        url = f"{permission['url_prefix']}{key}"
 
         try:
-            response = do(verb, url, headers=headers, timeout=config.timeout, stream=True)
+            response = _get_object(key, verb, url, byte_range, headers)
             return UserResponse(response)
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code in self._RETRY_CODE:
-                self._clear_get_permission()
-                return self.get_object(key, False)
+                self._clear_get_permission(permission)
+                return self.get_object(key, byte_range, False)
             raise error from None
 
     def put_object(self, key: str, path: Path, _allow_retry: bool = True) -> None:
@@ -217,15 +419,17 @@ class OSSObjectPermissionManager(ObjectPermissionManager):
 
         mime_type = mimetypes.guess_type(path)[0]
         headers: Dict[str, Any] = self._get_headers(permission, verb, key, mime_type)
-        url = f"https://{permission['bucket']}.{permission['endpoint']}/{key}"
+        url = f"{permission['url_prefix']}{key}"
 
         try:
-            with path.open("rb") as fp:
+            with profile_phase("put_object") as record, path.open("rb") as fp:
                 do(verb, url, headers=headers, data=fp)
+                if record is not None:
+                    record.nbytes = fp.tell()
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code in self._RETRY_CODE:
-                self._clear_put_permission()
+                self._clear_put_permission(permission)
                 self.put_object(key, path, False)
                 return
 
@@ -237,33 +441,15 @@ class AZUREObjectPermissionManager(ObjectPermissionManager):
 
     _RETRY_CODE = "AuthenticationFailed"
 
-    def _init_get_permission(self) -> Dict[str, Any]:
-        """Initialize and return the get permission.
-
-        Returns:
-            The get permission.
-
-        """
-        if self._get_permission is None:
-            self._get_permission = self._request_permission("GET")
-        return self._get_permission
-
-    def _init_put_permission(self) -> Dict[str, Any]:
-        """Initialize and return the put permission.
-
-        Returns:
-            The put permission.
-
-        """
-        if self._put_permission is None:
-            self._put_permission = self._request_permission("PUT")
-        return self._put_permission
-
-    def get_object(self, key: str, _allow_retry: bool = True) -> UserResponse:
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None, _allow_retry: bool = True
+    ) -> UserResponse:
         """Get the object from AZURE.
 
         Arguments:
             key: The key of the file.
+            byte_range: The start and the stop (exclusive) offsets of the bytes to get,
+                None means getting the whole object.
             _allow_retry: Whether requesting the get permission again is allowed.
 
         Raises:
@@ -279,13 +465,13 @@ class AZUREObjectPermissionManager(ObjectPermissionManager):
         url = f"{permission['endpoint_prefix']}/{key}?{permission['sas_param']}"
 
         try:
-            response = do(verb, url, timeout=config.timeout, stream=True)
+            response = _get_object(key, verb, url, byte_range)
             return UserResponse(response)
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code == self._RETRY_CODE:
-                self._clear_get_permission()
-                return self.get_object(key, False)
+                self._clear_get_permission(permission)
+                return self.get_object(key, byte_range, False)
 
             raise error from None
 
@@ -311,12 +497,14 @@ class AZUREObjectPermissionManager(ObjectPermissionManager):
             headers["Content-Type"] = mime_type
 
         try:
-            with path.open("rb") as fp:
+            with profile_phase("put_object") as record, path.open("rb") as fp:
                 do(verb, url, headers=headers, data=fp)
+                if record is not None:
+                    record.nbytes = fp.tell()
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code == self._RETRY_CODE:
-                self._clear_put_permission()
+                self._clear_put_permission(permission)
                 self.put_object(key, path, False)
                 return
 
@@ -329,76 +517,46 @@ class S3ObjectPermissionManager(ObjectPermissionManager):
     _RETRY_CODE = {"InvalidAccessKeyId", "AccessDenied"}
     _HASHED_PAYLOAD = {"GET": sha256(b"").hexdigest(), "PUT": "UNSIGNED-PAYLOAD"}
 
-    def _init_get_permission(self) -> Dict[str, Any]:
-        """Initialize and return the get permission.
-
-        Returns:
-            The get permission.
-
-        """
-        if self._get_permission is None:
-            get_permission: Dict[str, Any] = self._request_permission("GET")
-            get_permission["hmac"] = hmac.new(
-                f"AWS4{get_permission['AccessKeySecret']}".encode(),
-                digestmod=sha256,
+    @classmethod
+    def _prepare_permission(cls, permission: Dict[str, Any]) -> Dict[str, Any]:
+        host = f"{permission['bucket']}.{permission['endpoint']}"
+        security_token = permission["SecurityToken"]
+        # The canonical headers around the "x-amz-date" of each verb, which never change.
+        permission["canonical_headers"] = {
+            verb: (
+                f"host:{host}\nx-amz-content-sha256:{hashed_payload}\nx-amz-date:",
+                f"\nx-amz-security-token:{security_token}\n\n{_S3_SIGNED_HEADERS}\n"
+                f"{hashed_payload}",
             )
-            self._get_permission = get_permission
-        return self._get_permission
-
-    def _init_put_permission(self) -> Dict[str, Any]:
-        """Initialize and return the put permission.
-
-        Returns:
-            The put permission.
-
-        """
-        if self._put_permission is None:
-            put_permission: Dict[str, Any] = self._request_permission("PUT")
-            put_permission["hmac"] = hmac.new(
-                f"AWS4{put_permission['AccessKeySecret']}".encode(),
-                digestmod=sha256,
-            )
-            self._put_permission = put_permission
-        return self._put_permission
+            for verb, hashed_payload in cls._HASHED_PAYLOAD.items()
+        }
+        permission["scope_suffix"] = f"/{permission['region']}/s3/aws4_request"
+        permission["url_prefix"] = f"https://{host}/"
+        return permission
 
+    @staticmethod
     def _get_canonical_request(
-        self,
         permission: Dict[str, Any],
         verb: str,
         key: str,
         x_amz_date: str,
     ) -> str:
-        hashed_payload = self._HASHED_PAYLOAD[verb]
-        canonical_headers = (
-            f"host:{permission['bucket']}.{permission['endpoint']}\n"
-            f"x-amz-content-sha256:{hashed_payload}\n"
-            f"x-amz-date:{x_amz_date}\n"
-            f"x-amz-security-token:{permission['SecurityToken']}\n"
-        )
-
-        return (
-            f"{verb}\n/{key}\n\n{canonical_headers}\nhost;x-amz-content-sha256;x-amz-date;"
-            f"x-amz-security-token\n{hashed_payload}"
-        )
+        head, tail = permission["canonical_headers"][verb]
+        return f"{verb}\n/{key}\n\n{head}{x_amz_date}{tail}"
 
     @staticmethod
     def _get_string_to_sign(
         permission: Dict[str, Any], simple_date: str, x_amz_date: str, canonical_request: str
     ) -> str:
-        scope = f"{simple_date}/{permission['region']}/s3/aws4_request"
+        scope = f"{simple_date}{permission['scope_suffix']}"
         hash_canonical_request = sha256(canonical_request.encode("utf-8")).hexdigest()
         return f"AWS4-HMAC-SHA256\n{x_amz_date}\n{scope}\n{hash_canonical_request}"
 
     @staticmethod
     def _get_signature(permission: Dict[str, Any], string_to_sign: str, simple_date: str) -> str:
-        _hmac = permission["hmac"].copy()
-        _hmac.update(simple_date.encode())
-        date_region_key = hmac.new(
-            _hmac.digest(), f"{permission['region']}".encode(), sha256
-        ).digest()
-        date_region_service_key = hmac.new(date_region_key, b"s3", sha256).digest()
-        signing_key = hmac.new(date_region_service_key, b"aws4_request", sha256).digest()
-
+        signing_key = _get_signing_key(
+            permission["AccessKeySecret"], simple_date, permission["region"]
+        )
         return hmac.new(signing_key, string_to_sign.encode("utf-8"), sha256).hexdigest()
 
     def _get_headers(
@@ -417,12 +575,9 @@ class S3ObjectPermissionManager(ObjectPermissionManager):
         )
         signature = self._get_signature(permission, string_to_sign, simple_date)
 
-        credential = (
-            f"{permission['AccessKeyId']}/{simple_date}/{permission['region']}/s3/aws4_request"
-        )
+        credential = f"{permission['AccessKeyId']}/{simple_date}{permission['scope_suffix']}"
         authorization = (
-            f"AWS4-HMAC-SHA256 Credential={credential}, SignedHeaders=host;"
-            f"x-amz-content-sha256;x-amz-date;x-amz-security-token, "
+            f"AWS4-HMAC-SHA256 Credential={credential}, SignedHeaders={_S3_SIGNED_HEADERS}, "
             f"Signature={signature}"
         )
 
@@ -433,11 +588,15 @@ class S3ObjectPermissionManager(ObjectPermissionManager):
             "x-amz-date": x_amz_date,
         }
 
-    def get_object(self, key: str, _allow_retry: bool = True) -> UserResponse:
+    def get_object(
+        self, key: str, byte_range: Optional[Tuple[int, int]] = None, _allow_retry: bool = True
+    ) -> UserResponse:
         """Get the object from S3.
 
         Arguments:
             key: The key of the file.
+            byte_range: The start and the stop (exclusive) offsets of the bytes to get,
+                None means getting the whole object.
             _allow_retry: Whether requesting the get permission again is allowed.
 
         Raises:
@@ -451,16 +610,16 @@ class S3ObjectPermissionManager(ObjectPermissionManager):
         verb = "GET"
 
         headers = self._get_headers(permission, verb, key)
-        url = f"https://{permission['bucket']}.{permission['endpoint']}/{key}"
+        url = f"{permission['url_prefix']}{key}"
 
         try:
-            response = do(verb, url, headers=headers, timeout=config.timeout, stream=True)
+            response = _get_object(key, verb, url, byte_range, headers)
             return UserResponse(response)
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code in self._RETRY_CODE:
-                self._clear_get_permission()
-                return self.get_object(key, False)
+                self._clear_get_permission(permission)
+                return self.get_object(key, byte_range, False)
 
             raise error from None
 
@@ -480,18 +639,20 @@ class S3ObjectPermissionManager(ObjectPermissionManager):
         verb = "PUT"
 
         headers: Dict[str, Any] = self._get_headers(permission, verb, key)
-        url = f"https://{permission['bucket']}.{permission['endpoint']}/{key}"
+        url = f"{permission['url_prefix']}{key}"
         mime_type = mimetypes.guess_type(path)[0]
         if mime_type is not None:
             headers["Content-Type"] = mime_type
 
         try:
-            with path.open("rb") as fp:
+            with profile_phase("put_object") as record, path.open("rb") as fp:
                 do(verb, url, headers=headers, data=fp)
+                if record is not None:
+                    record.nbytes = fp.tell()
         except ResponseError as error:
             code = ElementTree.fromstring(error.response.text)[0].text
             if _allow_retry and code in self._RETRY_CODE:
-                self._clear_put_permission()
+                self._clear_put_permission(permission)
                 self.put_object(key, path, False)
                 return
 
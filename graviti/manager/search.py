@@ -5,7 +5,14 @@
 
 """The implementation of the SearchHistory and SearchManager."""
 
-from typing import TYPE_CHECKING, Any, Dict, Generator, Optional
+import json
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
+from weakref import ref
+
+import pyarrow as pa
 
 import graviti.portex as pt
 from graviti.dataframe import DataFrame
@@ -25,6 +32,7 @@ from graviti.openapi import (
     list_search_records,
 )
 from graviti.paging import LazyLowerCaseFactory
+from graviti.paging.factory import _get_executor
 from graviti.utility import (
     CachedProperty,
     ReprMixin,
@@ -36,6 +44,38 @@ from graviti.utility import (
 if TYPE_CHECKING:
     from graviti.manager.dataset import Dataset
 
+_SEARCH_HISTORIES_SIZE = 64
+_SEARCH_HISTORIES: "OrderedDict[Tuple[Any, ...], SearchHistory]" = OrderedDict()
+_SEARCH_HISTORIES_LOCK = Lock()
+
+
+def clear_search_cache() -> None:
+    """Clear the searches cached by their criteria in this process.
+
+    The searches on a commit are reused by the same criteria, clear them to release the memory or
+    to create the searches again.
+
+    """
+    with _SEARCH_HISTORIES_LOCK:
+        _SEARCH_HISTORIES.clear()
+
+
+def get_criteria_fingerprint(criteria: Dict[str, Any]) -> str:
+    """Get the fingerprint of the search criteria.
+
+    The criteria are canonicalized by sorting the keys of the objects, so the same criteria built
+    in different key orders have the same fingerprint.
+
+    Arguments:
+        criteria: The criteria of the search.
+
+    Returns:
+        The fingerprint of the search criteria.
+
+    """
+    content = json.dumps(criteria, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return sha1(content.encode("utf-8")).hexdigest()
+
 
 class SearchHistory(ReprMixin):  # pylint: disable=too-many-instance-attributes
     """This class defines the structure of the search history of Graviti Data Platform.
@@ -76,6 +116,8 @@ class SearchHistory(ReprMixin):  # pylint: disable=too-many-instance-attributes
         "created_at",
     )
 
+    _factory: Optional[Tuple[pa.DataType, "ref[LazyLowerCaseFactory]"]] = None
+
     def __init__(self, dataset: "Dataset", response: Dict[str, Any]) -> None:
         self._dataset = dataset
         self.search_id: str = response["id"]
@@ -185,31 +227,63 @@ class SearchHistory(ReprMixin):  # pylint: disable=too-many-instance-attributes
         sheet_schema = self._get_sheet_schema()
         return self._infer_schema(sheet_schema)
 
-    def run(self) -> DataFrame:
+    def _list_records(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        _dataset = self._dataset
+        _workspace = _dataset.workspace
+
+        records: List[Dict[str, Any]] = list_search_records(
+            _workspace.access_key,
+            _workspace.url,
+            _workspace.name,
+            _dataset.name,
+            search_id=self.search_id,
+            offset=offset,
+            limit=limit,
+        )["records"]
+        return records
+
+    def _create_factory(self, patype: pa.DataType) -> LazyLowerCaseFactory:
+        if "record_count" in self.__dict__:
+            record_count, first_page = self.record_count, None
+        else:
+            # The record count and the first page are independent, request them concurrently.
+            future = _get_executor().submit(self._list_records, 0, LIMIT)
+            record_count = self.record_count
+            first_page = future.result()
+
+        factory = LazyLowerCaseFactory(
+            record_count, LIMIT, self._list_records, patype, read_ahead=True
+        )
+        if first_page is not None and record_count != 0:
+            factory.add_page(0, first_page)
+
+        return factory
+
+    def run(self, schema: Optional[pt.PortexRecordBase] = None) -> DataFrame:
         """Run the search and get the result DataFrame.
 
+        Arguments:
+            schema: The schema of the search result, None means using the inferred schema.
+
         Returns:
             The search result DataFrame.
 
         """
         _dataset = self._dataset
-        _workspace = _dataset.workspace
 
-        schema = self.schema
-        factory = LazyLowerCaseFactory(
-            self.record_count,
-            LIMIT,
-            lambda offset, limit: list_search_records(
-                _workspace.access_key,
-                _workspace.url,
-                _workspace.name,
-                _dataset.name,
-                search_id=self.search_id,
-                offset=offset,
-                limit=limit,
-            )["records"],
-            schema.to_pyarrow(_to_backend=True),  # pylint: disable=no-member
-        )
+        if schema is None:
+            schema = self.schema
+        patype = schema.to_pyarrow(_to_backend=True)  # pylint: disable=no-member
+
+        # The factory holds the fetched pages, the DataFrames of the repeated runs share them.
+        # It is referenced weakly, so the pages are released with the DataFrames using them.
+        factory = None
+        if self._factory is not None and self._factory[0].equals(patype):
+            factory = self._factory[1]()
+
+        if factory is None:
+            factory = self._create_factory(patype)
+            self._factory = (patype, ref(factory))
 
         df = DataFrame._from_factory(  # pylint: disable=protected-access
             factory, schema, object_permission_manager=_dataset.object_permission_manager
@@ -270,6 +344,26 @@ class SearchManager:
     ) -> SearchHistory:
         _dataset = self._dataset
         _workspace = _dataset.workspace
+
+        # The data of a commit never changes, the searches on it are reused by the same criteria.
+        # The searches on a draft are always created since the draft data may be changed.
+        key = None
+        if commit_id is not None:
+            key = (
+                _workspace.access_key,
+                _workspace.url,
+                _workspace.name,
+                _dataset.name,
+                commit_id,
+                sheet,
+                get_criteria_fingerprint(criteria),
+            )
+            with _SEARCH_HISTORIES_LOCK:
+                search_history = _SEARCH_HISTORIES.get(key)
+                if search_history is not None:
+                    _SEARCH_HISTORIES.move_to_end(key)
+                    return search_history
+
         response = create_search_history(
             _workspace.access_key,
             _workspace.url,
@@ -280,8 +374,15 @@ class SearchManager:
             sheet=sheet,
             criteria=criteria,
         )
+        search_history = SearchHistory(_dataset, response)
 
-        return SearchHistory(_dataset, response)
+        if key is not None:
+            with _SEARCH_HISTORIES_LOCK:
+                _SEARCH_HISTORIES[key] = search_history
+                if len(_SEARCH_HISTORIES) > _SEARCH_HISTORIES_SIZE:
+                    _SEARCH_HISTORIES.popitem(last=False)
+
+        return search_history
 
     def get(self, search_id: str) -> SearchHistory:
         """Get a Graviti search history with given search id.
@@ -356,3 +457,8 @@ class SearchManager:
             self._dataset.name,
             search_id=search_id,
         )
+
+        with _SEARCH_HISTORIES_LOCK:
+            for key, search_history in list(_SEARCH_HISTORIES.items()):
+                if search_history.search_id == search_id:
+                    del _SEARCH_HISTORIES[key]
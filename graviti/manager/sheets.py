@@ -15,11 +15,11 @@ from typing import (
     KeysView,
     List,
     MutableMapping,
+    Optional,
     ValuesView,
 )
 
 import pyarrow as pa
-from tqdm.auto import tqdm
 
 import graviti.portex as pt
 from graviti.dataframe import DataFrame
@@ -76,7 +76,9 @@ class Sheets(MutableMapping[str, DataFrame], ReprMixin):
     def __iter__(self) -> Iterator[str]:
         return self._get_data().__iter__()
 
-    def _list_data(self, offset: int, limit: int, sheet_name: str) -> Dict[str, Any]:
+    def _list_data(
+        self, offset: int, limit: int, sheet_name: str, order_by: Optional[str] = None
+    ) -> Dict[str, Any]:
         raise NotImplementedError
 
     def _list_sheets(self) -> Dict[str, Any]:
@@ -89,20 +91,32 @@ class Sheets(MutableMapping[str, DataFrame], ReprMixin):
         sheet = self._get_sheet(sheet_name)
         schema = PortexRecordBase.from_yaml(sheet["schema"])
 
+        df = self._create_dataframe(sheet_name, schema, sheet["record_count"])
+        df.operations = []
+        df.sort_creator = lambda order_by: self._create_dataframe(
+            sheet_name, df.schema.copy(), len(df), order_by
+        )
+
+        return df
+
+    def _create_dataframe(
+        self,
+        sheet_name: str,
+        schema: PortexRecordBase,
+        record_count: int,
+        order_by: Optional[str] = None,
+    ) -> DataFrame:
         patype = schema.to_pyarrow(_to_backend=True)
 
         factory = LazyLowerCaseFactory(
-            sheet["record_count"],
+            record_count,
             LIMIT,
-            partial(self._list_data, sheet_name=sheet_name),
+            partial(self._list_data, sheet_name=sheet_name, order_by=order_by),
             pa.struct([pa.field(RECORD_KEY, pa.string()), *patype]),
         )
-        df = DataFrame._from_factory(  # pylint: disable=protected-access
+        return DataFrame._from_factory(  # pylint: disable=protected-access
             factory, schema, object_permission_manager=self._dataset.object_permission_manager
         )
-        df.operations = []
-
-        return df
 
     def _init_data(self) -> None:
         self._data = {}
@@ -174,6 +188,10 @@ class Sheets(MutableMapping[str, DataFrame], ReprMixin):
                 df_total += df_operation.get_data_count()
                 file_total += df_operation.get_file_count()
 
+        # tqdm is imported here to keep importing the SDK fast.
+        # pylint: disable=import-outside-toplevel
+        from tqdm.auto import tqdm
+
         # Note that after done uploading, the two process bars will switch position due to the tqdm
         # bug https://github.com/tqdm/tqdm/issues/1000.
         with tqdm(
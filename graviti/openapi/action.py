@@ -39,7 +39,7 @@ def create_action(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/actions"
     post_data = {"name": name, "payload": payload}
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_action", json=post_data
     ).json()
 
 
@@ -76,7 +76,9 @@ def list_actions(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_actions", params=params
+    ).json()
 
 
 def get_action(
@@ -101,7 +103,9 @@ def get_action(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/actions/{action}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_action"
+    ).json()
 
 
 def update_action(
@@ -142,7 +146,7 @@ def update_action(
         patch_data["payload"] = payload
 
     return open_api_do(  # type: ignore[no-any-return]
-        "PATCH", access_key, url, json=patch_data
+        "PATCH", access_key, url, operation="update_action", json=patch_data
     ).json()
 
 
@@ -165,7 +169,7 @@ def delete_action(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/actions/{action}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_action")
 
 
 def create_action_run(
@@ -196,7 +200,7 @@ def create_action_run(
     post_data = {"arguments": arguments} if arguments is not None else None
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_action_run", json=post_data
     ).json()
 
 
@@ -235,7 +239,9 @@ def list_action_runs(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_action_runs", params=params
+    ).json()
 
 
 def get_action_run(
@@ -263,7 +269,9 @@ def get_action_run(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/actions/{action}/runs/{run_number}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_action_run"
+    ).json()
 
 
 def cancel_action_run(
@@ -291,7 +299,9 @@ def cancel_action_run(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/actions/{action}/runs/{run_number}/cancel"
-    return open_api_do("POST", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "POST", access_key, url, operation="cancel_action_run"
+    ).json()
 
 
 def get_action_run_node_log(
@@ -325,4 +335,4 @@ def get_action_run_node_log(
         f"/nodes/{node_id}/logs"
     )
 
-    return open_api_do("GET", access_key, url)
+    return open_api_do("GET", access_key, url, operation="get_action_run_node_log")
@@ -56,7 +56,7 @@ def create_branch(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/branches"
     post_data = {"name": name, "revision": revision}
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_branch", json=post_data
     ).json()
 
 
@@ -114,7 +114,9 @@ def list_branches(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_branches", params=params
+    ).json()
 
 
 def get_branch(
@@ -157,7 +159,9 @@ def get_branch(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/branches/{branch}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_branch"
+    ).json()
 
 
 def delete_branch(
@@ -188,4 +192,4 @@ def delete_branch(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/branches/{branch}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_branch")
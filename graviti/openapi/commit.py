@@ -60,7 +60,7 @@ def commit_draft(
         post_data["description"] = description
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="commit_draft", json=post_data
     ).json()
 
 
@@ -121,7 +121,9 @@ def list_commits(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_commits", params=params
+    ).json()
 
 
 def get_commit(
@@ -158,7 +160,9 @@ def get_commit(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/commits/{commit_id}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_commit"
+    ).json()
 
 
 def get_revision(
@@ -196,4 +200,6 @@ def get_revision(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/revisions/{revision}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_revision"
+    ).json()
@@ -14,6 +14,7 @@ def _list_data(
     access_key: str,
     url: str,
     *,
+    operation: str,
     columns: Optional[str],
     order_by: Optional[str],
     offset: Optional[int],
@@ -27,7 +28,9 @@ def _list_data(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation=operation, params=params
+    ).json()
 
 
 def list_draft_data(
@@ -127,7 +130,13 @@ def list_draft_data(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/data"
 
     return _list_data(
-        access_key, url, columns=columns, order_by=order_by, offset=offset, limit=limit
+        access_key,
+        url,
+        operation="list_draft_data",
+        columns=columns,
+        order_by=order_by,
+        offset=offset,
+        limit=limit,
     )
 
 
@@ -228,7 +237,13 @@ def list_commit_data(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/commits/{commit_id}/sheets/{sheet}/data"
 
     return _list_data(
-        access_key, url, columns=columns, order_by=order_by, offset=offset, limit=limit
+        access_key,
+        url,
+        operation="list_commit_data",
+        columns=columns,
+        order_by=order_by,
+        offset=offset,
+        limit=limit,
     )
 
 
@@ -294,7 +309,7 @@ def update_data(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/data"
     patch_data = {"data": data}
 
-    open_api_do("PATCH", access_key, url, json=patch_data)
+    open_api_do("PATCH", access_key, url, operation="update_data", json=patch_data)
 
 
 def add_data(
@@ -362,7 +377,7 @@ def add_data(
     if strategy_arguments is not None:
         post_data["strategy_arguments"] = strategy_arguments
 
-    open_api_do("POST", access_key, url, json=post_data)
+    open_api_do("POST", access_key, url, operation="add_data", json=post_data)
 
 
 def delete_data(
@@ -400,4 +415,6 @@ def delete_data(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/data"
-    open_api_do("DELETE", access_key, url, json={"record_keys": record_keys})
+    open_api_do(
+        "DELETE", access_key, url, operation="delete_data", json={"record_keys": record_keys}
+    )
@@ -65,7 +65,7 @@ def create_dataset(
         post_data["with_draft"] = with_draft
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_dataset", json=post_data
     ).json()
 
 
@@ -106,7 +106,9 @@ def get_dataset(access_key: str, url: str, workspace: str, dataset: str) -> Dict
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_dataset"
+    ).json()
 
 
 def list_datasets(
@@ -160,7 +162,9 @@ def list_datasets(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_datasets", params=params
+    ).json()
 
 
 def update_dataset(
@@ -227,7 +231,7 @@ def update_dataset(
         patch_data["default_branch"] = default_branch
 
     return open_api_do(  # type: ignore[no-any-return]
-        "PATCH", access_key, url, json=patch_data
+        "PATCH", access_key, url, operation="update_dataset", json=patch_data
     ).json()
 
 
@@ -255,4 +259,4 @@ def delete_dataset(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_dataset")
@@ -65,7 +65,7 @@ def create_draft(
         post_data["branch"] = branch
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_draft", json=post_data
     ).json()
 
 
@@ -132,7 +132,9 @@ def list_drafts(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_drafts", params=params
+    ).json()
 
 
 def get_draft(
@@ -172,7 +174,9 @@ def get_draft(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_draft"
+    ).json()
 
 
 def update_draft(
@@ -257,5 +261,5 @@ def update_draft(
         patch_data["description"] = description
 
     return open_api_do(  # type: ignore[no-any-return]
-        "PATCH", access_key, url, json=patch_data
+        "PATCH", access_key, url, operation="update_draft", json=patch_data
     ).json()
@@ -175,7 +175,9 @@ def get_object_permission(
         "expired": expired,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_object_permission", params=params
+    ).json()
 
 
 def copy_objects(
@@ -222,5 +224,5 @@ def copy_objects(
     post_data = {"source_dataset": source_dataset, "keys": keys}
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="copy_objects", json=post_data
     ).json()
@@ -15,6 +15,7 @@ def _list_records(
     access_key: str,
     url: str,
     *,
+    operation: str,
     columns: Optional[str],
     sort: SortParam,
     offset: Optional[int],
@@ -28,7 +29,9 @@ def _list_records(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation=operation, params=params
+    ).json()
 
 
 def list_draft_records(
@@ -124,7 +127,15 @@ def list_draft_records(
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/records"
 
-    return _list_records(access_key, url, columns=columns, sort=sort, offset=offset, limit=limit)
+    return _list_records(
+        access_key,
+        url,
+        operation="list_draft_records",
+        columns=columns,
+        sort=sort,
+        offset=offset,
+        limit=limit,
+    )
 
 
 def list_commit_records(
@@ -220,7 +231,15 @@ def list_commit_records(
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/commits/{commit_id}/sheets/{sheet}/records"
 
-    return _list_records(access_key, url, columns=columns, sort=sort, offset=offset, limit=limit)
+    return _list_records(
+        access_key,
+        url,
+        operation="list_commit_records",
+        columns=columns,
+        sort=sort,
+        offset=offset,
+        limit=limit,
+    )
 
 
 def update_records(
@@ -285,7 +304,7 @@ def update_records(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/records"
     patch_data = {"records": records}
 
-    open_api_do("PATCH", access_key, url, json=patch_data)
+    open_api_do("PATCH", access_key, url, operation="update_records", json=patch_data)
 
 
 def add_records(
@@ -353,7 +372,7 @@ def add_records(
     if strategy_arguments is not None:
         post_data["strategy_arguments"] = strategy_arguments
 
-    open_api_do("POST", access_key, url, json=post_data)
+    open_api_do("POST", access_key, url, operation="add_records", json=post_data)
 
 
 def delete_records(
@@ -391,4 +410,6 @@ def delete_records(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}/records"
-    open_api_do("DELETE", access_key, url, json={"record_keys": record_keys})
+    open_api_do(
+        "DELETE", access_key, url, operation="delete_records", json={"record_keys": record_keys}
+    )
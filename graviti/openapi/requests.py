@@ -5,7 +5,8 @@
 
 """The basic concepts and methods of the Graviti OpenAPI."""
 
-from typing import Any
+from time import perf_counter
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from requests.models import Response
@@ -13,6 +14,11 @@ from requests.models import Response
 from graviti.__version__ import __version__
 from graviti.exception import ResponseError, ResponseErrorRegister
 from graviti.utility import config, get_session
+from graviti.utility.hedge import get_hedge_policy
+from graviti.utility.limiter import get_limiter
+from graviti.utility.metrics import metrics
+from graviti.utility.profile import is_profiling, profile_phase
+from graviti.utility.requests import OPENAPI, STORAGE
 
 RESPONSE_ERROR_DISTRIBUTOR = ResponseErrorRegister.RESPONSE_ERROR_DISTRIBUTOR
 
@@ -29,16 +35,92 @@ def do(method: str, url: str, **kwargs: Any) -> Response:  # pylint: disable=inv
         Response of the request.
 
     """
-    return get_session().request(method=method, url=url, **kwargs)
+    return _do(STORAGE, method, method, url, **kwargs)
 
 
-def open_api_do(method: str, access_key: str, url: str, **kwargs: Any) -> Response:
+def _do(endpoint: str, name: str, method: str, url: str, **kwargs: Any) -> Response:
+    if not is_profiling():
+        return _request(endpoint, name, method, url, **kwargs)
+
+    with profile_phase("network") as record:
+        response = _request(endpoint, name, method, url, **kwargs)
+        if record is not None and not kwargs.get("stream", False):
+            record.nbytes = len(response.content)
+
+    return response
+
+
+def _request(endpoint: str, name: str, method: str, url: str, **kwargs: Any) -> Response:
+    session = get_session(endpoint)
+    limiter = get_limiter(endpoint)
+    if not metrics.enabled:
+        if limiter is None:
+            return session.request(method=method, url=url, **kwargs)
+
+        return limiter.send(session.request, method=method, url=url, **kwargs)
+
+    start = perf_counter()
+    response = None
+    try:
+        if limiter is None:
+            response = session.request(method=method, url=url, **kwargs)
+        else:
+            response = limiter.send(session.request, method=method, url=url, **kwargs)
+        return response
+    except ResponseError as error:
+        response = error.response
+        raise
+    finally:
+        _record(endpoint, name, perf_counter() - start, response, kwargs.get("stream", False))
+
+
+def _record(
+    endpoint: str, name: str, latency: float, response: Optional[Response], stream: bool
+) -> None:
+    if response is None:
+        metrics.record(
+            endpoint,
+            name,
+            latency=latency,
+            status="error",
+            retries=0,
+            bytes_in=0,
+            bytes_out=0,
+            error=True,
+        )
+        return
+
+    retries = getattr(response.raw, "retries", None)
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None:
+        bytes_in = int(content_length)
+    else:
+        bytes_in = 0 if stream else len(response.content)
+
+    metrics.record(
+        endpoint,
+        name,
+        latency=latency,
+        status=response.status_code,
+        retries=len(retries.history) if retries is not None else 0,
+        bytes_in=bytes_in,
+        bytes_out=int(response.request.headers.get("Content-Length", 0)),
+        error=response.status_code not in (200, 201, 206),
+    )
+
+
+def open_api_do(
+    method: str, access_key: str, url: str, *, operation: Optional[str] = None, **kwargs: Any
+) -> Response:
     """Send a request to the Graviti OpenAPI.
 
     Arguments:
         method: The method of the request.
         access_key: User's access key.
         url: The URL of the graviti website.
+        operation: The name of the public OpenAPI function which sends the request, the metrics
+            and the hedge policy latencies are tracked per operation. None means using the
+            method instead.
         **kwargs: Extra keyword arguments to send in the POST request.
 
     Raises:
@@ -51,12 +133,23 @@ def open_api_do(method: str, access_key: str, url: str, **kwargs: Any) -> Respon
     headers = kwargs.setdefault("headers", {})
     headers["X-Token"] = access_key
     headers["X-Source"] = f"{config._x_source}/{__version__}"  # pylint: disable=protected-access
-    headers["X-Request-Id"] = uuid4().hex
+
+    name = method if operation is None else operation
+    hedge_policy = get_hedge_policy(name) if method == "GET" else None
 
     try:
-        return do(method=method, url=url, **kwargs)
+        if hedge_policy is None:
+            return _send(name, method, url, kwargs)
+
+        return hedge_policy.send(lambda: _send(name, method, url, kwargs))
     except ResponseError as error:
         response = error.response
         raise RESPONSE_ERROR_DISTRIBUTOR.get(
             (response.status_code, response.json().get("code")), ResponseError
         )(response=response) from None
+
+
+def _send(operation: str, method: str, url: str, kwargs: Dict[str, Any]) -> Response:
+    # Every request, including the hedged duplicate one, needs its own request id.
+    kwargs = {**kwargs, "headers": {**kwargs["headers"], "X-Request-Id": uuid4().hex}}
+    return _do(OPENAPI, operation, method, url, **kwargs)
@@ -61,4 +61,4 @@ standard@main", "types": [{"name": "file.Image"}]}], "type": "record", "fields":
     if patch is not None:
         patch_data["patch"] = patch
 
-    open_api_do("PATCH", access_key, url, json=patch_data)
+    open_api_do("PATCH", access_key, url, operation="update_schema", json=patch_data)
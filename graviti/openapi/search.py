@@ -73,7 +73,7 @@ def create_search_history(
         post_data["draft_number"] = draft_number
 
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_search_history", json=post_data
     ).json()
 
 
@@ -160,7 +160,9 @@ def list_search_histories(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_search_histories", params=params
+    ).json()
 
 
 def get_search_history(
@@ -207,7 +209,9 @@ def get_search_history(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/searches/{search_id}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_search_history"
+    ).json()
 
 
 def delete_search_history(
@@ -238,7 +242,7 @@ def delete_search_history(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/searches/{search_id}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_search_history")
 
 
 def get_search_record_count(
@@ -275,7 +279,9 @@ def get_search_record_count(
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/searches/{search_id}/record-count"
 
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_search_record_count"
+    ).json()
 
 
 def list_search_records(
@@ -343,4 +349,6 @@ def list_search_records(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_search_records", params=params
+    ).json()
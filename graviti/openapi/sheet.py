@@ -10,9 +10,10 @@ from typing import Any, Dict, Optional
 from graviti.openapi.requests import open_api_do
 
 
-def _list_sheet(
+def _list_sheet(  # pylint: disable=too-many-arguments
     access_key: str,
     url: str,
+    operation: str,
     with_record_count: Optional[bool],
     offset: Optional[int],
     limit: Optional[int],
@@ -24,12 +25,15 @@ def _list_sheet(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation=operation, params=params
+    ).json()
 
 
 def _get_sheet(
     access_key: str,
     url: str,
+    operation: str,
     with_record_count: Optional[bool],
     schema_format: Optional[str],
 ) -> Dict[str, Any]:
@@ -38,7 +42,9 @@ def _get_sheet(
         "schema_format": schema_format,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation=operation, params=params
+    ).json()
 
 
 def create_sheet(
@@ -93,7 +99,7 @@ standard@main", "types": [{"name": "file.Image"}]}], "type": "record", "fields":
     if record_key_strategy is not None:
         post_data["record_key_strategy"] = record_key_strategy
 
-    open_api_do("POST", access_key, url, json=post_data)
+    open_api_do("POST", access_key, url, operation="create_sheet", json=post_data)
 
 
 def list_draft_sheets(
@@ -153,7 +159,12 @@ def list_draft_sheets(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets"
 
     return _list_sheet(
-        access_key, url, with_record_count=with_record_count, offset=offset, limit=limit
+        access_key,
+        url,
+        operation="list_draft_sheets",
+        with_record_count=with_record_count,
+        offset=offset,
+        limit=limit,
     )
 
 
@@ -214,7 +225,12 @@ def list_commit_sheets(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/commits/{commit_id}/sheets"
 
     return _list_sheet(
-        access_key, url, with_record_count=with_record_count, offset=offset, limit=limit
+        access_key,
+        url,
+        operation="list_commit_sheets",
+        with_record_count=with_record_count,
+        offset=offset,
+        limit=limit,
     )
 
 
@@ -268,7 +284,11 @@ def get_draft_sheet(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}"
 
     return _get_sheet(
-        access_key, url, with_record_count=with_record_count, schema_format=schema_format
+        access_key,
+        url,
+        operation="get_draft_sheet",
+        with_record_count=with_record_count,
+        schema_format=schema_format,
     )
 
 
@@ -323,7 +343,11 @@ def get_commit_sheet(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/commits/{commit_id}/sheets/{sheet}"
 
     return _get_sheet(
-        access_key, url, with_record_count=with_record_count, schema_format=schema_format
+        access_key,
+        url,
+        operation="get_commit_sheet",
+        with_record_count=with_record_count,
+        schema_format=schema_format,
     )
 
 
@@ -359,4 +383,4 @@ def delete_sheet(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/drafts/{draft_number}/sheets/{sheet}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_sheet")
@@ -65,7 +65,9 @@ def list_storage_configs(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_storage_configs", params=params
+    ).json()
 
 
 def get_storage_config(
@@ -98,7 +100,9 @@ def get_storage_config(
 
     """
     url = f"{url}/v2/workspaces/{workspace}/storage-configs/{storage_config}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_storage_config"
+    ).json()
 
 
 def update_storage_configs(
@@ -124,4 +128,4 @@ def update_storage_configs(
     url = f"{url}/v2/workspaces/{workspace}/storage-configs"
     patch_data = {"deafault_storage_config": default_storage_config}
 
-    open_api_do("PATCH", access_key, url, json=patch_data)
+    open_api_do("PATCH", access_key, url, operation="update_storage_configs", json=patch_data)
@@ -50,7 +50,7 @@ def create_tag(
     url = f"{url}/v2/datasets/{workspace}/{dataset}/tags"
     post_data = {"name": name, "revision": revision}
     return open_api_do(  # type: ignore[no-any-return]
-        "POST", access_key, url, json=post_data
+        "POST", access_key, url, operation="create_tag", json=post_data
     ).json()
 
 
@@ -108,7 +108,9 @@ def list_tags(
         "limit": limit,
     }
 
-    return open_api_do("GET", access_key, url, params=params).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="list_tags", params=params
+    ).json()
 
 
 def get_tag(access_key: str, url: str, workspace: str, dataset: str, *, tag: str) -> Dict[str, Any]:
@@ -144,7 +146,9 @@ def get_tag(access_key: str, url: str, workspace: str, dataset: str, *, tag: str
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/tags/{tag}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_tag"
+    ).json()
 
 
 def delete_tag(
@@ -175,4 +179,4 @@ def delete_tag(
 
     """
     url = f"{url}/v2/datasets/{workspace}/{dataset}/tags/{tag}"
-    open_api_do("DELETE", access_key, url)
+    open_api_do("DELETE", access_key, url, operation="delete_tag")
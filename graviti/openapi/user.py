@@ -34,4 +34,6 @@ def get_current_user(access_key: str, url: str) -> Dict[str, Any]:
 
     """
     url = f"{url}/v2/current-user"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_current_user"
+    ).json()
@@ -34,7 +34,9 @@ def get_current_workspace(access_key: str, url: str) -> Dict[str, Any]:
 
     """
     url = f"{url}/v2/current-workspace"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_current_workspace"
+    ).json()
 
 
 def get_workspace(access_key: str, url: str, workspace: str) -> Dict[str, Any]:
@@ -62,4 +64,6 @@ def get_workspace(access_key: str, url: str, workspace: str) -> Dict[str, Any]:
 
     """
     url = f"{url}/v2/workspaces/{workspace}"
-    return open_api_do("GET", access_key, url).json()  # type: ignore[no-any-return]
+    return open_api_do(  # type: ignore[no-any-return]
+        "GET", access_key, url, operation="get_workspace"
+    ).json()
@@ -7,12 +7,84 @@
 
 import base64
 import json
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Lock
 from typing import Tuple
 
 import pyarrow as pa
 
 from graviti.portex import convert_portex_schema_to_avro, record
 
+_COMPILED_SCHEMAS_SIZE = 64
+_COMPILED_SCHEMAS: "OrderedDict[str, CompiledSchema]" = OrderedDict()
+_COMPILED_SCHEMAS_LOCK = Lock()
+
+
+class CompiledSchema:
+    """The portex schema, avro schema and arrow schema encoded from one portex schema.
+
+    Arguments:
+        schema: The portex schema.
+
+    """
+
+    __slots__ = ("portex_schema", "avro_schema", "arrow_schema")
+
+    def __init__(self, schema: record) -> None:
+        self.portex_schema: str = schema.to_yaml()
+        self.avro_schema = json.dumps(convert_portex_schema_to_avro(schema))
+
+        pyarrow_schema = pa.schema(schema.fields.to_pyarrow())
+        self.arrow_schema = base64.encodebytes(pyarrow_schema.serialize().to_pybytes()).decode(
+            "ascii"
+        )
+
+
+def get_fingerprint(schema: record) -> str:
+    """Get the fingerprint of the portex schema.
+
+    The schemas with the same fingerprint are encoded to the same portex, avro and arrow schemas.
+
+    Arguments:
+        schema: The portex schema.
+
+    Returns:
+        The fingerprint of the portex schema.
+
+    """
+    content = json.dumps(schema.to_pyobj(), ensure_ascii=False, default=str)
+    return sha1(content.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema: record) -> CompiledSchema:
+    """Get the compiled schema of the portex schema.
+
+    The compiled schemas are cached by the fingerprint of the portex schema, so creating many
+    sheets with the same schema only encodes the schema once.
+
+    Arguments:
+        schema: The portex schema.
+
+    Returns:
+        The compiled schema.
+
+    """
+    fingerprint = get_fingerprint(schema)
+    with _COMPILED_SCHEMAS_LOCK:
+        compiled = _COMPILED_SCHEMAS.get(fingerprint)
+        if compiled is not None:
+            _COMPILED_SCHEMAS.move_to_end(fingerprint)
+            return compiled
+
+    compiled = CompiledSchema(schema)
+    with _COMPILED_SCHEMAS_LOCK:
+        _COMPILED_SCHEMAS[fingerprint] = compiled
+        if len(_COMPILED_SCHEMAS) > _COMPILED_SCHEMAS_SIZE:
+            _COMPILED_SCHEMAS.popitem(last=False)
+
+    return compiled
+
 
 def get_schema(schema: record) -> Tuple[str, str, str]:
     """Get portex schema, avro schema and arrow schema.
@@ -23,9 +95,5 @@ def get_schema(schema: record) -> Tuple[str, str, str]:
     Returns:
         The tuple of portex schema, avro schema and arrow schema.
     """
-    portex_schema = schema.to_yaml()
-    avro_schema = json.dumps(convert_portex_schema_to_avro(schema))
-    pyarrow_schema = pa.schema(schema.fields.to_pyarrow())
-    arrow_schema = base64.encodebytes(pyarrow_schema.serialize().to_pybytes()).decode("ascii")
-
-    return portex_schema, avro_schema, arrow_schema
+    compiled = compile_schema(schema)
+    return compiled.portex_schema, compiled.avro_schema, compiled.arrow_schema
@@ -7,8 +7,6 @@
 
 from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
-from tqdm import tqdm
-
 from graviti.exception import ObjectCopyError
 from graviti.file import File, FileBase, RemoteFile
 from graviti.openapi import (
@@ -22,8 +20,11 @@ from graviti.openapi import (
 from graviti.operation.common import get_schema
 from graviti.portex import record
 from graviti.utility import chunked, submit_multithread_tasks
+from graviti.utility.profile import profile_phase
 
 if TYPE_CHECKING:
+    from tqdm import tqdm
+
     from graviti.dataframe import DataFrame
     from graviti.dataframe.column.series import NumberSeries
     from graviti.manager import Dataset, ObjectPermissionManager
@@ -60,8 +61,8 @@ class DataFrameOperation:
         draft_number: int,
         sheet: str,
         jobs: int,
-        data_pbar: tqdm,
-        file_pbar: tqdm,
+        data_pbar: "tqdm",
+        file_pbar: "tqdm",
     ) -> None:
         """Execute the OpenAPI create sheet.
 
@@ -126,8 +127,8 @@ class AddData(DataOperation):
         draft_number: int,
         sheet: str,
         jobs: int,
-        data_pbar: tqdm,
-        file_pbar: tqdm,
+        data_pbar: "tqdm",
+        file_pbar: "tqdm",
     ) -> None:
         """Execute the OpenAPI add data.
 
@@ -154,6 +155,9 @@ class AddData(DataOperation):
             if local_files:
                 _upload_files(local_files, dataset.object_permission_manager, file_pbar, jobs)
 
+            with profile_phase("to_backend"):
+                data = batch.to_pylist(_to_backend=True)
+
             _workspace = dataset.workspace
             add_data(
                 _workspace.access_key,
@@ -162,7 +166,7 @@ class AddData(DataOperation):
                 dataset.name,
                 draft_number=draft_number,
                 sheet=sheet,
-                data=batch.to_pylist(_to_backend=True),
+                data=data,
             )
             data_pbar.update(len(batch))
 
@@ -186,8 +190,8 @@ class UpdateSchema(DataFrameOperation):
         draft_number: int,
         sheet: str,
         jobs: int,
-        data_pbar: tqdm,
-        file_pbar: tqdm,
+        data_pbar: "tqdm",
+        file_pbar: "tqdm",
     ) -> None:
         """Execute the OpenAPI update schema.
 
@@ -237,8 +241,8 @@ class UpdateData(DataOperation):
         draft_number: int,
         sheet: str,
         jobs: int,
-        data_pbar: tqdm,
-        file_pbar: tqdm,
+        data_pbar: "tqdm",
+        file_pbar: "tqdm",
     ) -> None:
         """Execute the OpenAPI add data.
 
@@ -265,6 +269,9 @@ class UpdateData(DataOperation):
             if local_files:
                 _upload_files(local_files, dataset.object_permission_manager, file_pbar, jobs)
 
+            with profile_phase("to_backend"):
+                data = batch.to_pylist(_to_backend=True)
+
             _workspace = dataset.workspace
             update_data(
                 _workspace.access_key,
@@ -273,7 +280,7 @@ class UpdateData(DataOperation):
                 dataset.name,
                 draft_number=draft_number,
                 sheet=sheet,
-                data=batch.to_pylist(_to_backend=True),
+                data=data,
             )
             data_pbar.update(len(batch))
 
@@ -296,8 +303,8 @@ class DeleteData(DataFrameOperation):
         draft_number: int,
         sheet: str,
         jobs: int,
-        data_pbar: tqdm,
-        file_pbar: tqdm,
+        data_pbar: "tqdm",
+        file_pbar: "tqdm",
     ) -> None:
         """Execute the OpenAPI delete data.
 
@@ -325,7 +332,7 @@ class DeleteData(DataFrameOperation):
 def _copy_files(
     dataset: "Dataset",
     remote_files: Dict[str, List[RemoteFile]],
-    pbar: tqdm,
+    pbar: "tqdm",
 ) -> None:
     _workspace = dataset.workspace
     for source_dataset, files in remote_files.items():
@@ -347,7 +354,7 @@ def _copy_files(
 def _upload_files(
     files: Iterable[File],
     object_permission_manager: "ObjectPermissionManager",
-    pbar: tqdm,
+    pbar: "tqdm",
     jobs: int = 8,
 ) -> None:
     submit_multithread_tasks(
@@ -360,8 +367,11 @@ def _upload_files(
 def _upload_file(
     file: File,
     object_permission_manager: "ObjectPermissionManager",
-    pbar: tqdm,
+    pbar: "tqdm",
 ) -> None:
+    # Read the metadata in the worker threads, so "to_pylist" of the batch does not read the
+    # headers of the files one by one on the main thread.
+    file._load_post_metadata()  # pylint: disable=protected-access
     post_key = f"{object_permission_manager.prefix}{file.get_checksum()}"
     object_permission_manager.put_object(post_key, file.path)
     file._post_key = post_key  # pylint: disable=protected-access
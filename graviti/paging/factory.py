@@ -5,18 +5,40 @@
 
 """Paging list related class."""
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from itertools import repeat
 from math import ceil
-from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 import pyarrow as pa
 
 from graviti.paging.lists import MappedPagingList, PagingList, PyArrowPagingList
 from graviti.paging.offset import Offsets
 from graviti.paging.wrapper import StructArrayWrapper
+from graviti.utility.audit import annotate_fetch, is_tracing, trace_fetch
+from graviti.utility.profile import is_profiling, profile_phase
 
 _T = TypeVar("_T")
 
+_MAX_READ_AHEAD = 4
+_READ_AHEAD_WORKERS = 4
+
+_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    pid = os.getpid()
+    executor = _EXECUTORS.get(pid)
+    if executor is None:
+        executor = _EXECUTORS.setdefault(
+            pid, ThreadPoolExecutor(_READ_AHEAD_WORKERS, thread_name_prefix="graviti-read-ahead")
+        )
+
+    return executor
+
 
 class LazyFactoryBase:
     """LazyFactoryBase is the base class of the lazy facotry."""
@@ -67,7 +89,7 @@ class LazyFactoryBase:
         raise NotImplementedError
 
 
-class LazyFactory(LazyFactoryBase):
+class LazyFactory(LazyFactoryBase):  # pylint: disable=too-many-instance-attributes
     """LazyFactory is a factory for requesting source data and creating paging lists.
 
     Arguments:
@@ -75,6 +97,9 @@ class LazyFactory(LazyFactoryBase):
         limit: The size of each lazy load page.
         getter: A callable object to get the source data.
         patype: The pyarrow DataType of the data in the factory.
+        read_ahead: Whether to fetch the following pages in the background when the pages are
+            accessed in order, the read-ahead window doubles on every sequential access up to
+            4 pages and is reset by the random access.
 
     Examples:
         >>> import pyarrow as pa
@@ -125,14 +150,23 @@ class LazyFactory(LazyFactoryBase):
 
     """
 
-    def __init__(
-        self, total_count: int, limit: int, getter: Callable[[int, int], Any], patype: pa.DataType
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        total_count: int,
+        limit: int,
+        getter: Callable[[int, int], Any],
+        patype: pa.DataType,
+        read_ahead: bool = False,
     ) -> None:
         self._getter = getter
         self._total_count = total_count
         self._limit = limit
         self._patype = patype
         self._pages: List[Optional[pa.StructArray]] = [None] * ceil(total_count / limit)
+        self._read_ahead = read_ahead
+        self._window = 0
+        self._prefetches: Dict[int, "Future[pa.Array]"] = {}
+        self._lock = Lock()
 
     def __getitem__(self, key: str) -> "LazySubFactory":
         return LazySubFactory(self, (key,), self._patype[key].type)
@@ -148,16 +182,80 @@ class LazyFactory(LazyFactoryBase):
             The requested pyarrow array.
 
         """
+        if is_tracing():
+            annotate_fetch(self._describe_source(), ".".join(keys), pos)
+
         array = self._pages[pos]
         if array is None:
-            array = pa.array(self._getter(pos * self._limit, self._limit), type=self._patype)
+            with trace_fetch("page", self._describe_source(), ".".join(keys), pos) as record:
+                array = self._get_page(pos)
+                if record is not None:
+                    record.nbytes = array.nbytes
             self._pages[pos] = array
 
+            if self._read_ahead:
+                self._prefetch(pos)
+
         for key in keys:
             array = array.field(key)
 
         return array
 
+    def add_page(self, pos: int, data: Any) -> None:
+        """Add the source data of the page which is already requested into the factory.
+
+        Arguments:
+            pos: The page number.
+            data: The source data of the page, in the same form returned by the getter.
+
+        """
+        self._pages[pos] = self._to_array(data)
+
+    def _get_page(self, pos: int) -> pa.Array:
+        with self._lock:
+            future = self._prefetches.pop(pos, None)
+
+        return self._fetch(pos) if future is None else future.result()
+
+    def _prefetch(self, pos: int) -> None:
+        if pos != 0 and self._pages[pos - 1] is None:
+            self._window = 0
+            return
+
+        self._window = min(max(self._window * 2, 1), _MAX_READ_AHEAD)
+        stop = min(pos + 1 + self._window, len(self._pages))
+        with self._lock:
+            for next_pos in range(pos + 1, stop):
+                if self._pages[next_pos] is None and next_pos not in self._prefetches:
+                    self._prefetches[next_pos] = _get_executor().submit(self._fetch, next_pos)
+
+    def _fetch(self, pos: int) -> pa.Array:
+        if not is_profiling():
+            return self._to_array(self._getter(pos * self._limit, self._limit))
+
+        # The "network" phase of the getter is nested, the rest is decoding the response.
+        with profile_phase("decode"):
+            data = self._getter(pos * self._limit, self._limit)
+
+        with profile_phase("pa_array") as record:
+            array = self._to_array(data)
+            if record is not None:
+                record.nbytes = array.nbytes
+
+        return array
+
+    def _to_array(self, data: Any) -> pa.Array:
+        return pa.array(data, type=self._patype)
+
+    def _describe_source(self) -> str:
+        # The callable type of the getter is not narrowed to "partial" by mypy.
+        getter: object = self._getter
+        if not isinstance(getter, partial):
+            return getattr(getter, "__qualname__", repr(getter))
+
+        arguments = ", ".join(f"{key}={value!r}" for key, value in getter.keywords.items())
+        return f"{getattr(getter.func, '__qualname__', repr(getter.func))}({arguments})"
+
     def create_list(self, mapper: Callable[[Any], _T]) -> PagingList[_T]:
         """Create a paging list from the factory.
 
@@ -273,13 +371,20 @@ class LazyLowerCaseFactory(LazyFactory):
         limit: The size of each lazy load page.
         getter: A callable object to get the source data.
         patype: The pyarrow DataType of the data in the factory.
+        read_ahead: Whether to fetch the following pages in the background when the pages are
+            accessed in order.
 
     """
 
-    def __init__(
-        self, total_count: int, limit: int, getter: Callable[[int, int], Any], patype: pa.DataType
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        total_count: int,
+        limit: int,
+        getter: Callable[[int, int], Any],
+        patype: pa.DataType,
+        read_ahead: bool = False,
     ) -> None:
-        super().__init__(total_count, limit, getter, self._lower_patype(patype))
+        super().__init__(total_count, limit, getter, self._lower_patype(patype), read_ahead)
 
     def __getitem__(self, key: str) -> "LazyLowerCaseSubFactory":
         lower_key = key.lower()
@@ -296,27 +401,8 @@ class LazyLowerCaseFactory(LazyFactory):
 
         return patype
 
-    def get_array(self, pos: int, keys: Tuple[str, ...]) -> pa.Array:
-        """Get the array from the factory.
-
-        Arguments:
-            pos: The page number.
-            keys: The keys to access the array from factory.
-
-        Returns:
-            The requested pyarrow array.
-
-        """
-        array = self._pages[pos]
-        if array is None:
-            array = pa.array(self._getter(pos * self._limit, self._limit), type=self._patype)
-            array = StructArrayWrapper(array)
-            self._pages[pos] = array
-
-        for key in keys:
-            array = array.field(key)
-
-        return array
+    def _to_array(self, data: Any) -> pa.Array:
+        return StructArrayWrapper(super()._to_array(data))
 
 
 class LazyLowerCaseSubFactory(LazySubFactory):
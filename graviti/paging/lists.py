@@ -28,6 +28,7 @@ import pyarrow as pa
 from graviti.paging.offset import Offsets
 from graviti.paging.page import LazyPage, MappedLazyPage, MappedPage, MappedPageBase, Page, PageBase
 from graviti.utility import ReprMixin, ReprType
+from graviti.utility.profile import profile_phase
 
 if TYPE_CHECKING:
     from graviti.paging.factory import LazyFactory
@@ -320,6 +321,32 @@ class PagingListBase(Sequence[_T], ReprMixin):
 
         return obj
 
+    def take(self: _PLB, indices: pa.Array) -> _PLB:
+        """Get the PagingList with the elements at the given indices.
+
+        The elements are gathered by reference, they are not re-created.
+
+        Arguments:
+            indices: The pyarrow integer array of the indices.
+
+        Returns:
+            The PagingList with the elements at the given indices.
+
+        """
+        # pylint: disable=protected-access
+        obj: _PLB = object.__new__(self.__class__)
+        obj._init(self._array_creator(map(self.get_item, indices.to_pylist())))
+        return obj
+
+    def is_loaded(self) -> bool:
+        """Whether all the pages of the PagingList are loaded.
+
+        Returns:
+            Whether all the pages of the PagingList are loaded.
+
+        """
+        return all(page.is_loaded() for page in self._pages)
+
     def set_item(self, index: int, value: _T) -> None:
         """Update the element value in PagingList at the given index.
 
@@ -478,7 +505,9 @@ class PagingList(PagingListBase[_T]):
         obj: _PL = object.__new__(cls)
 
         def get_array(pos: int, keys: Tuple[str, ...]) -> Tuple[Any, ...]:
-            return tuple(map(mapper, factory.get_array(pos, keys)))
+            array = factory.get_array(pos, keys)
+            with profile_phase("mapper"):
+                return tuple(map(mapper, array))
 
         obj._pages = [
             LazyPage(length, partial(get_array, pos, keys))
@@ -645,6 +674,20 @@ class PyArrowPagingList(PagingListBase[_T]):
 
         return obj
 
+    def take(self: _PPL, indices: pa.Array) -> _PPL:
+        """Get the PyArrowPagingList with the elements at the given indices.
+
+        The elements are gathered by the pyarrow "take" kernel on every page.
+
+        Arguments:
+            indices: The pyarrow integer array of the indices.
+
+        Returns:
+            The PyArrowPagingList with the elements at the given indices.
+
+        """
+        return self.from_pyarrow(self.to_pyarrow().take(indices).combine_chunks())
+
     def set_slice(self: _PPL, index: slice, values: _PPL) -> None:
         """Update the element values at the given slice with input PyArrowPagingList.
 
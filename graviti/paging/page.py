@@ -7,6 +7,9 @@
 
 from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar, Union, overload
 
+from graviti.utility.audit import trace_fetch
+from graviti.utility.profile import profile_phase
+
 _T = TypeVar("_T")
 
 
@@ -82,6 +85,15 @@ class PageBase(Sequence[_T]):
         """
         raise NotImplementedError
 
+    def is_loaded(self) -> bool:
+        """Whether the array inside the page is loaded.
+
+        Returns:
+            Whether the array inside the page is loaded.
+
+        """
+        return True
+
 
 class Page(PageBase[_T]):
     """Page is an array wrapper and represents a page in paging list.
@@ -194,6 +206,15 @@ class LazyPage(PageBase[_T]):
     def __len__(self) -> int:
         return self._length
 
+    def is_loaded(self) -> bool:
+        """Whether the array inside the page is loaded.
+
+        Returns:
+            Whether the array inside the page is loaded.
+
+        """
+        return self._array is not None
+
     def get_slice(
         self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None
     ) -> "LazySlicedPage[_T]":
@@ -219,7 +240,8 @@ class LazyPage(PageBase[_T]):
         """
         array = self._array
         if array is None:
-            array = self._array_getter()
+            with trace_fetch("column"):
+                array = self._array_getter()
             self._array = array
             self._patch(array)
 
@@ -244,6 +266,15 @@ class LazySlicedPage(PageBase[_T]):
     def __len__(self) -> int:
         return len(self._ranging)
 
+    def is_loaded(self) -> bool:
+        """Whether the array inside the page is loaded.
+
+        Returns:
+            Whether the array inside the page is loaded.
+
+        """
+        return self._array is not None
+
     def get_slice(
         self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None
     ) -> "LazySlicedPage[_T]":
@@ -391,6 +422,15 @@ class MappedLazyPage(MappedPageBase[_T]):
     def __len__(self) -> int:
         return self._length
 
+    def is_loaded(self) -> bool:
+        """Whether the array inside the page is loaded.
+
+        Returns:
+            Whether the array inside the page is loaded.
+
+        """
+        return self._array is not None
+
     def get_slice(
         self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None
     ) -> "Union[MappedLazySlicedPage[_T], MappedSlicedPage[_T]]":
@@ -421,8 +461,10 @@ class MappedLazyPage(MappedPageBase[_T]):
         """
         array = self._array
         if array is None:
-            array = self._array_getter()
-            array = tuple(map(self._mapper, array))
+            with trace_fetch("column"):
+                array = self._array_getter()
+                with profile_phase("mapper"):
+                    array = tuple(map(self._mapper, array))
             self._array = array
             self._patch(array)
 
@@ -472,6 +514,15 @@ class MappedLazySlicedPage(MappedPageBase[_T]):
     def __len__(self) -> int:
         return len(self._ranging)
 
+    def is_loaded(self) -> bool:
+        """Whether the array inside the page is loaded.
+
+        Returns:
+            Whether the array inside the page is loaded.
+
+        """
+        return self._array is not None
+
     def get_slice(
         self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None
     ) -> "Union[MappedLazySlicedPage[_T], MappedSlicedPage[_T]]":
@@ -504,10 +555,12 @@ class MappedLazySlicedPage(MappedPageBase[_T]):
         if array is None:
             ranging = self._ranging
             stop = ranging.stop
-            array = self._array_getter()[
-                ranging.start : stop if stop != -1 else None : ranging.step
-            ]
-            array = tuple(map(self._mapper, array))
+            with trace_fetch("column"):
+                array = self._array_getter()[
+                    ranging.start : stop if stop != -1 else None : ranging.step
+                ]
+                with profile_phase("mapper"):
+                    array = tuple(map(self._mapper, array))
 
             self._array = array
             self._patch(array)
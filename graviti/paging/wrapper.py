@@ -109,6 +109,16 @@ class ArrayWrapper:
     def __len__(self) -> int:
         return len(self._array)
 
+    @property
+    def nbytes(self) -> int:
+        """Return the total number of bytes consumed by the wrapped array.
+
+        Returns:
+            The total number of bytes consumed by the wrapped array.
+
+        """
+        return self._array.nbytes  # type: ignore[no-any-return]
+
 
 class StructScalarWrapper(ScalarWrapper):
     """The wrapper of pyarrow StructScalar to make it case insensitive.
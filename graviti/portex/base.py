@@ -6,8 +6,24 @@
 
 
 import json
+from collections import OrderedDict
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Type, TypeVar
+from functools import wraps
+from hashlib import sha1
+from threading import Lock
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import pyarrow as pa
 import yaml
@@ -27,6 +43,67 @@ if TYPE_CHECKING:
 PYARROW_TYPE_ID_TO_PORTEX_TYPE = PyArrowConversionRegister.PYARROW_TYPE_ID_TO_PORTEX_TYPE
 
 _T = TypeVar("_T", bound="PortexType")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# The libyaml based loader is about 10 times faster than the pure python one.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The parsed schemas keyed by the portex class and the hash of the YAML content.
+_SCHEMA_CACHE_SIZE = 64
+_SCHEMA_CACHE: "OrderedDict[Tuple[Type[PortexType], str], PortexType]" = OrderedDict()
+_SCHEMA_CACHE_LOCK = Lock()
+
+
+class _Generation:
+    """The generation of the record schemas, which increases when any record fields are mutated."""
+
+    value = 0
+
+
+def bump_generation() -> None:
+    """Increase the generation of the record schemas to invalidate all the memoized results."""
+    _Generation.value += 1
+
+
+def load_yaml(stream: Union[str, IO[str]]) -> Any:
+    """Parse the YAML content with the fastest available safe loader.
+
+    Arguments:
+        stream: The YAML string or the opened YAML file.
+
+    Returns:
+        The parsed python object.
+
+    """
+    return yaml.load(stream, _YamlLoader)
+
+
+def memoize(method: _F) -> _F:
+    """The decorator to cache the result of the portex type method with keyword arguments.
+
+    The portex types are immutable except the fields of the records, so the cached results are
+    valid until any record fields are mutated, which is tracked by :func:`bump_generation`.
+
+    Arguments:
+        method: The method to be cached.
+
+    Returns:
+        The cached method.
+
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self: "PortexType", **kwargs: Any) -> Any:
+        cache = self._get_cache()  # pylint: disable=protected-access
+        key = (name, *kwargs.items())
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = method(self, **kwargs)
+            return value
+
+    return wrapper  # type: ignore[return-value]
 
 
 class PortexType:
@@ -39,13 +116,28 @@ class PortexType:
     element: ClassVar[Type[Any]]
     search_container: ClassVar[Type["ArrayContainer"]]
 
+    _cache: Tuple[int, Dict[Any, Any]] = (-1, {})
+
     def __repr__(self) -> str:
         return self._repr1(0)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_cache", None)
+        return state
+
     @classmethod
     def _from_pyarrow(cls: Type[_T], paarray: pa.Array) -> _T:
         raise NotImplementedError
 
+    def _get_cache(self) -> Dict[Any, Any]:
+        generation, cache = self._cache
+        if generation != _Generation.value:
+            cache = {}
+            self._cache = (_Generation.value, cache)
+
+        return cache
+
     def _repr1(self, level: int) -> str:
         with_params = False
         indent = level * INDENT
@@ -170,7 +262,21 @@ class PortexType:
             A Portex type instance created from the input YAML string.
 
         """
-        return cls.from_pyobj(yaml.load(content, yaml.Loader))
+        key = (cls, sha1(content.encode("utf-8")).hexdigest())
+        with _SCHEMA_CACHE_LOCK:
+            cached = _SCHEMA_CACHE.get(key)
+            if cached is not None:
+                _SCHEMA_CACHE.move_to_end(key)
+
+        if cached is None:
+            cached = cls.from_pyobj(load_yaml(content))
+            with _SCHEMA_CACHE_LOCK:
+                _SCHEMA_CACHE[key] = cached
+                if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+                    _SCHEMA_CACHE.popitem(last=False)
+
+        # The cached instance is shared, the caller gets a copy which is free to be mutated.
+        return cached.copy()  # type: ignore[return-value]
 
     def to_pyobj(self, _with_imports: bool = True) -> Dict[str, Any]:
         """Dump the instance to a python dict.
@@ -255,6 +361,7 @@ class PortexRecordBase(
     def _data(self) -> "ConnectedFields":  # type: ignore[override]
         return self._fields_factory({name: getattr(self, name) for name in self.params})
 
+    @memoize
     def _get_column_count(self) -> int:
         """Get the total column count of the record base type.
 
@@ -298,6 +405,7 @@ class PortexRecordBase(
         """
         self._data.rename(old_name, new_name)
 
+    @memoize
     def to_pyarrow(self, *, _to_backend: bool = False) -> pa.StructType:
         """Convert the Portex type to the corresponding builtin PyArrow StructType.
 
@@ -324,7 +432,7 @@ def read_yaml(path: PathLike) -> PortexType:
 
     """
     with open(path, encoding="utf-8") as fp:
-        return PortexType.from_pyobj(yaml.load(fp, yaml.Loader))
+        return PortexType.from_pyobj(load_yaml(fp))
 
 
 def read_json(path: PathLike) -> PortexType:
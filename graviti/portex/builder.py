@@ -5,19 +5,18 @@
 """Portex type builder related classes."""
 
 
+import json
 import os
 from hashlib import md5
 from pathlib import Path
 from shutil import rmtree
 from subprocess import PIPE, CalledProcessError, run
 from tempfile import gettempdir
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, TypeVar
-
-import yaml
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar
 
 from graviti.exception import GitCommandError, GitNotFoundError
 from graviti.portex import ptype as PTYPE
-from graviti.portex.base import PortexRecordBase
+from graviti.portex.base import PortexRecordBase, load_yaml
 from graviti.portex.external import PortexExternalType
 from graviti.portex.factory import ConnectedFieldsFactory, TypeFactory
 from graviti.portex.package import ExternalPackage, Imports, packages
@@ -34,6 +33,20 @@ EXTERNAL_TYPE_TO_CONTAINER = ExternalContainerRegister.EXTERNAL_TYPE_TO_CONTAINE
 
 _I = TypeVar("_I", bound="BuilderImports")
 
+# Increase the version whenever the format of the package cache changes.
+_PACKAGE_CACHE_VERSION = 1
+
+
+def _get_cache_path(url: str, revision: str) -> Path:
+    tempdir = Path(gettempdir()) / "portex"
+    tempdir.mkdir(exist_ok=True)
+
+    md5_instance = md5()
+    md5_instance.update(url.encode("utf-8"))
+    md5_instance.update(revision.encode("utf-8"))
+
+    return tempdir / md5_instance.hexdigest()
+
 
 class PackageRepo:
     """The local git repo of the external Portex package.
@@ -62,14 +75,7 @@ class PackageRepo:
     }
 
     def __init__(self, url: str, revision: str) -> None:
-        tempdir = Path(gettempdir()) / "portex"
-        tempdir.mkdir(exist_ok=True)
-
-        md5_instance = md5()
-        md5_instance.update(url.encode("utf-8"))
-        md5_instance.update(revision.encode("utf-8"))
-
-        self._path = tempdir / md5_instance.hexdigest()
+        self._path = _get_cache_path(url, revision)
         self._url = url
         self._revision = revision
 
@@ -158,6 +164,92 @@ class PackageRepo:
 
         return roots[0].parent
 
+    def read_templates(self) -> Dict[str, Dict[str, Any]]:
+        """Read all the template type files of the package repo.
+
+        Returns:
+            A dict whose keys are the names of the template types and whose values are the parsed
+            contents of the template type files.
+
+        """
+        root = self.get_root()
+
+        templates = {}
+        for yaml_file in root.glob("**/*.yaml"):
+            if yaml_file.name == "ROOT.yaml":
+                continue
+
+            parts = (*yaml_file.relative_to(root).parent.parts, yaml_file.stem)
+            with yaml_file.open() as fp:
+                templates[".".join(parts)] = load_yaml(fp)
+
+        return templates
+
+
+class PackageCache:
+    """The on-disk cache of the parsed template types of the external Portex package.
+
+    The cache is a JSON file next to the local git repo of the package, so the processes after
+    the first one load the template types without running git or parsing YAML files.
+
+    Arguments:
+        url: The git repo url of the external package.
+        revision: The git repo revision (tag/commit) of the external package.
+
+    """
+
+    def __init__(self, url: str, revision: str) -> None:
+        self._path = _get_cache_path(url, revision).with_suffix(".json")
+        self._url = url
+        self._revision = revision
+
+    def load(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the parsed template types from the cache.
+
+        Returns:
+            The parsed template types, None when the cache is missing, broken or outdated.
+
+        """
+        try:
+            with self._path.open(encoding="utf-8") as fp:
+                content = json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(content, dict) or (
+            content.get("version"),
+            content.get("url"),
+            content.get("revision"),
+        ) != (_PACKAGE_CACHE_VERSION, self._url, self._revision):
+            return None
+
+        return content.get("templates")
+
+    def dump(self, templates: Dict[str, Dict[str, Any]]) -> None:
+        """Dump the parsed template types into the cache.
+
+        The cache is written into a temporary file and renamed, so the concurrent processes never
+        read a partly written cache. Failing to write the cache is ignored.
+
+        Arguments:
+            templates: The parsed template types.
+
+        """
+        content = {
+            "version": _PACKAGE_CACHE_VERSION,
+            "url": self._url,
+            "revision": self._revision,
+            "templates": templates,
+        }
+        temp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8") as fp:
+                json.dump(content, fp)
+            os.replace(temp_path, self._path)
+        except (OSError, TypeError, ValueError):
+            if temp_path.exists():
+                temp_path.unlink()
+
 
 class PackageBuilder:
     """The builder of the external Portex package.
@@ -180,19 +272,15 @@ class PackageBuilder:
             return self._builders.__getitem__(key).build()
 
     def _create_type_builders(self) -> Dict[str, "TypeBuilder"]:
-        repo = PackageRepo(self.package.url, self.package.revision)
-        root = repo.get_root()
+        url, revision = self.package.url, self.package.revision
+        cache = PackageCache(url, revision)
 
-        builders = {}
-        for yaml_file in root.glob("**/*.yaml"):
-            if yaml_file.name == "ROOT.yaml":
-                continue
+        templates = cache.load()
+        if templates is None:
+            templates = PackageRepo(url, revision).read_templates()
+            cache.dump(templates)
 
-            parts = (*yaml_file.relative_to(root).parent.parts, yaml_file.stem)
-            name = ".".join(parts)
-            builders[name] = TypeBuilder(name, yaml_file, self)
-
-        return builders
+        return {name: TypeBuilder(name, content, self) for name, content in templates.items()}
 
     def build(self) -> ExternalPackage:
         """Build the Portex external package.
@@ -214,14 +302,14 @@ class TypeBuilder:
 
     Arguments:
         name: The name of the Portex template type.
-        path: The source file path of the Portex template type.
-        package: The package the Portex template type belongs to.
+        content: The parsed content of the Portex template type file.
+        builder: The builder of the package the Portex template type belongs to.
 
     """
 
-    def __init__(self, name: str, path: Path, builder: PackageBuilder) -> None:
+    def __init__(self, name: str, content: Dict[str, Any], builder: PackageBuilder) -> None:
         self._name = name
-        self._path = path
+        self._content = content
         self._builder = builder
         self.is_building = False
 
@@ -240,9 +328,7 @@ class TypeBuilder:
 
         self.is_building = True
 
-        with self._path.open() as fp:
-            content = yaml.load(fp, yaml.Loader)
-
+        content = self._content
         params_pyobj = content.get("parameters", [])
         decl = content["declaration"]
 
@@ -13,7 +13,7 @@ from typing import Iterable, Mapping, Optional, Tuple, Type, TypeVar, Union
 import pyarrow as pa
 
 from graviti.portex import ptype as PTYPE
-from graviti.portex.base import PortexRecordBase, PortexType
+from graviti.portex.base import PortexRecordBase, PortexType, memoize
 from graviti.portex.enum import EnumValues
 from graviti.portex.factory import ConnectedFieldsFactory
 from graviti.portex.field import Fields
@@ -315,6 +315,7 @@ class record(PortexBuiltinType, PortexRecordBase):  # pylint: disable=invalid-na
             (field.name, cls.from_pyarrow(paarray.field(field.name))) for field in paarray.type
         )
 
+    @memoize
     def to_pyarrow(self, *, _to_backend: bool = False) -> pa.DataType:
         """Convert the Portex type to the corresponding builtin PyArrow DataType.
 
@@ -423,6 +424,7 @@ class array(PortexBuiltinType):  # pylint: disable=invalid-name
             getattr(patype, "list_size", None),
         )
 
+    @memoize
     def _get_column_count(self) -> int:
         """Get the total column count of the portex type.
 
@@ -432,6 +434,7 @@ class array(PortexBuiltinType):  # pylint: disable=invalid-name
         """
         return self.items._get_column_count()  # pylint: disable=protected-access
 
+    @memoize
     def to_pyarrow(self, *, _to_backend: bool = False) -> pa.DataType:
         """Convert the Portex type to the corresponding builtin PyArrow DataType.
 
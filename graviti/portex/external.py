@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 import pyarrow as pa
 
-from graviti.portex.base import PortexType
+from graviti.portex.base import PortexType, memoize
 from graviti.portex.register import ExternalContainerRegister, ExternalElementResgister
 
 if TYPE_CHECKING:
@@ -58,6 +58,7 @@ class PortexExternalType(PortexType):  # pylint: disable=abstract-method
 
         self.__dict__.update(arguments)
 
+    @memoize
     def _get_column_count(self) -> int:
         """Get the total column count of the portex type.
 
@@ -75,8 +76,13 @@ class PortexExternalType(PortexType):  # pylint: disable=abstract-method
             The internal type of the PortexExternalType.
 
         """
+        return self._get_internal_type()
+
+    @memoize
+    def _get_internal_type(self) -> PortexType:
         return self._factory({name: getattr(self, name) for name in self.params})
 
+    @memoize
     def to_pyarrow(self, *, _to_backend: bool = False) -> pa.DataType:
         """Convert the Portex type to the corresponding builtin PyArrow DataType.
 
@@ -86,6 +92,7 @@ class PortexExternalType(PortexType):  # pylint: disable=abstract-method
         """
         return self.internal_type.to_pyarrow(_to_backend=_to_backend)
 
+    @memoize
     def to_builtin(self) -> "PortexBuiltinType":
         """Expand the top level of the Portex external type to Portex builtin type.
 
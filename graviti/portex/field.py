@@ -25,7 +25,7 @@ from typing import (
 
 import pyarrow as pa
 
-from graviti.portex.base import PortexType
+from graviti.portex.base import PortexType, bump_generation
 from graviti.portex.package import Imports
 from graviti.utility import INDENT, FrozenNameOrderedDict, NameOrderedDict
 
@@ -105,7 +105,7 @@ class FrozenFields(FrozenNameOrderedDict[PortexType]):
         raise TypeError(f"Cannot rename '{old_name}' in {self.__class__.__name__}")
 
 
-class Fields(NameOrderedDict[PortexType], FrozenFields):  # type: ignore[misc]
+class Fields(NameOrderedDict[PortexType], FrozenFields):
     """Represents a Portex ``record`` fields dict."""
 
     def __init__(
@@ -113,6 +113,14 @@ class Fields(NameOrderedDict[PortexType], FrozenFields):  # type: ignore[misc]
     ):
         super().__init__(fields)
 
+    def __setitem__(self, key: Union[int, str], value: PortexType) -> None:
+        super().__setitem__(key, value)
+        bump_generation()
+
+    def __delitem__(self, key: Union[int, str]) -> None:
+        super().__delitem__(key)
+        bump_generation()
+
     @property
     def imports(self) -> Imports:
         """Get the Fields imports.
@@ -147,6 +155,7 @@ class Fields(NameOrderedDict[PortexType], FrozenFields):  # type: ignore[misc]
 
         self._keys.insert(index, name)
         self._data[name] = portex_type
+        bump_generation()
 
     def astype(self, name: str, portex_type: PortexType) -> None:
         """Convert the type of the field with the given name to the new PortexType.
@@ -165,6 +174,7 @@ class Fields(NameOrderedDict[PortexType], FrozenFields):  # type: ignore[misc]
             raise KeyError(f'"{name}" does not exist in the Fields')
 
         self._data[name] = portex_type
+        bump_generation()
 
     def rename(self, old_name: str, new_name: str) -> None:
         """Rename the name of a field.
@@ -178,6 +188,7 @@ class Fields(NameOrderedDict[PortexType], FrozenFields):  # type: ignore[misc]
 
         self._data[new_name] = self._data.pop(old_name)
         self._keys[self._keys.index(old_name)] = new_name
+        bump_generation()
 
     @classmethod
     def from_pyobj(
@@ -4,7 +4,11 @@
 #
 """Utility module."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from graviti.utility.attr import AttrDict
+from graviti.utility.audit import trace_fetches
 from graviti.utility.collections import (
     FrozenNameOrderedDict,
     NameOrderedDict,
@@ -16,6 +20,7 @@ from graviti.utility.collections import (
 from graviti.utility.common import (
     CachedProperty,
     LazyAttr,
+    LazyModule,
     ModuleMocker,
     convert_datetime_to_gmt,
     convert_iso_to_datetime,
@@ -25,16 +30,36 @@ from graviti.utility.common import (
 )
 from graviti.utility.engine import Mode, engine
 from graviti.utility.itertools import chunked
+from graviti.utility.metrics import metrics
+from graviti.utility.profile import profile
 from graviti.utility.repr import INDENT, MAX_REPR_ROWS, ReprMixin, ReprType
-from graviti.utility.requests import UserResponse, config, get_session, submit_multithread_tasks
 from graviti.utility.typing import NestedDict, PathLike, SortParam, check_type
 
+if TYPE_CHECKING:
+    from graviti.utility.requests import (
+        UserResponse,
+        config,
+        get_pool_stats,
+        get_session,
+        submit_multithread_tasks,
+    )
+
+# The attributes depend on requests and urllib3, they are imported on the first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "UserResponse": "graviti.utility.requests",
+    "config": "graviti.utility.requests",
+    "get_pool_stats": "graviti.utility.requests",
+    "get_session": "graviti.utility.requests",
+    "submit_multithread_tasks": "graviti.utility.requests",
+}
+
 __all__ = [
     "AttrDict",
     "CachedProperty",
     "FrozenNameOrderedDict",
     "INDENT",
     "LazyAttr",
+    "LazyModule",
     "MAX_REPR_ROWS",
     "Mode",
     "ModuleMocker",
@@ -55,9 +80,28 @@ __all__ = [
     "convert_datetime_to_gmt",
     "convert_iso_to_datetime",
     "engine",
+    "get_pool_stats",
     "get_session",
     "locked",
+    "metrics",
+    "profile",
     "shorten",
     "submit_multithread_tasks",
+    "trace_fetches",
     "urlnorm",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
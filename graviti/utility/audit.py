@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the lazy load fetch tracing."""
+
+import contextlib
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import local
+from time import perf_counter
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+_SKIPPED_ROOTS = (str(Path(__file__).parents[1]), contextlib.__file__)
+
+_TRACES: List["FetchTrace"] = []
+_SPANS = local()
+
+
+def _get_call_site() -> str:
+    frame = sys._getframe(2)  # pylint: disable=protected-access
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_SKIPPED_ROOTS):
+        frame = frame.f_back
+
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+
+class FetchRecord:  # pylint: disable=too-many-instance-attributes
+    """The record of one fetch.
+
+    Arguments:
+        kind: The kind of the fetch. "page" for requesting a page of the source data,
+            "column" for loading a page of a column, "object" for getting a binary file.
+        source: The description of the data source.
+        column: The path of the column which triggers the fetch.
+        page: The page number.
+        call_site: The user code which triggers the fetch.
+
+    """
+
+    __slots__ = ("kind", "source", "column", "page", "call_site", "duration", "nbytes")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, kind: str, source: str, column: str, page: Optional[int], call_site: str
+    ) -> None:
+        self.kind = kind
+        self.source = source
+        self.column = column
+        self.page = page
+        self.call_site = call_site
+        self.duration = 0.0
+        self.nbytes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"FetchRecord(kind={self.kind!r}, source={self.source!r}, column={self.column!r}, "
+            f"page={self.page}, duration={self.duration:.6f}, nbytes={self.nbytes}, "
+            f"call_site={self.call_site!r})"
+        )
+
+
+class FetchTrace:
+    """The trace of all the fetches happened in :func:`trace_fetches` context."""
+
+    def __init__(self) -> None:
+        self.records: List[FetchRecord] = []
+
+    def _get_redundant(self, kind: str) -> List[Dict[str, Any]]:
+        groups: DefaultDict[Tuple[str, str, Optional[int]], List[FetchRecord]] = defaultdict(list)
+        for record in self.records:
+            if record.kind == kind:
+                groups[record.source, record.column, record.page].append(record)
+
+        return [
+            {
+                "source": source,
+                "column": column,
+                "page": page,
+                "count": len(records),
+                "call_sites": dict(Counter(record.call_site for record in records)),
+            }
+            for (source, column, page), records in groups.items()
+            if len(records) > 1
+        ]
+
+    def _get_out_of_order(self) -> List[Dict[str, Any]]:
+        previous_pages: Dict[str, int] = {}
+        jumps = []
+        for record in self.records:
+            if record.kind != "page" or record.page is None:
+                continue
+
+            previous = previous_pages.get(record.source)
+            if previous is not None and record.page != previous + 1:
+                jumps.append(
+                    {
+                        "source": record.source,
+                        "from": previous,
+                        "to": record.page,
+                        "call_site": record.call_site,
+                    }
+                )
+            previous_pages[record.source] = record.page
+
+        return jumps
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the fetches.
+
+        Returns:
+            A dict contains the total count, duration and bytes of each kind of fetches,
+            the redundant page, column and object fetches, the out-of-order page fetches,
+            and the call sites which trigger the most fetches.
+
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for record in self.records:
+            total = totals.setdefault(record.kind, {"count": 0, "duration": 0.0, "bytes": 0})
+            total["count"] += 1
+            total["duration"] += record.duration
+            total["bytes"] += record.nbytes
+
+        return {
+            "totals": totals,
+            "redundant_pages": self._get_redundant("page"),
+            "redundant_columns": self._get_redundant("column"),
+            "redundant_objects": self._get_redundant("object"),
+            "out_of_order_pages": self._get_out_of_order(),
+            "call_sites": Counter(
+                record.call_site for record in self.records if record.kind != "column"
+            ).most_common(10),
+        }
+
+    def report(self) -> str:
+        """Get the human readable report of the fetches.
+
+        Returns:
+            The report string.
+
+        """
+        summary = self.summary()
+        lines = ["Fetch totals:"]
+        for kind, total in summary["totals"].items():
+            lines.append(
+                f"  {kind:<8}{total['count']:>8} fetches{total['duration']:>12.3f}s"
+                f"{total['bytes']:>14} bytes"
+            )
+
+        for name in ("redundant_pages", "redundant_columns", "redundant_objects"):
+            items = summary[name]
+            if not items:
+                continue
+
+            lines.append(f"{name.replace('_', ' ').capitalize()}: {len(items)}")
+            for item in items[:10]:
+                location = f"{item['source']} {item['column']}".strip()
+                lines.append(f"  {location} page={item['page']} x{item['count']}")
+                for call_site, count in item["call_sites"].items():
+                    lines.append(f"    {count:>4} from {call_site}")
+
+        jumps = summary["out_of_order_pages"]
+        if jumps:
+            lines.append(f"Out-of-order page fetches: {len(jumps)}")
+            for jump in jumps[:10]:
+                lines.append(
+                    f"  {jump['source']} page {jump['from']} -> {jump['to']} "
+                    f"from {jump['call_site']}"
+                )
+
+        lines.append("Top call sites:")
+        for call_site, count in summary["call_sites"]:
+            lines.append(f"  {count:>6} {call_site}")
+
+        return "\n".join(lines)
+
+
+def is_tracing() -> bool:
+    """Check whether any :func:`trace_fetches` context is active.
+
+    Returns:
+        Whether the fetches are being traced.
+
+    """
+    return bool(_TRACES)
+
+
+@contextmanager
+def trace_fetch(
+    kind: str, source: str = "", column: str = "", page: Optional[int] = None
+) -> Iterator[Optional[FetchRecord]]:
+    """Trace one fetch when the tracing is enabled.
+
+    The fetches which do not know their source, column and page can get them from
+    :func:`annotate_fetch` called inside the context.
+
+    Arguments:
+        kind: The kind of the fetch.
+        source: The description of the data source.
+        column: The path of the column which triggers the fetch.
+        page: The page number.
+
+    Yields:
+        The fetch record whose ``nbytes`` can be set by the caller,
+        ``None`` when the tracing is disabled.
+
+    """
+    if not _TRACES:
+        yield None
+        return
+
+    record = FetchRecord(kind, source, column, page, _get_call_site())
+    spans: List[FetchRecord] = _SPANS.__dict__.setdefault("stack", [])
+    spans.append(record)
+    start = perf_counter()
+    try:
+        yield record
+    finally:
+        record.duration = perf_counter() - start
+        spans.pop()
+        for trace in _TRACES:
+            trace.records.append(record)
+
+
+def annotate_fetch(source: str, column: str, page: int) -> None:
+    """Set the source, column and page of the enclosing fetches which do not know them.
+
+    e.g. a lazy page only knows its column after it requests the factory.
+
+    Arguments:
+        source: The description of the data source.
+        column: The path of the column.
+        page: The page number.
+
+    """
+    for record in getattr(_SPANS, "stack", ()):
+        if not record.column:
+            record.source, record.column, record.page = source, column, page
+
+
+@contextmanager
+def trace_fetches() -> Iterator[FetchTrace]:
+    """Trace the network fetches triggered by the lazy loaded DataFrame and the remote files.
+
+    Examples:
+        >>> from graviti.utility.audit import trace_fetches
+        >>> with trace_fetches() as trace:
+        ...     for i in range(len(df)):
+        ...         df.loc[i]["x"]
+        ...
+        >>> print(trace.report())
+
+    Yields:
+        The trace which collects all the fetches in the context.
+
+    """
+    trace = FetchTrace()
+    _TRACES.append(trace)
+    try:
+        yield trace
+    finally:
+        _TRACES.remove(trace)
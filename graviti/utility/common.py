@@ -6,10 +6,11 @@
 """Common tools."""
 
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime
 from functools import wraps
-from sys import version_info
+from importlib import import_module
 from threading import Lock
+from types import ModuleType
 from typing import Any, Callable, DefaultDict, Generic, Optional, Type, TypeVar, Union, overload
 
 from typing_extensions import Protocol
@@ -81,36 +82,17 @@ def shorten(origin: str) -> str:
     return origin[:7]
 
 
-if version_info >= (3, 7):
+def convert_iso_to_datetime(date_string: str) -> datetime:
+    """Convert iso 8601 format string to datetime format time with local timezone.
 
-    def convert_iso_to_datetime(date_string: str) -> datetime:
-        """Convert iso 8601 format string to datetime format time with local timezone.
-
-        Arguments:
-            date_string: The iso 8601 format string.
-
-        Returns:
-            The datetime format time with local timezone.
-
-        """
-        return datetime.fromisoformat(date_string.replace("Z", "+00:00")).astimezone()
-
-else:
-    _DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
-
-    def convert_iso_to_datetime(date_string: str) -> datetime:
-        """Convert iso 8601 format string to datetime format time with local timezone.
-
-        Arguments:
-            date_string: The iso 8601 format string.
+    Arguments:
+        date_string: The iso 8601 format string.
 
-        Returns:
-            The datetime format time with local timezone.
+    Returns:
+        The datetime format time with local timezone.
 
-        """
-        return (
-            datetime.strptime(date_string, _DATE_FORMAT).replace(tzinfo=timezone.utc).astimezone()
-        )
+    """
+    return datetime.fromisoformat(date_string.replace("Z", "+00:00")).astimezone()
 
 
 def convert_datetime_to_gmt(utctime: datetime) -> str:
@@ -219,3 +201,26 @@ class ModuleMocker:
 
     def __getattribute__(self, name: str) -> Any:
         raise ModuleNotFoundError(super().__getattribute__("_message"))
+
+
+class LazyModule:
+    """A proxy module which imports the real module on the first attribute access.
+
+    Arguments:
+        name: The name of the real module.
+
+    Raises:
+        ModuleNotFoundError: When accessing the attributes if the real module is not installed.
+
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, name: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = import_module(self._name)
+
+        return getattr(module, name)
@@ -10,15 +10,22 @@ from typing import Any
 
 
 class Mode(Enum):
-    """This class defines the engine mode and includes 'LOCAl' and 'ONLINE'."""
+    """This class defines the engine mode and includes 'AUTO', 'LOCAl' and 'ONLINE'.
 
+    'AUTO' executes the operations locally when the data is loaded or not in a Commit, and online
+    otherwise. 'LOCAL' and 'ONLINE' force the execution mode.
+
+    """
+
+    AUTO = auto()
     LOCAL = auto()
     ONLINE = auto()
 
 
-class Online:
-    """An engine controller used to start and stop the online mode."""
+class Controller:
+    """An engine controller used to switch the engine mode in a with block."""
 
+    _mode: Mode
     _old_mode: Mode
 
     def __init__(self, _engine: "Engine") -> None:
@@ -26,16 +33,28 @@ class Online:
 
     def __enter__(self) -> None:
         self._old_mode = self._engine.mode
-        self._engine.mode = Mode.ONLINE
+        self._engine.mode = self._mode
 
     def __exit__(self, *_: Any) -> None:
         self._engine.mode = self._old_mode
 
 
+class Online(Controller):
+    """An engine controller used to start and stop the online mode."""
+
+    _mode = Mode.ONLINE
+
+
+class Local(Controller):
+    """An engine controller used to start and stop the local mode."""
+
+    _mode = Mode.LOCAL
+
+
 class Engine:
     """This is a base class defining the Engine mode."""
 
-    mode = Mode.LOCAL
+    mode = Mode.AUTO
 
     def online(self) -> Online:
         """Init a Online instance.
@@ -46,5 +65,31 @@ class Engine:
         """
         return Online(self)
 
+    def local(self) -> Local:
+        """Init a Local instance.
+
+        Returns:
+            the Local instance.
+
+        """
+        return Local(self)
+
+    def get_execution_mode(self, is_loaded: bool, is_online_available: bool) -> Mode:
+        """Get the mode to execute an operation with, according to the residency of the data.
+
+        Arguments:
+            is_loaded: Whether all the data needed by the operation is loaded.
+            is_online_available: Whether the operation can be executed online.
+
+        Returns:
+            ``Mode.LOCAL`` or ``Mode.ONLINE``.
+
+        """
+        mode = self.mode
+        if mode != Mode.AUTO:
+            return mode
+
+        return Mode.ONLINE if is_online_available and not is_loaded else Mode.LOCAL
+
 
 engine = Engine()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the hedged requests."""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple, TypeVar
+
+from graviti.utility.requests import config
+
+_T = TypeVar("_T")
+
+_MAX_CREDITS = 10.0
+
+EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    pid = os.getpid()
+    executor = EXECUTORS.get(pid)
+    if executor is None:
+        executor = EXECUTORS.setdefault(
+            pid, ThreadPoolExecutor(config.hedge_workers, thread_name_prefix="graviti-hedge")
+        )
+
+    return executor
+
+
+def _discard(future: "Future[Any]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close is not None:
+            close()
+
+
+class LatencyWindow:
+    """The sliding window of the recent request latencies.
+
+    Arguments:
+        size: The max number of the latencies kept in the window.
+        min_samples: The min number of the latencies required to calculate the percentile.
+
+    """
+
+    def __init__(self, size: int, min_samples: int) -> None:
+        self._latencies: Deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+
+    def add(self, latency: float) -> None:
+        """Add a latency into the window.
+
+        Arguments:
+            latency: The latency in seconds.
+
+        """
+        self._latencies.append(latency)
+
+    def get_percentile(self, quantile: float) -> Optional[float]:
+        """Get the percentile of the latencies in the window.
+
+        Arguments:
+            quantile: The quantile of the percentile, in range [0, 1].
+
+        Returns:
+            The percentile latency in seconds, ``None`` if the samples are not enough.
+
+        """
+        latencies = sorted(self._latencies)
+        if len(latencies) < self._min_samples:
+            return None
+
+        return latencies[min(int(len(latencies) * quantile), len(latencies) - 1)]
+
+
+class HedgePolicy:
+    """The policy to send a duplicate request when the original one is slower than usual.
+
+    The duplicate request is sent when the original one does not finish within the observed
+    percentile latency, whichever finishes first wins. Every request earns ``budget`` credit and
+    every duplicate request costs one, which caps the extra load at about ``budget`` ratio.
+
+    Arguments:
+        quantile: The latency quantile after which the duplicate request is sent.
+        budget: The max ratio of the duplicate requests to all the requests.
+        window: The number of the recent latencies used to calculate the percentile.
+        min_samples: The min number of latencies observed before hedging starts.
+
+    """
+
+    def __init__(
+        self, quantile: float = 0.95, budget: float = 0.05, window: int = 200, min_samples: int = 20
+    ) -> None:
+        self._quantile = quantile
+        self._budget = budget
+        self._window = LatencyWindow(window, min_samples)
+        self._credits = 0.0
+        self._lock = Lock()
+
+        self.hedged_count = 0
+        self.hedge_wins = 0
+
+    def _spend_credit(self) -> bool:
+        with self._lock:
+            if self._credits < 1:
+                return False
+
+            self._credits -= 1
+            self.hedged_count += 1
+            return True
+
+    def send(self, sender: Callable[[], _T]) -> _T:
+        """Send the request with hedging.
+
+        Arguments:
+            sender: The function to send the request, it is called again for the duplicate request.
+
+        Returns:
+            The result of the request which finishes first.
+
+        Raises:
+            error: The error raised by the sender of the first failed request when all the
+                requests failed.
+
+        """
+
+        def run() -> _T:
+            start = monotonic()
+            result = sender()
+            self._window.add(monotonic() - start)
+            return result
+
+        with self._lock:
+            self._credits = min(self._credits + self._budget, _MAX_CREDITS)
+
+        delay = self._window.get_percentile(self._quantile)
+        if delay is None:
+            return run()
+
+        executor = _get_executor()
+        primary = executor.submit(run)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+
+        if not self._spend_credit():
+            return primary.result()
+
+        hedge = executor.submit(run)
+        pending: Set["Future[_T]"] = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                exception = future.exception()
+                if exception is None:
+                    for loser in pending:
+                        loser.add_done_callback(_discard)
+                    if future is hedge:
+                        self.hedge_wins += 1
+                    return future.result()
+
+                if error is None:
+                    error = exception
+
+        assert error is not None
+        raise error
+
+
+HEDGE_POLICIES: Dict[Tuple[int, str], HedgePolicy] = {}
+
+
+def get_hedge_policy(operation: str) -> Optional[HedgePolicy]:
+    """Get the hedge policy of the given operation for the current process.
+
+    Arguments:
+        operation: The name of the operation, latencies are tracked separately per operation.
+
+    Returns:
+        The hedge policy of the operation, ``None`` if hedging is disabled.
+
+    """
+    if not config.hedge_requests:
+        return None
+
+    key = (os.getpid(), operation)
+    policy = HEDGE_POLICIES.get(key)
+    if policy is None:
+        policy = HEDGE_POLICIES.setdefault(
+            key,
+            HedgePolicy(config.hedge_quantile, config.hedge_budget),
+        )
+
+    return policy
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the client side adaptive concurrency and rate limiter."""
+
+import os
+from email.utils import parsedate_to_datetime
+from threading import Condition
+from time import monotonic, time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from requests.exceptions import Timeout
+from requests.models import Response
+
+from graviti.exception import ResponseError
+from graviti.utility.requests import config
+
+_CONGESTION_STATUS = {429, 503}
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0.0)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _inspect_response(response: Response) -> Tuple[bool, Optional[float]]:
+    """Check whether the response (or the retries before it) indicates server congestion.
+
+    Arguments:
+        response: The final response of the request.
+
+    Returns:
+        Whether the server is congested, and the "Retry-After" seconds if the server gives one.
+
+    """
+    congested = response.status_code in _CONGESTION_STATUS
+
+    retries = getattr(response.raw, "retries", None)
+    if retries is not None:
+        congested = congested or any(
+            history.status in _CONGESTION_STATUS for history in retries.history
+        )
+
+    return congested, _parse_retry_after(response.headers.get("Retry-After"))
+
+
+class AdaptiveLimiter:  # pylint: disable=too-many-instance-attributes
+    """The limiter which combines an AIMD concurrency limit and a token bucket.
+
+    The concurrency limit grows additively (about one slot per round of successful requests) and
+    shrinks multiplicatively when the server responds 429/503 or the request times out. Only
+    the requests started after the last decrease can shrink the limit again, so a burst of
+    congested responses from the same round only counts once.
+
+    The token bucket caps the request rate, and "Retry-After" given by the server pauses all the
+    requests sharing this limiter.
+
+    Arguments:
+        max_concurrency: The upper bound of the concurrency limit.
+        min_concurrency: The lower bound of the concurrency limit.
+        rate: The max requests per second, ``None`` means no rate limit.
+        burst: The capacity of the token bucket, defaults to ``max_concurrency``.
+        backoff: The multiplicative decrease factor of the concurrency limit.
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        backoff: float = 0.5,
+    ) -> None:
+        self._condition = Condition()
+        self._max_concurrency = max_concurrency
+        self._min_concurrency = min(min_concurrency, max_concurrency)
+        self._backoff = backoff
+        self._limit = float(max_concurrency)
+        self._inflight = 0
+
+        self._rate = rate
+        self._capacity = float(burst if burst is not None else max_concurrency)
+        self._tokens = self._capacity
+        self._refilled_at = monotonic()
+
+        self._paused_until = 0.0
+        self._decreased_at = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Return the current concurrency limit.
+
+        Returns:
+            The current concurrency limit.
+
+        """
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        """Return the number of the requests in flight.
+
+        Returns:
+            The number of the requests in flight.
+
+        """
+        return self._inflight
+
+    def _get_token_wait(self, now: float) -> float:
+        if self._rate is None:
+            return 0.0
+
+        self._tokens = min(self._capacity, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+
+    def acquire(self) -> float:
+        """Block until the request is allowed to be sent.
+
+        Returns:
+            The start time of the request, which needs to be passed to :meth:`release`.
+
+        """
+        with self._condition:
+            while True:
+                now = monotonic()
+                wait_time = max(self._paused_until - now, self._get_token_wait(now))
+                if wait_time <= 0 and self._inflight < self._limit:
+                    self._inflight += 1
+                    if self._rate is not None:
+                        self._tokens -= 1
+                    return now
+
+                self._condition.wait(wait_time if wait_time > 0 else None)
+
+    def release(
+        self, started_at: float, congested: bool = False, retry_after: Optional[float] = None
+    ) -> None:
+        """Release the slot and adjust the concurrency limit by the result of the request.
+
+        Arguments:
+            started_at: The start time returned by :meth:`acquire`.
+            congested: Whether the server is congested.
+            retry_after: The seconds the server asks to wait before the next request.
+
+        """
+        with self._condition:
+            self._inflight -= 1
+            now = monotonic()
+            if congested:
+                if started_at >= self._decreased_at:
+                    self._limit = max(self._min_concurrency, self._limit * self._backoff)
+                    self._decreased_at = now
+            else:
+                self._limit = min(self._max_concurrency, self._limit + 1 / self._limit)
+
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            self._condition.notify_all()
+
+    def send(self, sender: Callable[..., Response], *args: Any, **kwargs: Any) -> Response:
+        """Send the request under the control of this limiter.
+
+        Arguments:
+            sender: The function to send the request.
+            *args: The arguments of the sender.
+            **kwargs: The keyword arguments of the sender.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            ResponseError: When the status code of the response is unexpected.
+            Timeout: When the request timed out.
+
+        """
+        started_at = self.acquire()
+        congested, retry_after = False, None
+        try:
+            response = sender(*args, **kwargs)
+            congested, retry_after = _inspect_response(response)
+            return response
+        except ResponseError as error:
+            congested, retry_after = _inspect_response(error.response)
+            raise
+        except Timeout:
+            congested = True
+            raise
+        finally:
+            self.release(started_at, congested, retry_after)
+
+
+LIMITERS: Dict[Tuple[int, str], AdaptiveLimiter] = {}
+
+
+def get_limiter(endpoint: str) -> Optional[AdaptiveLimiter]:
+    """Get the limiter of the given endpoint class for the current process.
+
+    Arguments:
+        endpoint: The endpoint class, "openapi" or "storage".
+
+    Returns:
+        The limiter of the endpoint class, ``None`` if the limiter is disabled.
+
+    """
+    if not config.adaptive_limit:
+        return None
+
+    key = (os.getpid(), endpoint)
+    limiter = LIMITERS.get(key)
+    if limiter is None:
+        limiter = LIMITERS.setdefault(
+            key,
+            AdaptiveLimiter(
+                config.max_concurrency[endpoint],
+                config.min_concurrency,
+                config.rate_limit[endpoint],
+            ),
+        )
+
+    return limiter
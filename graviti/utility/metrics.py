@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the request metrics."""
+
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union
+
+# The upper bounds (in seconds) of the latency histogram buckets, the last bucket is "+Inf".
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Exporter = Callable[[str, str, Dict[str, Any]], None]
+
+
+class RequestMetric:  # pylint: disable=too-many-instance-attributes
+    """The metric of the requests of one OpenAPI operation or one storage verb."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.status_codes: DefaultDict[Union[int, str], int] = defaultdict(int)
+
+    def observe(self, sample: Dict[str, Any]) -> None:
+        """Add a request sample into the metric.
+
+        Arguments:
+            sample: The sample of the request.
+
+        """
+        latency = sample["latency"]
+        self.count += 1
+        self.retries += sample["retries"]
+        self.bytes_in += sample["bytes_in"]
+        self.bytes_out += sample["bytes_out"]
+        self.latency_sum += latency
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.status_codes[sample["status"]] += 1
+        if sample["error"]:
+            self.errors += 1
+
+    def get_percentile(self, quantile: float) -> Optional[float]:
+        """Estimate the latency percentile by the upper bound of the histogram bucket.
+
+        Arguments:
+            quantile: The quantile of the percentile, in range [0, 1].
+
+        Returns:
+            The estimated latency percentile in seconds, ``None`` if there is no sample.
+
+        """
+        if self.count == 0:
+            return None
+
+        rank = quantile * self.count
+        accumulated = 0
+        for index, bucket_count in enumerate(self.latency_buckets):
+            accumulated += bucket_count
+            if accumulated >= rank:
+                return LATENCY_BUCKETS[index] if index < len(LATENCY_BUCKETS) else float("inf")
+
+        return float("inf")
+
+    def to_pyobj(self) -> Dict[str, Any]:
+        """Dump the metric into a python object.
+
+        Returns:
+            A python dict representation of the metric.
+
+        """
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "latency": {
+                "sum": self.latency_sum,
+                "mean": self.latency_sum / self.count if self.count else None,
+                "p50": self.get_percentile(0.5),
+                "p95": self.get_percentile(0.95),
+                "p99": self.get_percentile(0.99),
+                "buckets": dict(
+                    zip((*map(str, LATENCY_BUCKETS), "+Inf"), self.latency_buckets),
+                ),
+            },
+            "status_codes": dict(self.status_codes),
+        }
+
+
+class Metrics:
+    """The registry of the request metrics.
+
+    The metrics are grouped by the endpoint class, "openapi" metrics are keyed by the OpenAPI
+    operation (the name of the public function in :mod:`graviti.openapi`), and "storage" metrics are
+    keyed by the HTTP verb. Recording is disabled by default, the only overhead then is checking
+    the ``enabled`` flag.
+
+    Examples:
+        >>> from graviti import metrics
+        >>> metrics.enable()
+        >>> ...  # run the workload
+        >>> metrics.snapshot()["openapi"]["list_commit_data"]["latency"]["p95"]
+        0.5
+
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = Lock()
+        self._metrics: Dict[Tuple[str, str], RequestMetric] = {}
+        self._exporters: List[Exporter] = []
+
+    def enable(self) -> None:
+        """Start recording the request metrics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording the request metrics."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear all the recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    def add_exporter(self, exporter: Exporter) -> None:
+        """Add an exporter which is called with every recorded request sample.
+
+        The exporter is called with the endpoint class, the operation or verb name and the sample
+        dict, which contains "latency", "status", "retries", "bytes_in", "bytes_out" and "error".
+        It can be used to forward the samples into Prometheus or StatsD.
+
+        Arguments:
+            exporter: The exporter function.
+
+        """
+        self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter: Exporter) -> None:
+        """Remove the given exporter.
+
+        Arguments:
+            exporter: The exporter function to remove.
+
+        """
+        self._exporters.remove(exporter)
+
+    def record(self, endpoint: str, name: str, **sample: Any) -> None:
+        """Record a request sample.
+
+        Arguments:
+            endpoint: The endpoint class, "openapi" or "storage".
+            name: The name of the OpenAPI operation or the HTTP verb of the storage request.
+            **sample: The sample of the request, which contains "latency", "status", "retries",
+                "bytes_in", "bytes_out" and "error".
+
+        """
+        key = (endpoint, name)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = RequestMetric()
+            metric.observe(sample)
+
+        for exporter in self._exporters:
+            exporter(endpoint, name, sample)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get the snapshot of all the recorded metrics.
+
+        Returns:
+            The metrics grouped by the endpoint class and the operation or verb name.
+
+        """
+        result: DefaultDict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+        with self._lock:
+            for (endpoint, name), metric in self._metrics.items():
+                result[endpoint][name] = metric.to_pyobj()
+
+        return dict(result)
+
+
+metrics = Metrics()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+#
+# Copyright 2022 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the phase breakdown profiler."""
+
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter, process_time, thread_time
+from typing import Any, Dict, Iterator, List, Optional
+
+_PROFILES: List["Profile"] = []
+_PHASES = local()
+
+
+class PhaseRecord:
+    """The record of one execution of a phase.
+
+    Arguments:
+        name: The name of the phase.
+
+    """
+
+    __slots__ = ("name", "wall", "cpu", "child_wall", "child_cpu", "nbytes")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.nbytes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PhaseRecord(name={self.name!r}, wall={self.wall:.6f}, cpu={self.cpu:.6f}, "
+            f"nbytes={self.nbytes})"
+        )
+
+
+class PhaseStat:
+    """The accumulated statistics of one phase.
+
+    The ``wall`` and ``cpu`` are the exclusive time, which excludes the time of the phases nested
+    inside, so the nested time is not counted twice. The ``total_wall`` is the inclusive wall time.
+
+    """
+
+    __slots__ = ("calls", "wall", "cpu", "total_wall", "nbytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.total_wall = 0.0
+        self.nbytes = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PhaseStat(calls={self.calls}, wall={self.wall:.6f}, cpu={self.cpu:.6f}, "
+            f"total_wall={self.total_wall:.6f}, nbytes={self.nbytes})"
+        )
+
+    def add(self, record: PhaseRecord) -> None:
+        """Add one phase record into the statistics.
+
+        Arguments:
+            record: The phase record.
+
+        """
+        self.calls += 1
+        self.wall += record.wall - record.child_wall
+        self.cpu += record.cpu - record.child_cpu
+        self.total_wall += record.wall
+        self.nbytes += record.nbytes
+
+
+class Profile:
+    """The phase breakdown of the operations happened in :func:`profile` context."""
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, PhaseStat] = {}
+        self.wall = 0.0
+        self.cpu = 0.0
+        self._lock = Lock()
+
+    def _add(self, record: PhaseRecord) -> None:
+        with self._lock:
+            stat = self.phases.get(record.name)
+            if stat is None:
+                stat = self.phases[record.name] = PhaseStat()
+            stat.add(record)
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the phases.
+
+        Returns:
+            A dict contains the wall time and CPU time of the whole profile, and the calls,
+            exclusive wall time, exclusive CPU time, inclusive wall time and bytes of each phase.
+
+        """
+        with self._lock:
+            phases = {
+                name: {
+                    "calls": stat.calls,
+                    "wall": stat.wall,
+                    "cpu": stat.cpu,
+                    "total_wall": stat.total_wall,
+                    "bytes": stat.nbytes,
+                }
+                for name, stat in sorted(
+                    self.phases.items(), key=lambda item: item[1].wall, reverse=True
+                )
+            }
+
+        return {"wall": self.wall, "cpu": self.cpu, "phases": phases}
+
+    def report(self) -> str:
+        """Get the human readable table of the phases.
+
+        The phases are sorted by the exclusive wall time. The phases running in the worker
+        threads overlap, so their time can add up to more than the profiled wall time.
+
+        Returns:
+            The report string.
+
+        """
+        summary = self.summary()
+        wall = summary["wall"]
+        lines = [
+            f"{'phase':<14}{'calls':>10}{'wall(s)':>12}{'wall%':>8}{'cpu(s)':>12}"
+            f"{'total(s)':>12}{'bytes':>16}"
+        ]
+        for name, phase in summary["phases"].items():
+            percent = phase["wall"] / wall * 100 if wall else 0.0
+            lines.append(
+                f"{name:<14}{phase['calls']:>10}{phase['wall']:>12.3f}{percent:>7.1f}%"
+                f"{phase['cpu']:>12.3f}{phase['total_wall']:>12.3f}{phase['bytes']:>16}"
+            )
+
+        lines.append(f"{'profiled':<14}{'':>10}{wall:>12.3f}{'':>8}{summary['cpu']:>12.3f}")
+        return "\n".join(lines)
+
+
+def is_profiling() -> bool:
+    """Check whether any :func:`profile` context is active.
+
+    Returns:
+        Whether the phases are being profiled.
+
+    """
+    return bool(_PROFILES)
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[Optional[PhaseRecord]]:
+    """Measure one phase when the profiling is enabled.
+
+    The time of the phases nested inside is excluded from the exclusive time of this phase.
+
+    Arguments:
+        name: The name of the phase.
+
+    Yields:
+        The phase record whose ``nbytes`` can be set by the caller,
+        ``None`` when the profiling is disabled.
+
+    """
+    if not _PROFILES:
+        yield None
+        return
+
+    record = PhaseRecord(name)
+    stack: List[PhaseRecord] = _PHASES.__dict__.setdefault("stack", [])
+    stack.append(record)
+    wall, cpu = perf_counter(), thread_time()
+    try:
+        yield record
+    finally:
+        record.wall = perf_counter() - wall
+        record.cpu = thread_time() - cpu
+        stack.pop()
+        if stack:
+            parent = stack[-1]
+            parent.child_wall += record.wall
+            parent.child_cpu += record.cpu
+
+        for instance in _PROFILES:
+            instance._add(record)  # pylint: disable=protected-access
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Profile the phases of the DataFrame operations.
+
+    The phases are "network" for the http requests, "decode" for decoding the responses of the
+    lazy load pages, "pa_array" for converting the pages to pyarrow arrays, "mapper" for creating
+    the python objects of the nested DataFrames and files, "to_backend" for converting the
+    DataFrames to the upload data, "checksum" for hashing the local files and "put_object" for
+    uploading the local files.
+
+    Examples:
+        >>> import graviti
+        >>> with graviti.profile() as p:
+        ...     df.to_pandas()
+        ...
+        >>> print(p.report())
+
+    Yields:
+        The profile which collects all the phases in the context.
+
+    """
+    instance = Profile()
+    _PROFILES.append(instance)
+    wall, cpu = perf_counter(), process_time()
+    try:
+        yield instance
+    finally:
+        instance.wall = perf_counter() - wall
+        instance.cpu = process_time() - cpu
+        _PROFILES.remove(instance)
@@ -9,7 +9,7 @@ import logging
 import os
 from collections import defaultdict
 from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
-from typing import Any, Callable, DefaultDict, Iterable, Optional, TypeVar
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, TypeVar
 
 import urllib3
 from requests import Session
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 _CHUNK_SIZE = 8 * 1024
 
+OPENAPI = "openapi"
+STORAGE = "storage"
+
 
 def _get_allowed_methods_keyword() -> str:
     splits = urllib3.__version__.split(".", 2)
@@ -38,7 +41,7 @@ def _get_allowed_methods_keyword() -> str:
 _ALLOWED_METHODS = _get_allowed_methods_keyword()
 
 
-class Config:
+class Config:  # pylint: disable=too-many-instance-attributes
     """This is a base class defining the concept of Request Config.
 
     Attributes:
@@ -46,8 +49,26 @@ class Config:
         allowed_retry_methods: The allowed methods for retrying request.
         allowed_retry_status: The allowed status for retrying request.
             If both methods and status are fitted, the retrying strategy will work.
+        retry_backoff_factor: The backoff factor between the retries, the retries sleep
+            ``retry_backoff_factor * 2 ** (retry_times - 1)`` seconds to avoid retrying in lockstep.
         timeout: Timeout value of the request in seconds.
         is_internal: Whether the request is from internal.
+        adaptive_limit: Whether to limit the concurrency and the rate of the requests adaptively.
+        max_concurrency: The max concurrent requests of each endpoint class,
+            "openapi" for the Graviti OpenAPI and "storage" for the object storage.
+        min_concurrency: The lower bound the adaptive concurrency limit can decrease to.
+        rate_limit: The max requests per second of each endpoint class, ``None`` means no limit.
+        hedge_requests: Whether to send a duplicate request when an OpenAPI GET request is slower
+            than the ``hedge_quantile`` latency of the recent requests of the same operation.
+        hedge_quantile: The latency quantile after which the duplicate request is sent.
+        hedge_budget: The max ratio of the duplicate requests to all the hedgeable requests.
+        hedge_workers: The number of the threads used to send the hedged requests.
+        pool_connections: The number of the hosts whose connection pools are cached,
+            each endpoint class has its own cache.
+        pool_maxsize: The max connections kept in the pool of each host of each endpoint class,
+            ``None`` means sizing the pool to the concurrency of the endpoint class.
+        pool_block: Whether to block when all the connections of the pool are in use,
+            otherwise a new connection is created and discarded after the request.
 
     """
 
@@ -56,11 +77,46 @@ class Config:
         self.max_retries = 3
         self.allowed_retry_methods = ["HEAD", "OPTIONS", "POST", "PUT"]
         self.allowed_retry_status = [429, 500, 502, 503, 504]
+        self.retry_backoff_factor = 0.5
 
         self.timeout = 30
         self.is_internal = False
         self._x_source = "PYTHON-SDK"
 
+        self.adaptive_limit = True
+        self.max_concurrency: Dict[str, int] = {"openapi": 16, "storage": 32}
+        self.min_concurrency = 1
+        self.rate_limit: Dict[str, Optional[float]] = {"openapi": None, "storage": None}
+
+        self.hedge_requests = False
+        self.hedge_quantile = 0.95
+        self.hedge_budget = 0.05
+        self.hedge_workers = 32
+
+        self.pool_connections = 10
+        self.pool_maxsize: Dict[str, Optional[int]] = {"openapi": None, "storage": None}
+        self.pool_block = False
+
+    def get_pool_maxsize(self, endpoint: str) -> int:
+        """Get the max connections kept in the pool of each host of the given endpoint class.
+
+        Arguments:
+            endpoint: The endpoint class, "openapi" or "storage".
+
+        Returns:
+            The max connections kept in the pool.
+
+        """
+        maxsize = self.pool_maxsize[endpoint]
+        if maxsize is not None:
+            return maxsize
+
+        maxsize = self.max_concurrency[endpoint]
+        if endpoint == OPENAPI and self.hedge_requests:
+            maxsize += self.hedge_workers
+
+        return maxsize
+
 
 config = Config()
 
@@ -109,21 +165,71 @@ class TimeoutHTTPAdapter(HTTPAdapter):
 
 
 class UserSession(Session):
-    """This class defines UserSession."""
+    """This class defines UserSession.
 
-    def __init__(self) -> None:
+    Arguments:
+        endpoint: The endpoint class the session sends requests to, "openapi" or "storage".
+            The connection pools are sized to the concurrency of the endpoint class.
+
+    """
+
+    def __init__(self, endpoint: str = OPENAPI) -> None:
         super().__init__()
         # self.session.hooks["response"] = [logging_hook]
 
         retry_strategy = Retry(
             total=config.max_retries,
             status_forcelist=config.allowed_retry_status,
+            backoff_factor=config.retry_backoff_factor,
             raise_on_status=False,
             **{_ALLOWED_METHODS: config.allowed_retry_methods},
         )
 
-        self.mount("http://", TimeoutHTTPAdapter(20, 20, retry_strategy))
-        self.mount("https://", TimeoutHTTPAdapter(20, 20, retry_strategy))
+        pool_maxsize = config.get_pool_maxsize(endpoint)
+        for prefix in ("http://", "https://"):
+            self.mount(
+                prefix,
+                TimeoutHTTPAdapter(
+                    config.pool_connections,
+                    pool_maxsize,
+                    retry_strategy,
+                    config.pool_block,
+                ),
+            )
+
+    def get_pool_stats(self) -> List[Dict[str, Any]]:
+        """Get the statistics of the connection pools of this session.
+
+        Returns:
+            A list of the statistics of each host pool, which contains the host, the max size,
+            the connections in use, the saturation, and the accumulated count of the new
+            connections and requests.
+
+        """
+        stats = []
+        for adapter in self.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                try:
+                    pool = pools[key]
+                except KeyError:
+                    continue
+
+                # The queue holds both the idle connections and the placeholders of the
+                # connections which are not created yet.
+                in_use = pool.pool.maxsize - pool.pool.qsize() if pool.pool else 0
+                stats.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "maxsize": pool.pool.maxsize if pool.pool else 0,
+                        "in_use": in_use,
+                        "saturation": in_use / pool.pool.maxsize if pool.pool else 0.0,
+                        "new_connections": pool.num_connections,
+                        "requests": pool.num_requests,
+                    }
+                )
+
+        return stats
 
     def request(  # type: ignore[override]
         self, method: str, url: str, *args: Any, **kwargs: Any
@@ -145,7 +251,7 @@ class UserSession(Session):
         """
         try:
             response = super().request(method, url, *args, **kwargs)
-            if response.status_code not in (200, 201):
+            if response.status_code not in (200, 201, 206):
                 logger.error(
                     "Unexpected status code(%d)!%s", response.status_code, ResponseLogging(response)
                 )
@@ -166,15 +272,35 @@ class UserSession(Session):
 
 
 SESSIONS: DefaultDict[int, UserSession] = defaultdict(UserSession)
+STORAGE_SESSIONS: DefaultDict[int, UserSession] = defaultdict(lambda: UserSession(STORAGE))
 
 
-def get_session() -> UserSession:
+def get_session(endpoint: str = OPENAPI) -> UserSession:
     """Create and return a session per PID so each sub-processes will use their own session.
 
+    Arguments:
+        endpoint: The endpoint class of the session, "openapi" or "storage".
+            Each endpoint class uses its own session so they do not share the connection pools.
+
     Returns:
         The session corresponding to the process.
     """
-    return SESSIONS[os.getpid()]
+    sessions = STORAGE_SESSIONS if endpoint == STORAGE else SESSIONS
+    return sessions[os.getpid()]
+
+
+def get_pool_stats() -> Dict[str, List[Dict[str, Any]]]:
+    """Get the statistics of the connection pools of the current process.
+
+    Returns:
+        The statistics of the host pools of each endpoint class.
+
+    """
+    pid = os.getpid()
+    return {
+        endpoint: sessions[pid].get_pool_stats() if pid in sessions else []
+        for endpoint, sessions in ((OPENAPI, SESSIONS), (STORAGE, STORAGE_SESSIONS))
+    }
 
 
 class UserResponse:
@@ -221,6 +347,18 @@ class UserResponse:
         except StopIteration:
             return b""
 
+    def readinto(self, buffer: Any) -> int:
+        """Read data from response into the writable buffer without creating bytes objects.
+
+        Arguments:
+            buffer: The writable buffer, like a bytearray or a memoryview.
+
+        Returns:
+            The number of the bytes read, 0 means the end of the response.
+
+        """
+        return self.response.raw.readinto(buffer)  # type: ignore[no-any-return]
+
 
 _T = TypeVar("_T")
 